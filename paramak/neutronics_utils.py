@@ -1,5 +1,4 @@
 
-import math
 from collections import defaultdict
 
 import matplotlib.pyplot as plt
@@ -265,16 +264,11 @@ def get_neutronics_results_from_statepoint_file(
             )
             tally = statepoint.get_tally(name=tally.name)
 
+            # voxels without any scores have nan values which are set to 0
             data = tally.mean[:, 0, 0]
             error = tally.std_dev[:, 0, 0]
-
-            data = data.tolist()
-            error = error.tolist()
-
-            for content in [data, error]:
-                for counter, i in enumerate(content):
-                    if math.isnan(i):
-                        content[counter] = 0.
+            data = np.where(np.isnan(data), 0., data)
+            error = np.where(np.isnan(error), 0., error)
 
             write_3d_mesh_tally_to_vtk(
                 xs=xs,
@@ -127,7 +127,11 @@ class PoloidalSegments(RotateStraightShape):
                 if new_point[0] < 0:
                     m, c = coefficients_of_line_from_points(
                         new_point, self.center_point)
-                    points.append((0, c))
+                    if math.isinf(m):
+                        # a vertical line never reaches the zero line
+                        points.append((0, new_point[1]))
+                    else:
+                        points.append((0, c))
                 else:
                     points.append(new_point)
 
@@ -1,4 +1,6 @@
 
+from functools import lru_cache
+
 import numpy as np
 from paramak import RotateSplineShape
 
@@ -212,19 +214,32 @@ class Plasma(RotateSplineShape):
     def find_points(self):
         """Finds the XZ points that describe the 2D profile of the plasma."""
 
-        # create array of angles theta
-        theta = np.linspace(0, 2 * np.pi, num=self.num_points, endpoint=False)
-
-        # parametric equations for plasma
-        def R(theta):
-            return self.major_radius + self.minor_radius * np.cos(
-                theta + self.triangularity * np.sin(theta)
+        self.points = [
+            list(point) for point in _plasma_profile_points(
+                self.major_radius,
+                self.minor_radius,
+                self.triangularity,
+                self.elongation,
+                self.vertical_displacement,
+                self.num_points,
             )
+        ]
 
-        def Z(theta):
-            return (
-                self.elongation * self.minor_radius * np.sin(theta)
-                + self.vertical_displacement
-            )
 
-        self.points = np.stack((R(theta), Z(theta)), axis=1).tolist()
+@lru_cache(maxsize=64)
+def _plasma_profile_points(
+        major_radius, minor_radius, triangularity, elongation,
+        vertical_displacement, num_points):
+    """Calculates the XZ points of a plasma profile from its shaping
+    parameters. The points are returned as a tuple of tuples so that the
+    cached result can not be modified by the caller."""
+
+    # create array of angles theta
+    theta = np.linspace(0, 2 * np.pi, num=num_points, endpoint=False)
+
+    # parametric equations for plasma
+    R = major_radius + minor_radius * np.cos(
+        theta + triangularity * np.sin(theta))
+    Z = elongation * minor_radius * np.sin(theta) + vertical_displacement
+
+    return tuple(zip(R.tolist(), Z.tolist()))
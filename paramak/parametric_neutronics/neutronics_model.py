@@ -323,8 +323,8 @@ class NeutronicsModel():
         """
 
         if method in ['ppp', 'trelis', 'pymoab']:
-            os.system('rm dagmc_not_watertight.h5m')
-            os.system('rm dagmc.h5m')
+            for filename in ['dagmc_not_watertight.h5m', 'dagmc.h5m']:
+                Path(filename).unlink(missing_ok=True)
         elif method is None and Path('dagmc.h5m').is_file():
             print('Using previously made dagmc.h5m file')
         else:
@@ -615,14 +615,15 @@ class NeutronicsModel():
 
         # Deletes summary.h5m if it already exists.
         # This avoids permission problems when trying to overwrite the file
-        os.system('rm summary.h5')
-        os.system('rm statepoint.' + str(self.simulation_batches) + '.h5')
-
-        # this removes any old file from previous simulations
-        os.system('rm geometry.xml')
-        os.system('rm materials.xml')
-        os.system('rm settings.xml')
-        os.system('rm tallies.xml')
+        # and also removes any old file from previous simulations
+        for filename in [
+                'summary.h5',
+                'statepoint.' + str(self.simulation_batches) + '.h5',
+                'geometry.xml',
+                'materials.xml',
+                'settings.xml',
+                'tallies.xml']:
+            Path(filename).unlink(missing_ok=True)
 
         self.statepoint_filename = self.model.run(
             output=verbose, threads=threads
@@ -633,6 +634,7 @@ class NeutronicsModel():
         )
 
         with open(cell_tally_results_filename, 'w') as outfile:
-            json.dump(self.results, outfile, indent=4, sort_keys=True)
+            outfile.write(
+                json.dumps(self.results, indent=4, sort_keys=True))
 
         return self.statepoint_filename
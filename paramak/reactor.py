@@ -2,6 +2,7 @@
 import json
 from collections.abc import Iterable
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import Optional, Tuple, List
 
 import cadquery as cq
@@ -32,6 +33,8 @@ class Reactor:
         self.tet_meshes = []
         self.graveyard = None
         self.solid = None
+        self.largest_dimension = None
+        self._stl_cache = {}
 
         self.shapes_and_components = shapes_and_components
         self.reactor_hash_value = None
@@ -40,10 +43,10 @@ class Reactor:
 
     @property
     def stp_filenames(self):
-        values = []
-        for shape_or_component in self.shapes_and_components:
-            values.append(shape_or_component.stp_filename)
-        return values
+        return [
+            shape_or_component.stp_filename
+            for shape_or_component in self.shapes_and_components
+        ]
 
     @stp_filenames.setter
     def stp_filenames(self, value):
@@ -51,10 +54,10 @@ class Reactor:
 
     @property
     def stl_filenames(self):
-        values = []
-        for shape_or_component in self.shapes_and_components:
-            values.append(shape_or_component.stl_filename)
-        return values
+        return [
+            shape_or_component.stl_filename
+            for shape_or_component in self.shapes_and_components
+        ]
 
     @stl_filenames.setter
     def stl_filenames(self, value):
@@ -64,11 +67,10 @@ class Reactor:
     def largest_dimension(self):
         """Calculates a bounding box for the Reactor and returns the largest
         absolute value of the largest dimension of the bounding box"""
-        largest_dimension = 0
-        for component in self.shapes_and_components:
-            largest_dimension = max(
-                largest_dimension,
-                component.largest_dimension)
+        largest_dimension = max(
+            (component.largest_dimension
+             for component in self.shapes_and_components),
+            default=0)
         self._largest_dimension = largest_dimension
         return largest_dimension
 
@@ -76,19 +78,29 @@ class Reactor:
     def largest_dimension(self, value):
         self._largest_dimension = value
 
+    @property
+    def graveyard(self):
+        """The graveyard Shape of the Reactor. This is only made (with the
+        default offset) when it is first accessed, as finding the bounding
+        box requires the solid of every shape in the Reactor."""
+        if self._graveyard is None:
+            self.make_graveyard()
+        return self._graveyard
+
+    @graveyard.setter
+    def graveyard(self, value):
+        self._graveyard = value
+
     @property
     def material_tags(self):
         """Returns a set of all the materials_tags used in the Reactor
         (excluding the plasma)"""
-        values = []
-        for shape_or_component in self.shapes_and_components:
-            if not isinstance(
-                shape_or_component,
-                (paramak.Plasma,
-                 paramak.PlasmaFromPoints,
-                 paramak.PlasmaBoundaries)):
-                values.append(shape_or_component.material_tag)
-        return values
+        # PlasmaFromPoints and PlasmaBoundaries both inherit from Plasma
+        return [
+            shape_or_component.material_tag
+            for shape_or_component in self.shapes_and_components
+            if not isinstance(shape_or_component, paramak.Plasma)
+        ]
 
     @material_tags.setter
     def material_tags(self, value):
@@ -96,10 +108,10 @@ class Reactor:
 
     @property
     def tet_meshes(self):
-        values = []
-        for shape_or_component in self.shapes_and_components:
-            values.append(shape_or_component.tet_mesh)
-        return values
+        return [
+            shape_or_component.tet_mesh
+            for shape_or_component in self.shapes_and_components
+        ]
 
     @tet_meshes.setter
     def tet_meshes(self, value):
@@ -112,7 +124,9 @@ class Reactor:
         performed on all the shapes in the reactor. When adding a shape or
         component the stp_filename of the shape or component should be unique"""
         if hasattr(self, "create_solids"):
-            ignored_keys = ["reactor_hash_value"]
+            ignored_keys = [
+                "reactor_hash_value", "_solid", "_solid_inputs",
+                "_stl_cache", "_largest_dimension", "_graveyard"]
             if get_hash(self, ignored_keys) != self.reactor_hash_value:
                 self.create_solids()
                 self.reactor_hash_value = get_hash(self, ignored_keys)
@@ -130,38 +144,50 @@ class Reactor:
 
     @graveyard_offset.setter
     def graveyard_offset(self, value):
-        if value is None:
-            self._graveyard_offset = None
-        elif not isinstance(value, (float, int)):
-            raise TypeError("graveyard_offset must be a number")
-        elif value < 0:
-            raise ValueError("graveyard_offset must be positive")
+        if value is not None:
+            if not isinstance(value, (float, int)):
+                raise TypeError("graveyard_offset must be a number")
+            if value < 0:
+                raise ValueError("graveyard_offset must be positive")
         self._graveyard_offset = value
 
     @property
     def solid(self):
         """This combines all the parametric shapes and compents in the reactor
-        object.
+        object. The combined compound is reused until the solid of one of the
+        shapes or components changes.
         """
 
+        shape_solids = [
+            shape_or_compound.solid
+            for shape_or_compound in self.shapes_and_components]
+
+        if self._solid is not None and \
+                len(shape_solids) == len(self._solid_inputs) and \
+                all(new is old for new, old in zip(
+                    shape_solids, self._solid_inputs)):
+            return self._solid
+
         list_of_cq_vals = []
 
-        for shape_or_compound in self.shapes_and_components:
-            if isinstance(
-                    shape_or_compound.solid,
-                    (cq.occ_impl.shapes.Shape, cq.occ_impl.shapes.Compound)):
-                for solid in shape_or_compound.solid.Solids():
-                    list_of_cq_vals.append(solid)
+        for shape_solid in shape_solids:
+            # cadquery Compounds are also cadquery Shapes
+            if isinstance(shape_solid, cq.occ_impl.shapes.Shape):
+                list_of_cq_vals.extend(shape_solid.Solids())
             else:
-                list_of_cq_vals.append(shape_or_compound.solid.val())
+                list_of_cq_vals.append(shape_solid.val())
 
         compound = cq.Compound.makeCompound(list_of_cq_vals)
 
+        self._solid = compound
+        self._solid_inputs = shape_solids
+
         return compound
 
     @ solid.setter
     def solid(self, value):
         self._solid = value
+        self._solid_inputs = []
 
     def neutronics_description(
             self,
@@ -184,11 +210,7 @@ class Reactor:
 
         for entry in self.shapes_and_components:
 
-            if include_plasma is False and isinstance(
-                entry,
-                (paramak.Plasma,
-                 paramak.PlasmaFromPoints,
-                 paramak.PlasmaBoundaries)) is True:
+            if include_plasma is False and isinstance(entry, paramak.Plasma):
                 continue
 
             if entry.stp_filename is None:
@@ -209,7 +231,6 @@ class Reactor:
         # as it is automatically calculated instead of being added by the user.
         # Also the graveyard must have 'Graveyard' as the material name
         if include_graveyard:
-            self.make_graveyard()
             neutronics_description.append(
                 self.graveyard.neutronics_description())
 
@@ -252,20 +273,49 @@ class Reactor:
 
         path_filename.parents[0].mkdir(parents=True, exist_ok=True)
 
+        neutronics_description = self.neutronics_description(
+            include_plasma=include_plasma,
+            include_graveyard=include_graveyard,
+        )
+
         with open(path_filename, "w") as outfile:
-            json.dump(
-                self.neutronics_description(
-                    include_plasma=include_plasma,
-                    include_graveyard=include_graveyard,
-                ),
-                outfile,
-                indent=4,
-            )
+            outfile.write(json.dumps(neutronics_description, indent=4))
 
         print("saved geometry description to ", path_filename)
 
         return str(path_filename)
 
+    def _filenames_check(self, filenames: List[str], filetype: str):
+        """Checks that the stp or stl filenames of the shapes and components
+        are all set and unique before any files are exported.
+
+        Args:
+            filenames (list): the .stp_filename or .stl_filename properties of
+                the shapes and components
+            filetype (str): the type of file the filenames are for, either
+                'stp' or 'stl'
+
+        Raises:
+            ValueError: if a filename is repeated or is None
+        """
+
+        seen_filenames = set()
+        for filename in filenames:
+            if filename in seen_filenames:
+                raise ValueError(
+                    "Set Reactor already contains a shape or component \
+                             with this {}_filename".format(filetype),
+                    filename,
+                )
+            seen_filenames.add(filename)
+
+        if None in seen_filenames:
+            raise ValueError(
+                "set .{0}_filename property for \
+                             Shapes before using the export_{0} method".format(
+                    filetype)
+            )
+
     def export_stp(
             self,
             output_folder: Optional[str] = "",
@@ -286,20 +336,10 @@ class Reactor:
             list: a list of stp filenames created
         """
 
-        if len(self.stp_filenames) != len(set(self.stp_filenames)):
-            raise ValueError(
-                "Set Reactor already contains a shape or component \
-                         with this stp_filename",
-                self.stp_filenames,
-            )
+        self._filenames_check(self.stp_filenames, "stp")
 
         filenames = []
         for entry in self.shapes_and_components:
-            if entry.stp_filename is None:
-                raise ValueError(
-                    "set .stp_filename property for \
-                                 Shapes before using the export_stp method"
-                )
             filenames.append(
                 str(Path(output_folder) / Path(entry.stp_filename)))
             entry.export_stp(
@@ -322,7 +362,8 @@ class Reactor:
             self,
             output_folder: Optional[str] = "",
             graveyard_offset: Optional[float] = 100,
-            tolerance: Optional[float] = 0.001) -> List[str]:
+            tolerance: Optional[float] = 0.001,
+            angular_tolerance: Optional[float] = 0.1) -> List[str]:
         """Writes stl files (CAD geometry) for each Shape object in the reactor
 
         Args:
@@ -331,34 +372,27 @@ class Reactor:
                 edge of the geometry and inner bounding shell created. Defaults
                 to 100.
             tolerance (float):  the precision of the faceting
+            angular_tolerance (float, optional): the angular tolerance of the
+                faceting, in radians. Defaults to 0.1. Both tolerances are
+                used for every shape and for the graveyard.
 
         Returns:
             list: a list of stl filenames created
         """
 
-        if len(self.stl_filenames) != len(set(self.stl_filenames)):
-            raise ValueError(
-                "Set Reactor already contains a shape or component \
-                         with this stl_filename",
-                self.stl_filenames,
-            )
+        self._filenames_check(self.stl_filenames, "stl")
 
         filenames = []
         for entry in self.shapes_and_components:
             print("entry.stl_filename", entry.stl_filename)
-            if entry.stl_filename is None:
-                raise ValueError(
-                    "set .stl_filename property for \
-                                 Shapes before using the export_stl method"
-                )
-
             filenames.append(
                 str(Path(output_folder) / Path(entry.stl_filename)))
             entry.export_stl(
                 Path(output_folder) /
                 Path(
                     entry.stl_filename),
-                tolerance)
+                tolerance,
+                angular_tolerance)
 
         # creates a graveyard (bounding shell volume) which is needed for
         # neutronics simulations
@@ -366,7 +400,9 @@ class Reactor:
         filenames.append(
             str(Path(output_folder) / Path(self.graveyard.stl_filename)))
         self.graveyard.export_stl(
-            Path(output_folder) / Path(self.graveyard.stl_filename)
+            Path(output_folder) / Path(self.graveyard.stl_filename),
+            tolerance,
+            angular_tolerance
         )
 
         print("exported stl files ", filenames)
@@ -411,32 +447,54 @@ class Reactor:
         surface_id = 1
         volume_id = 1
 
-        for item in self.shapes_and_components:
-
-            item.export_stl(item.stl_filename, tolerance=tolerance)
-            moab_core = add_stl_to_moab_core(
-                moab_core,
-                surface_id,
-                volume_id,
-                item.material_tag,
-                moab_tags,
-                item.stl_filename)
-            volume_id += 1
-            surface_id += 1
-
-        if skip_graveyard is False:
-            self.make_graveyard(graveyard_offset=graveyard_offset)
-            self.graveyard.export_stl(self.graveyard.stl_filename)
-            volume_id = 2
-            surface_id = 2
-            moab_core = add_stl_to_moab_core(
-                moab_core,
-                surface_id,
-                volume_id,
-                self.graveyard.material_tag,
-                moab_tags,
-                self.graveyard.stl_filename
-            )
+        # the stl files are only needed while they are loaded into the moab
+        # core so they are written to a temporary folder, which is held in
+        # memory (tmpfs) when /dev/shm is available
+        shared_memory_folder = Path('/dev/shm')
+        if shared_memory_folder.is_dir():
+            temporary_folder = TemporaryDirectory(dir=shared_memory_folder)
+        else:
+            temporary_folder = TemporaryDirectory()
+
+        # only the facets used by this export are kept for the next one, so
+        # the cache holds at most one stl file per shape in the reactor
+        stl_cache = {}
+
+        with temporary_folder as stl_folder:
+
+            for item in self.shapes_and_components:
+
+                stl_filename = self._export_stl_with_cache(
+                    item,
+                    Path(stl_folder) / Path(item.stl_filename),
+                    tolerance=tolerance,
+                    stl_cache=stl_cache)
+                moab_core = add_stl_to_moab_core(
+                    moab_core,
+                    surface_id,
+                    volume_id,
+                    item.material_tag,
+                    moab_tags,
+                    stl_filename)
+                volume_id += 1
+                surface_id += 1
+
+            if skip_graveyard is False:
+                self.make_graveyard(graveyard_offset=graveyard_offset)
+                stl_filename = self.graveyard.export_stl(
+                    Path(stl_folder) / Path(self.graveyard.stl_filename))
+                volume_id = 2
+                surface_id = 2
+                moab_core = add_stl_to_moab_core(
+                    moab_core,
+                    surface_id,
+                    volume_id,
+                    self.graveyard.material_tag,
+                    moab_tags,
+                    stl_filename
+                )
+
+        self._stl_cache = stl_cache
 
         all_sets = moab_core.get_entities_by_handle(0)
 
@@ -448,6 +506,44 @@ class Reactor:
 
         return str(path_filename)
 
+    def _export_stl_with_cache(
+            self,
+            shape,
+            filename: str,
+            tolerance: float,
+            stl_cache: dict) -> str:
+        """Exports an stl file for a Shape in the reactor. The facets from
+        the previous export_h5m call are looked up by the hash of the shape
+        and the tolerance and are written out again if found, which avoids
+        faceting shapes that have not been edited.
+
+        Args:
+            shape (paramak.Shape): the shape to export
+            filename (str): the filename of the stl file to be exported
+            tolerance (float): the precision of the faceting
+            stl_cache (dict): the facets used in the current export, which
+                the stl contents are added to
+
+        Returns:
+            str: the stl filename created
+        """
+
+        # accessing the solid updates the hash_value of the shape
+        shape.solid
+        key = (shape.hash_value, tolerance)
+        stl_contents = self._stl_cache.get(key)
+
+        if stl_contents is None:
+            stl_filename = shape.export_stl(filename, tolerance=tolerance)
+            stl_contents = Path(stl_filename).read_bytes()
+        else:
+            stl_filename = str(filename)
+            Path(stl_filename).write_bytes(stl_contents)
+
+        stl_cache[key] = stl_contents
+
+        return stl_filename
+
     def export_physical_groups(
             self,
             output_folder: Optional[str] = "") -> List[str]:
@@ -634,6 +730,16 @@ class Reactor:
 
         path_filename.parents[0].mkdir(parents=True, exist_ok=True)
 
+        self._render_2d_image(path_filename, xmin, xmax, ymin, ymax)
+
+        print("\n saved 2d image to ", str(path_filename))
+
+        return str(path_filename)
+
+    def _render_2d_image(self, fileobj, xmin, xmax, ymin, ymax):
+        """Draws a 2D slice of the reactor and saves it as a png to fileobj,
+        which can be a path or a binary file-like object."""
+
         fig, ax = plt.subplots()
 
         # creates indvidual patches for each Shape which are combined together
@@ -645,14 +751,9 @@ class Reactor:
         ax.set(xlim=(xmin, xmax), ylim=(ymin, ymax))
         ax.set_aspect("equal", "box")
 
-        Path(filename).parent.mkdir(parents=True, exist_ok=True)
-        plt.savefig(filename, dpi=100)
+        plt.savefig(fileobj, format="png", dpi=100)
         plt.close()
 
-        print("\n saved 2d image to ", str(path_filename))
-
-        return str(path_filename)
-
     def export_html(
             self,
             filename: Optional[str] = "reactor.html",
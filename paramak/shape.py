@@ -127,13 +127,17 @@ class Shape:
         self.z_max = None
         self.graveyard_offset = None  # set by the make_graveyard method
         self.patch = None
+        self.largest_dimension = None
+        self._largest_dimension_solid = None
 
     @property
     def solid(self):
         """The CadQuery solid of the 3d object. Returns a CadQuery workplane
         or CadQuery Compound"""
 
-        ignored_keys = ["_solid", "_hash_value"]
+        ignored_keys = [
+            "_solid", "_hash_value", "_largest_dimension",
+            "_largest_dimension_solid"]
         if get_hash(self, ignored_keys) != self.hash_value:
             self.create_solid()
             self.hash_value = get_hash(self, ignored_keys)
@@ -149,7 +153,9 @@ class Shape:
         """The CadQuery wire of the 3d object. Returns a CadQuery workplane
         or CadQuery Compound"""
 
-        ignored_keys = ["_wire", "_solid", "_hash_value"]
+        ignored_keys = [
+            "_wire", "_solid", "_hash_value", "_largest_dimension",
+            "_largest_dimension_solid"]
         if get_hash(self, ignored_keys) != self.hash_value:
             self.create_solid()
             self.hash_value = get_hash(self, ignored_keys)
@@ -187,30 +193,27 @@ class Shape:
     @property
     def largest_dimension(self):
         """Calculates a bounding box for the Shape and returns the largest
-        absolute value of the largest dimension of the bounding box"""
-        largest_dimension = 0
-        if isinstance(self.solid, (cq.Compound, cq.occ_impl.shapes.Solid)):
-            for solid in self.solid.Solids():
-                largest_dimension = max(
-                    abs(self.solid.BoundingBox().xmax),
-                    abs(self.solid.BoundingBox().xmin),
-                    abs(self.solid.BoundingBox().ymax),
-                    abs(self.solid.BoundingBox().ymin),
-                    abs(self.solid.BoundingBox().zmax),
-                    abs(self.solid.BoundingBox().zmin),
-                    largest_dimension
-                )
+        absolute value of the largest dimension of the bounding box. The value
+        is reused until the solid is rebuilt."""
+        solid = self.solid
+        if solid is not None and solid is self._largest_dimension_solid:
+            return self._largest_dimension
+
+        if isinstance(solid, (cq.Compound, cq.occ_impl.shapes.Solid)):
+            bounding_box = solid.BoundingBox()
         else:
-            largest_dimension = max(
-                abs(self.solid.val().BoundingBox().xmax),
-                abs(self.solid.val().BoundingBox().xmin),
-                abs(self.solid.val().BoundingBox().ymax),
-                abs(self.solid.val().BoundingBox().ymin),
-                abs(self.solid.val().BoundingBox().zmax),
-                abs(self.solid.val().BoundingBox().zmin),
-                largest_dimension
-            )
+            bounding_box = solid.val().BoundingBox()
+
+        largest_dimension = max(
+            abs(bounding_box.xmax),
+            abs(bounding_box.xmin),
+            abs(bounding_box.ymax),
+            abs(bounding_box.ymin),
+            abs(bounding_box.zmax),
+            abs(bounding_box.zmin)
+        )
         self.largest_dimension = largest_dimension
+        self._largest_dimension_solid = solid
         return largest_dimension
 
     @largest_dimension.setter
@@ -271,44 +274,40 @@ class Shape:
     @property
     def volume(self):
         """Get the total volume of the Shape. Returns a float"""
-        if isinstance(self.solid, cq.Compound):
-            return self.solid.Volume()
+        solid = self.solid
+        if isinstance(solid, cq.Compound):
+            return solid.Volume()
 
-        return self.solid.val().Volume()
+        return solid.val().Volume()
 
     @property
     def volumes(self):
         """Get the volumes of the Shape. Compound shapes provide a seperate
         volume value for each entry. Returns a list of floats"""
-        all_volumes = []
-        if isinstance(self.solid, cq.Compound):
-            for solid in self.solid.Solids():
-                all_volumes.append(solid.Volume())
-            return all_volumes
+        solid = self.solid
+        if isinstance(solid, cq.Compound):
+            return [entry.Volume() for entry in solid.Solids()]
 
-        return [self.solid.val().Volume()]
+        return [solid.val().Volume()]
 
     @property
     def area(self):
         """Get the total surface area of the Shape. Returns a float"""
-        if isinstance(self.solid, cq.Compound):
-            return self.solid.Area()
+        solid = self.solid
+        if isinstance(solid, cq.Compound):
+            return solid.Area()
 
-        return self.solid.val().Area()
+        return solid.val().Area()
 
     @property
     def areas(self):
         """Get the surface areas of the Shape. Compound shapes provide a
         seperate area value for each entry. Returns a list of floats"""
-        all_areas = []
-        if isinstance(self.solid, cq.Compound):
-            for face in self.solid.Faces():
-                all_areas.append(face.Area())
-            return all_areas
+        solid = self.solid
+        if isinstance(solid, cq.Compound):
+            return [face.Area() for face in solid.Faces()]
 
-        for face in self.solid.val().Faces():
-            all_areas.append(face.Area())
-        return all_areas
+        return [face.Area() for face in solid.val().Faces()]
 
     @property
     def hash_value(self):
@@ -401,7 +400,9 @@ class Shape:
         Raises:
             incorrect type: only list of lists or tuples are accepted
         """
-        ignored_keys = ["_points", "_points_hash_value"]
+        ignored_keys = [
+            "_points", "_points_hash_value", "_largest_dimension",
+            "_largest_dimension_solid"]
         if hasattr(self, 'find_points') and \
                 self.points_hash_value != get_hash(self, ignored_keys):
             self.find_points()
@@ -420,7 +421,7 @@ class Shape:
                 values = [(*p, self.connection_type) for p in values]
 
             for value in values:
-                if type(value) not in [list, tuple]:
+                if not isinstance(value, (list, tuple)):
                     msg = "individual points must be a list or a tuple." + \
                         "{} in of type {}".format(value, type(value))
                     raise ValueError(msg)
@@ -573,14 +574,14 @@ class Shape:
                 else:
                     current_points_list.append(XZ_points[i])
                     instructions.append(
-                        {current_linetype: current_points_list})
+                        (current_linetype, current_points_list))
                     current_linetype = connection
                     current_points_list = [XZ_points[i]]
-            instructions.append({current_linetype: current_points_list})
+            instructions.append((current_linetype, current_points_list))
 
-            if list(instructions[-1].values())[0][-1] != XZ_points[0]:
-                keyname = list(instructions[-1].keys())[0]
-                instructions[-1][keyname].append(XZ_points[0])
+            # closes the shape by returning to the first point
+            if instructions[-1][1][-1] != XZ_points[0]:
+                instructions[-1][1].append(XZ_points[0])
 
             if hasattr(self, "path_points"):
 
@@ -594,14 +595,14 @@ class Shape:
                     for point in self.path_points[:-1]:
                         solid = solid.workplane(offset=point[1] * factor).\
                             center(point[0], 0).workplane()
-                        for entry in instructions:
-                            if list(entry.keys())[0] == "spline":
+                        for connection, entry_points in instructions:
+                            if connection == "spline":
                                 solid = solid.spline(
-                                    listOfXYTuple=list(entry.values())[0])
-                            if list(entry.keys())[0] == "straight":
-                                solid = solid.polyline(list(entry.values())[0])
-                            if list(entry.keys())[0] == "circle":
-                                p0, p1, p2 = list(entry.values())[0][:3]
+                                    listOfXYTuple=entry_points)
+                            elif connection == "straight":
+                                solid = solid.polyline(entry_points)
+                            elif connection == "circle":
+                                p0, p1, p2 = entry_points[:3]
                                 solid = solid.moveTo(p0[0], p0[1]).\
                                     threePointArc(p1, p2)
                         solid = solid.close()
@@ -614,16 +615,13 @@ class Shape:
                         factor).center(
                         self.path_points[0][0],
                         0).workplane()
-                    for entry in instructions:
-                        if list(entry.keys())[0] == "spline":
-                            solid = solid.spline(
-                                listOfXYTuple=list(entry.values())[0])
-                        if list(entry.keys())[0] == "straight":
-                            solid = solid.polyline(list(entry.values())[0])
-                        if list(entry.keys())[0] == "circle":
-                            p0 = list(entry.values())[0][0]
-                            p1 = list(entry.values())[0][1]
-                            p2 = list(entry.values())[0][2]
+                    for connection, entry_points in instructions:
+                        if connection == "spline":
+                            solid = solid.spline(listOfXYTuple=entry_points)
+                        elif connection == "straight":
+                            solid = solid.polyline(entry_points)
+                        elif connection == "circle":
+                            p0, p1, p2 = entry_points[:3]
                             solid = solid.moveTo(
                                 p0[0], p0[1]).threePointArc(
                                 p1, p2)
@@ -643,15 +641,13 @@ class Shape:
                     extrusion_offset = -self.extrusion_start_offset
                     solid = solid.workplane(offset=extrusion_offset)
 
-            for entry in instructions:
-                if list(entry.keys())[0] == "spline":
-                    solid = solid.spline(listOfXYTuple=list(entry.values())[0])
-                if list(entry.keys())[0] == "straight":
-                    solid = solid.polyline(list(entry.values())[0])
-                if list(entry.keys())[0] == "circle":
-                    p0 = list(entry.values())[0][0]
-                    p1 = list(entry.values())[0][1]
-                    p2 = list(entry.values())[0][2]
+            for connection, entry_points in instructions:
+                if connection == "spline":
+                    solid = solid.spline(listOfXYTuple=entry_points)
+                elif connection == "straight":
+                    solid = solid.polyline(entry_points)
+                elif connection == "circle":
+                    p0, p1, p2 = entry_points[:3]
                     solid = solid.moveTo(p0[0], p0[1]).threePointArc(p1, p2)
 
         return solid
@@ -839,7 +835,7 @@ class Shape:
         path_filename.parents[0].mkdir(parents=True, exist_ok=True)
         if self.physical_groups is not None:
             with open(filename, "w") as outfile:
-                json.dump(self.physical_groups, outfile, indent=4)
+                outfile.write(json.dumps(self.physical_groups, indent=4))
 
             print("Saved physical_groups description to ", path_filename)
         else:
@@ -1067,24 +1063,24 @@ class Shape:
             facet_splines=True,
             facet_circles=True)
 
-        fpoints = []
-        for edge in edges:
-            for vertice in edge.Vertices():
-                fpoints.append((vertice.X, vertice.Z))
+        fpoints = [
+            (vertice.X, vertice.Z)
+            for edge in edges for vertice in edge.Vertices()]
 
         polygon = Polygon(fpoints, closed=True)
         patches.append(polygon)
 
         patch = PatchCollection(patches)
 
-        if self.color is not None:
-            patch.set_facecolor(self.color)
-            patch.set_color(self.color)
-            patch.color = self.color
-            patch.edgecolor = self.color
+        color = self.color
+        if color is not None:
+            patch.set_facecolor(color)
+            patch.set_color(color)
+            patch.color = color
+            patch.edgecolor = color
             # checks to see if an alpha value is provided in the color
-            if len(self.color) == 4:
-                patch.set_alpha = self.color[-1]
+            if len(color) == 4:
+                patch.set_alpha = color[-1]
         self.patch = patch
         return patch
 
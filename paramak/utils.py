@@ -2,9 +2,9 @@
 import math
 from collections.abc import Iterable
 from hashlib import blake2b
-from os import fdopen, remove
+from os import fdopen, replace
 from pathlib import Path
-from shutil import copymode, move
+from shutil import copymode
 from tempfile import mkstemp
 from typing import List, Tuple, Union
 
@@ -16,6 +16,24 @@ from OCP.GCPnts import GCPnts_QuasiUniformDeflection
 
 import paramak
 
+PointsType = Union[
+    List[Tuple[float, float]], List[Tuple[float, float, float]], np.ndarray]
+
+# functions that project an (N, 3) array of X, Y, Z coordinates onto each
+# view plane
+_VIEW_PLANE_PROJECTIONS = {
+    'XZ': lambda xyz: xyz[:, [0, 2]],
+    'XY': lambda xyz: xyz[:, [0, 1]],
+    'YZ': lambda xyz: xyz[:, [1, 2]],
+    'YX': lambda xyz: xyz[:, [1, 0]],
+    'ZY': lambda xyz: xyz[:, [2, 1]],
+    'ZX': lambda xyz: xyz[:, [2, 0]],
+    'XYZ': lambda xyz: xyz,
+    'RZ': lambda xyz: np.column_stack(
+        (np.hypot(xyz[:, 0], xyz[:, 1]), xyz[:, 2])
+    ),
+}
+
 
 def _transform_curve(edge, tolerance: float = 1e-3):
     """Converts a curved edge into a series of straight lines (facetets) with
@@ -65,11 +83,11 @@ def facet_wire(
     """
     edges = []
 
-    types_to_facet = []
+    types_to_facet = set()
     if facet_splines:
-        types_to_facet.append('BSPLINE')
+        types_to_facet.add('BSPLINE')
     if facet_circles:
-        types_to_facet.append('CIRCLE')
+        types_to_facet.add('CIRCLE')
 
     if isinstance(wire, cq.occ_impl.shapes.Wire):
         # this is for imported stp files
@@ -78,6 +96,10 @@ def facet_wire(
         # this is for cadquery generated solids
         iterable_of_wires = wire.val().Edges()
 
+    if not types_to_facet:
+        # avoids looking up the geometry type of every edge
+        return iterable_of_wires
+
     for edge in iterable_of_wires:
         if edge.geomType() in types_to_facet:
             edges.extend(_transform_curve(edge, tolerance=tolerance).Edges())
@@ -97,13 +119,18 @@ def coefficients_of_line_from_points(
         point_b: point 2 coordinates
 
     Returns:
-        m coefficient and c coefficient
+        m coefficient and c coefficient. For a vertical line (both points
+        having the same x value) m is inf and c is nan.
     """
 
-    points = [point_a, point_b]
-    x_coords, y_coords = zip(*points)
-    coord_array = np.vstack([x_coords, np.ones(len(x_coords))]).T
-    m, c = np.linalg.lstsq(coord_array, y_coords, rcond=None)[0]
+    xa, ya = point_a
+    xb, yb = point_b
+
+    if xa == xb:
+        return math.inf, math.nan
+
+    m = (yb - ya) / (xb - xa)
+    c = ya - m * xa
     return m, c
 
 
@@ -119,15 +146,40 @@ def cut_solid(solid, cutter):
         Shape: The original shape cut with the cutter shape(s)
     """
 
-    # Allows for multiple cuts to be applied
+    # Allows for multiple cuts to be applied in a single boolean operation
     if isinstance(cutter, Iterable):
-        for cutting_solid in cutter:
-            solid = solid.cut(cutting_solid.solid)
+        cutter = list(cutter)
+        if len(cutter) == 1:
+            solid = solid.cut(cutter[0].solid)
+        elif len(cutter) > 1:
+            solid = solid.cut(_compound_of_solids(cutter))
     else:
         solid = solid.cut(cutter.solid)
     return solid
 
 
+def _compound_of_solids(shapes) -> cq.Workplane:
+    """Combines the solids of several Shapes into a single compound so that
+    they can all be used as the tool of one boolean cut.
+
+    Args:
+        shapes (iterable of Shape): the Shapes to combine
+
+    Returns:
+        cadquery.Workplane: a workplane containing the compound
+    """
+
+    cq_shapes = []
+    for shape in shapes:
+        solid = shape.solid
+        if isinstance(solid, cq.Workplane):
+            cq_shapes.extend(solid.vals())
+        else:
+            cq_shapes.append(solid)
+
+    return cq.Workplane().add(cq.Compound.makeCompound(cq_shapes))
+
+
 def diff_between_angles(angle_a: float, angle_b: float) -> float:
     """Calculates the difference between two angles angle_a and angle_b
 
@@ -159,8 +211,7 @@ def distance_between_two_points(point_a: Tuple[float, float],
 
     xa, ya = point_a
     xb, yb = point_b
-    u_vec = [xb - xa, yb - ya]
-    return np.linalg.norm(u_vec)
+    return math.hypot(xb - xa, yb - ya)
 
 
 def extend(point_a: Tuple[float, float], point_b: Tuple[float, float],
@@ -177,11 +228,11 @@ def extend(point_a: Tuple[float, float], point_b: Tuple[float, float],
 
     xa, ya = point_a
     xb, yb = point_b
-    u_vec = [xb - xa, yb - ya]
-    u_vec /= np.linalg.norm(u_vec)
+    dx, dy = xb - xa, yb - ya
+    norm = math.hypot(dx, dy)
 
-    xc = xa + L * u_vec[0]
-    yc = ya + L * u_vec[1]
+    xc = xa + L * dx / norm
+    yc = ya + L * dy / norm
     return xc, yc
 
 
@@ -208,13 +259,13 @@ def find_center_point_of_circle(point_a: Tuple[float, float],
     ) * (point_a[1] - point_b[1])
 
     if abs(det) < 1.0e-6:
-        return (None, np.inf)
+        return (None, math.inf)
 
     # Center of circle
     cx = (bc * (point_b[1] - point3[1]) - cd * (point_a[1] - point_b[1])) / det
     cy = ((point_a[0] - point_b[0]) * cd - (point_b[0] - point3[0]) * bc) / det
 
-    radius = np.sqrt((cx - point_a[0]) ** 2 + (cy - point_a[1]) ** 2)
+    radius = math.hypot(cx - point_a[0], cy - point_a[1])
 
     return (cx, cy), radius
 
@@ -230,7 +281,9 @@ def intersect_solid(solid, intersecter):
         Shape: The original shape cut with the intersecter shape(s)
     """
 
-    # Allows for multiple cuts to be applied
+    # Allows for multiple intersections to be applied. These are applied one
+    # at a time as intersecting with a compound of the intersecters would
+    # intersect with their union instead.
     if isinstance(intersecter, Iterable):
         for intersecting_solid in intersecter:
             solid = solid.intersect(intersecting_solid.solid)
@@ -255,9 +308,11 @@ def rotate(origin: Tuple[float, float], point: Tuple[float, float],
 
     ox, oy = origin
     px, py = point
+    dx, dy = px - ox, py - oy
+    cos_angle, sin_angle = math.cos(angle), math.sin(angle)
 
-    qx = ox + math.cos(angle) * (px - ox) - math.sin(angle) * (py - oy)
-    qy = oy + math.sin(angle) * (px - ox) + math.cos(angle) * (py - oy)
+    qx = ox + cos_angle * dx - sin_angle * dy
+    qy = oy + sin_angle * dx + cos_angle * dy
     return qx, qy
 
 
@@ -307,42 +362,44 @@ def add_thickness(x: List[float], y: List[float], thickness: float,
         (list, list): R and Z lists for outer curve points
     """
 
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
     if dy_dx is None:
         dy_dx = np.diff(y) / np.diff(x)
+    dy_dx = np.asarray(dy_dx, dtype=float)
+    number_of_points = len(dy_dx)
 
-    x_outer, y_outer = [], []
-    for i in range(len(dy_dx)):
-        if dy_dx[i] == float('-inf'):
-            nx, ny = -1, 0
-        elif dy_dx[i] == float('inf'):
-            nx, ny = 1, 0
-        else:
-            nx = -dy_dx[i]
-            ny = 1
-        if i != len(dy_dx) - 1:
-            if x[i] < x[i + 1]:
-                convex = False
-            else:
-                convex = True
-
-        if convex:
-            nx *= -1
-            ny *= -1
-        # normalise normal vector
-        normal_vector_norm = (nx ** 2 + ny ** 2) ** 0.5
-        nx /= normal_vector_norm
-        ny /= normal_vector_norm
-        # calculate outer points
-        val_x_outer = x[i] + thickness * nx
-        val_y_outer = y[i] + thickness * ny
-        x_outer.append(val_x_outer)
-        y_outer.append(val_y_outer)
-
-    return x_outer, y_outer
+    # normal vectors, horizontal where the gradient is infinite
+    infinite_gradient = np.isinf(dy_dx)
+    nx = np.where(infinite_gradient, np.sign(dy_dx), -dy_dx)
+    ny = np.where(infinite_gradient, 0., 1.)
+
+    # the curve is convex wherever x does not increase, the last point keeps
+    # the convexity of the previous point
+    convex = np.diff(x[:number_of_points]) <= 0
+    convex = np.append(convex, convex[-1:])
+
+    nx[convex] *= -1
+    ny[convex] *= -1
+
+    # normalise normal vector
+    normal_vector_norm = np.hypot(nx, ny)
+    nx /= normal_vector_norm
+    ny /= normal_vector_norm
+
+    # calculate outer points
+    x_outer = x[:number_of_points] + thickness * nx
+    y_outer = y[:number_of_points] + thickness * ny
+
+    return x_outer.tolist(), y_outer.tolist()
 
 
 def get_hash(shape, ignored_keys: List) -> str:
-    """Computes a unique hash vaue for the shape.
+    """Computes a unique hash vaue for the shape. The attributes are hashed in
+    a fixed (sorted) order. Numpy arrays are hashed from their data and
+    CadQuery objects (such as the solid and wire created from the attributes)
+    are skipped.
 
     Args:
         shape (list): The paramak.Shape object to find the hash value for.
@@ -350,52 +407,88 @@ def get_hash(shape, ignored_keys: List) -> str:
             when creating the hash.
 
     Returns:
-        (list, list): R and Z lists for outer curve points
+        str: the hash value
     """
 
-    hash_object = blake2b()
-    shape_dict = dict(shape.__dict__)
+    if ignored_keys is None:
+        ignored_keys = []
+
+    hash_object = blake2b(digest_size=16)
 
-    if ignored_keys is not None:
-        for key in ignored_keys:
-            if key in shape_dict.keys():
-                shape_dict[key] = None
+    for key, value in sorted(shape.__dict__.items()):
+        hash_object.update(key.encode("utf-8"))
+
+        if key in ignored_keys or \
+                isinstance(value, (cq.Workplane, cq.occ_impl.shapes.Shape)):
+            continue
+
+        if isinstance(value, np.ndarray):
+            hash_object.update(value.tobytes())
+        else:
+            hash_object.update(repr(value).encode("utf-8"))
 
-    hash_object.update(str(list(shape_dict.values())).encode("utf-8"))
     value = hash_object.hexdigest()
     return value
 
 
-def _replace(filename: str, pattern: str, subst: str) -> None:
+def _replace(
+        filename: str,
+        pattern: str,
+        subst: str,
+        chunk_size: int = 4 << 20) -> None:
     """Opens a file and replaces occurances of a particular string
         (pattern)with a new string (subst) and overwrites the file.
         Used internally within the paramak to ensure .STP files are
-        in units of cm not the default mm.
+        in units of cm not the default mm. The file is streamed in chunks so
+        large files are not held in memory.
     Args:
         filename (str): the filename of the file to edit
         pattern (str): the string that should be removed
         subst (str): the string that should be used in the place of the
             pattern string
+        chunk_size (int, optional): the number of bytes read from the file
+            at a time. Defaults to 4 MiB.
     """
-    # Create temp file
-    file_handle, abs_path = mkstemp()
-    with fdopen(file_handle, 'w') as new_file:
-        with open(filename) as old_file:
-            for line in old_file:
-                new_file.write(line.replace(pattern, subst))
+
+    if not pattern:
+        raise ValueError("pattern must not be an empty string")
+
+    pattern = pattern.encode()
+    subst = subst.encode()
+
+    # Create the temp file next to the original so it can be renamed over it
+    file_handle, abs_path = mkstemp(dir=Path(filename).resolve().parent)
+    with fdopen(file_handle, 'wb') as new_file:
+        with open(filename, 'rb') as old_file:
+            buffer = b''
+            for chunk in iter(lambda: old_file.read(chunk_size), b''):
+                buffer += chunk
+
+                position = 0
+                index = buffer.find(pattern)
+                while index != -1:
+                    new_file.write(buffer[position:index])
+                    new_file.write(subst)
+                    position = index + len(pattern)
+                    index = buffer.find(pattern, position)
+
+                # holds back the end of the buffer as it could be the start
+                # of a match that continues in the next chunk
+                held_back = max(position, len(buffer) - len(pattern) + 1)
+                new_file.write(buffer[position:held_back])
+                buffer = buffer[held_back:]
+
+            new_file.write(buffer)
 
     # Copy the file permissions from the old file to the new file
     copymode(filename, abs_path)
 
-    # Remove original file
-    remove(filename)
-
-    # Move new file
-    move(abs_path, filename)
+    # Replace the original file
+    replace(abs_path, filename)
 
 
 def plotly_trace(
-        points: Union[List[Tuple[float, float]], List[Tuple[float, float, float]]],
+        points: PointsType,
         mode: str = "markers+lines",
         name: str = None,
         color: Union[Tuple[float, float, float], Tuple[float, float, float, float]] = None
@@ -404,8 +497,8 @@ def plotly_trace(
     object. This method is intended for internal use by Shape.export_html.
 
     Args:
-        points: A list of tuples containing the X, Z points of to add to
-            the trace.
+        points: A list of tuples or a numpy array containing the X, Z
+            points of to add to the trace.
         mode: The mode to use for the Plotly.Scatter graph. Options include
             "markers", "lines" and "markers+lines". Defaults to
             "markers+lines"
@@ -429,8 +522,24 @@ def plotly_trace(
     else:
         name = name
 
-    text_values = []
+    if all(len(entry) == 3 for entry in points):
+        # object dtype keeps the numbers alongside any connection type
+        # strings that Shape.points carries as a third entry
+        columns = np.asarray(points, dtype=object).reshape(-1, 3).T
+
+        trace = go.Scatter3d(
+            x=columns[0],
+            y=columns[1],
+            z=columns[2],
+            mode=mode,
+            marker={"size": 3, "color": color},
+            name=name
+        )
+
+        return trace
 
+    # the hover text is only used by the 2d trace
+    text_values = []
     for i, point in enumerate(points):
         text = "point number= {} <br> x={} <br> y= {}".format(
             i, point[0], point[1])
@@ -439,21 +548,13 @@ def plotly_trace(
 
         text_values.append(text)
 
-    if all(len(entry) == 3 for entry in points):
-        trace = go.Scatter3d(
-            x=[row[0] for row in points],
-            y=[row[1] for row in points],
-            z=[row[2] for row in points],
-            mode=mode,
-            marker={"size": 3, "color": color},
-            name=name
-        )
-
-        return trace
+    # a mixture of 2 and 3 entry points is drawn using the x and y values
+    columns = np.asarray(
+        [point[:2] for point in points], dtype=object).reshape(-1, 2).T
 
     trace = go.Scatter(
-        x=[row[0] for row in points],
-        y=[row[1] for row in points],
+        x=columns[0],
+        y=columns[1],
         hoverinfo="text",
         text=text_values,
         mode=mode,
@@ -467,6 +568,7 @@ def plotly_trace(
 def extract_points_from_edges(
     edges: Union[List[cq.Wire], cq.Wire],
     view_plane: str = 'XZ',
+    as_array: bool = False,
 ):
     """Extracts points (coordinates) from a CadQuery Edge, optionally projects
     the points to a plane and returns the points.
@@ -476,6 +578,8 @@ def extract_points_from_edges(
         view_plane: The axis to view the points and faceted edges from. The
             options are 'XZ', 'XY', 'YZ', 'YX', 'ZY', 'ZX', 'RZ' and 'XYZ'.
             Defaults to 'RZ'.
+        as_array: If True the points are returned as a numpy array with a
+            row for every point. Defaults to False.
 
     Returns:
         List of Tuples: A list of tuples with float entries for every point
@@ -486,31 +590,23 @@ def extract_points_from_edges(
     else:
         list_of_edges = [edges]
 
-    points = []
-
-    for edge in list_of_edges:
-        for vertex in edge.Vertices():
-            if view_plane == 'XZ':
-                points.append((vertex.X, vertex.Z))
-            elif view_plane == 'XY':
-                points.append((vertex.X, vertex.Y))
-            elif view_plane == 'YZ':
-                points.append((vertex.Y, vertex.Z))
-            elif view_plane == 'YX':
-                points.append((vertex.Y, vertex.X))
-            elif view_plane == 'ZY':
-                points.append((vertex.Z, vertex.Y))
-            elif view_plane == 'ZX':
-                points.append((vertex.Z, vertex.X))
-            elif view_plane == 'RZ':
-                xy_coord = math.pow(vertex.X, 2) + math.pow(vertex.Y, 2)
-                points.append((math.sqrt(xy_coord), vertex.Z))
-            elif view_plane == 'XYZ':
-                points.append((vertex.X, vertex.Y, vertex.Z))
-            else:
-                raise ValueError('view_plane value of ', view_plane,
-                                 ' is not supported')
-    return points
+    project = _VIEW_PLANE_PROJECTIONS.get(view_plane)
+    if project is None:
+        raise ValueError('view_plane value of ', view_plane,
+                         ' is not supported')
+
+    coordinates = np.array(
+        [(vertex.X, vertex.Y, vertex.Z)
+         for edge in list_of_edges for vertex in edge.Vertices()],
+        dtype=float
+    ).reshape(-1, 3)
+
+    points = project(coordinates)
+
+    if as_array:
+        return points
+
+    return [tuple(point) for point in points.tolist()]
 
 
 def load_stp_file(
@@ -571,6 +667,10 @@ def export_wire_to_html(
         plotly.Figure(): figure object
     """
 
+    if view_plane not in _VIEW_PLANE_PROJECTIONS:
+        raise ValueError('view_plane value of ', view_plane,
+                         ' is not supported')
+
     Path(filename).parents[0].mkdir(parents=True, exist_ok=True)
 
     path_filename = Path(filename)
@@ -605,6 +705,9 @@ def export_wire_to_html(
     else:
         list_of_wires = [wires]
 
+    line_traces = []
+    marker_traces = []
+
     for counter, wire in enumerate(list_of_wires):
 
         edges = facet_wire(
@@ -616,10 +719,11 @@ def export_wire_to_html(
 
         points = paramak.utils.extract_points_from_edges(
             edges=edges,
-            view_plane=view_plane
+            view_plane=view_plane,
+            as_array=True
         )
 
-        fig.add_trace(
+        line_traces.append(
             plotly_trace(
                 points=points,
                 mode="markers+lines",
@@ -627,8 +731,6 @@ def export_wire_to_html(
             )
         )
 
-    for counter, wire in enumerate(list_of_wires):
-
         if isinstance(wire, cq.occ_impl.shapes.Wire):
             # this is for imported stp files
             edges = wire.Edges()
@@ -638,15 +740,20 @@ def export_wire_to_html(
 
         points = paramak.utils.extract_points_from_edges(
             edges=edges,
-            view_plane=view_plane)
+            view_plane=view_plane,
+            as_array=True)
 
-        fig.add_trace(plotly_trace(
-            points=points,
-            mode="markers",
-            name='points on wire ' + str(counter)
-        )
+        marker_traces.append(
+            plotly_trace(
+                points=points,
+                mode="markers",
+                name='points on wire ' + str(counter)
+            )
         )
 
+    # all the edge traces are added before the point traces
+    fig.add_traces(line_traces + marker_traces)
+
     fig.write_html(str(path_filename))
 
     print("Exported html graph to ", path_filename)
@@ -682,15 +789,16 @@ class FaceAreaSelector(cq.Selector):
                 the specified tolerance.
         """
 
-        new_obj_list = []
-        for obj in object_list:
-            face_area = obj.Area()
+        face_areas = np.fromiter(
+            (obj.Area() for obj in object_list),
+            dtype=float,
+            count=len(object_list)
+        )
 
-            # Only return faces that meet the requirements
-            if face_area > self.area - self.tolerance and face_area < self.area + self.tolerance:
-                new_obj_list.append(obj)
+        # Only return faces that meet the requirements
+        in_range = np.abs(face_areas - self.area) < self.tolerance
 
-        return new_obj_list
+        return [obj for obj, keep in zip(object_list, in_range) if keep]
 
 
 class EdgeLengthSelector(cq.Selector):
@@ -722,15 +830,13 @@ class EdgeLengthSelector(cq.Selector):
                 within the specified tolerance.
         """
 
-        new_obj_list = []
-        print('filleting edge#')
-        for obj in object_list:
-
-            edge_len = obj.Length()
+        edge_lengths = np.fromiter(
+            (obj.Length() for obj in object_list),
+            dtype=float,
+            count=len(object_list)
+        )
 
-            # Only return edges that meet our requirements
-            if edge_len > self.length - self.tolerance and edge_len < self.length + self.tolerance:
+        # Only return edges that meet our requirements
+        in_range = np.abs(edge_lengths - self.length) < self.tolerance
 
-                new_obj_list.append(obj)
-        print('length(new_obj_list)', len(new_obj_list))
-        return new_obj_list
+        return [obj for obj, keep in zip(object_list, in_range) if keep]
@@ -0,0 +1,15 @@
+
+import os
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "slow: tests that build and export CadQuery solids, deselect with "
+        "pytest -m \"not slow\"")
+
+    # shares the cores between pytest-xdist workers so that the OpenMP
+    # threads of concurrent openmc simulations do not oversubscribe the cpu
+    workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+    os.environ.setdefault(
+        "OMP_NUM_THREADS", str(max(1, (os.cpu_count() or 1) // workers)))
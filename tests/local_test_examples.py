@@ -3,6 +3,7 @@ import json
 import os
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 import paramak
 import pytest
@@ -33,11 +34,11 @@ class TestLocalExamples(unittest.TestCase):
             "output_collarge/paramak_array2.svg",
         ]
         for output_filename in output_filenames:
-            os.system("rm " + output_filename)
+            Path(output_filename).unlink(missing_ok=True)
         os.system("python make_collarge.py")
         for output_filename in output_filenames:
             assert Path(output_filename).exists()
-            os.system("rm " + output_filename)
+            Path(output_filename).unlink(missing_ok=True)
 
     def test_make_paramak_animation(self):
         """ Runs the example and checks the output files are produced"""
@@ -54,11 +55,11 @@ class TestLocalExamples(unittest.TestCase):
             "3d.gif",
         ]
         for output_filename in output_filenames:
-            os.system("rm " + output_filename)
+            Path(output_filename).unlink(missing_ok=True)
         os.system("python make_animation.py -n 3")
         for output_filename in output_filenames:
             assert Path(output_filename).exists()
-            os.system("rm " + output_filename)
+            Path(output_filename).unlink(missing_ok=True)
 
     def test_export_3d_image(self):
         """checks that export_3d_image() exports png files with the correct suffix"""
@@ -67,25 +68,22 @@ class TestLocalExamples(unittest.TestCase):
             points=[(0, 0), (0, 20), (20, 20), (20, 0)]
         )
         test_shape.rotation_angle = 360
-        os.system("rm filename.png")
-        test_shape.export_3d_image("filename")
-        assert Path("filename.png").exists() is True
-        os.system("rm filename.png")
-        test_shape.export_3d_image("filename.png")
-        assert Path("filename.png").exists() is True
-        os.system("rm filename.png")
+        for filename in ["filename", "filename.png"]:
+            with TemporaryDirectory() as tmp_dir:
+                test_shape.export_3d_image(Path(tmp_dir) / filename)
+                assert (Path(tmp_dir) / "filename.png").exists() is True
 
     def test_neutronics_cell_tally(self):
         """ Runs the neutronics example and checks the TBR"""
         os.chdir(Path(cwd))
         os.chdir(Path("examples/neutronics"))
         output_filename = "simulation_result.json"
-        os.system("rm " + output_filename)
+        Path(output_filename).unlink(missing_ok=True)
         os.system("python make_simple_neutronics_model.py")
         with open(output_filename) as json_file:
             data = json.load(json_file)
         assert data["TBR"] == pytest.approx(0.456, abs=0.01)
-        os.system("rm " + output_filename)
+        Path(output_filename).unlink(missing_ok=True)
 
 
 if __name__ == "__main__":
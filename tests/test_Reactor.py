@@ -1,31 +1,51 @@
 
+import io
 import json
-import os
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 import cadquery as cq
 import paramak
 import pytest
 
+# the shapes are built from fresh lists of these points as the points
+# setter only accepts lists and may keep a reference to the one it is given
+TRIANGLE_POINTS = ((0, 0), (0, 20), (20, 20))
+MIXED_TRIANGLE_POINTS = (
+    (0, 0, "straight"), (0, 20, "straight"), (20, 20, "straight"))
+CIRCLE_POINTS = ((20, 20),)
+
 
 class TestReactor(unittest.TestCase):
 
-    def setUp(self):
-        test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)])
+    @classmethod
+    def setUpClass(cls):
+        # the neutronics description, image and html export tests only read
+        # the attributes and geometry of these shapes so they are shared
+        # between them and their solids are only built once
+        cls.test_shape = paramak.RotateStraightShape(
+            points=list(TRIANGLE_POINTS),
+            rotation_angle=360,
+            material_tag="test_material",
+            stp_filename="test.stp",
+            tet_mesh="size 60",
+        )
 
-        self.test_reactor = paramak.Reactor([test_shape])
+        cls.test_plasma = paramak.Plasma(
+            major_radius=500,
+            minor_radius=100,
+            stp_filename="plasma.stp",
+            material_tag="DT_plasma",
+        )
 
     def test_adding_shape_with_material_tag_to_reactor(self):
         """Checks that a shape object can be added to a Reactor object with
         the correct material tag property."""
 
         test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)], material_tag="mat1"
+            points=list(TRIANGLE_POINTS), material_tag="mat1"
         )
-        test_shape.rotation_angle = 360
-        test_shape.create_solid()
         test_reactor = paramak.Reactor([test_shape])
         assert len(test_reactor.material_tags) == 1
         assert test_reactor.material_tags[0] == "mat1"
@@ -35,13 +55,11 @@ class TestReactor(unittest.TestCase):
         with the correct material tag properties."""
 
         test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)], material_tag="mat1"
+            points=list(TRIANGLE_POINTS), material_tag="mat1"
         )
         test_shape2 = paramak.RotateSplineShape(
-            points=[(0, 0), (0, 20), (20, 20)], material_tag="mat2"
+            points=list(TRIANGLE_POINTS), material_tag="mat2"
         )
-        test_shape.rotation_angle = 360
-        test_shape.create_solid()
         test_reactor = paramak.Reactor([test_shape, test_shape2])
         assert len(test_reactor.material_tags) == 2
         assert "mat1" in test_reactor.material_tags
@@ -52,10 +70,8 @@ class TestReactor(unittest.TestCase):
         correct stp filename property."""
 
         test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)], stp_filename="filename.stp"
+            points=list(TRIANGLE_POINTS), stp_filename="filename.stp"
         )
-        test_shape.rotation_angle = 360
-        test_shape.create_solid()
         test_reactor = paramak.Reactor([test_shape])
         assert len(test_reactor.stp_filenames) == 1
         assert test_reactor.stp_filenames[0] == "filename.stp"
@@ -65,760 +81,549 @@ class TestReactor(unittest.TestCase):
         with the correct stp filename properties."""
 
         test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)], stp_filename="filename.stp"
+            points=list(TRIANGLE_POINTS), stp_filename="filename.stp"
         )
         test_shape2 = paramak.RotateSplineShape(
-            points=[(0, 0), (0, 20), (20, 20)], stp_filename="filename2.stp"
+            points=list(TRIANGLE_POINTS), stp_filename="filename2.stp"
         )
-        test_shape.rotation_angle = 360
-        test_shape.create_solid()
         test_reactor = paramak.Reactor([test_shape, test_shape2])
         assert len(test_reactor.stp_filenames) == 2
         assert test_reactor.stp_filenames[0] == "filename.stp"
         assert test_reactor.stp_filenames[1] == "filename2.stp"
 
     def test_adding_shape_with_duplicate_stp_filename_to_reactor(self):
-        """Adds shapes to a Reactor object to check errors are raised
-        correctly."""
-
-        def test_stp_filename_duplication():
-            """Checks ValueError is raised when shapes with the same stp
-            filenames are added to a reactor object"""
+        """Checks ValueError is raised when shapes with the same stp filenames
+        are added to a reactor object"""
 
-            test_shape_1 = paramak.RotateStraightShape(
-                points=[(0, 0), (0, 20), (20, 20)], stp_filename="filename.stp"
-            )
-            test_shape_2 = paramak.RotateSplineShape(
-                points=[(0, 0), (0, 20), (20, 20)], stp_filename="filename.stp"
-            )
-            test_shape_1.rotation_angle = 90
-            my_reactor = paramak.Reactor([test_shape_1, test_shape_2])
-            my_reactor.export_stp()
+        test_shape_1 = paramak.RotateStraightShape(
+            points=list(TRIANGLE_POINTS), stp_filename="filename.stp"
+        )
+        test_shape_2 = paramak.RotateSplineShape(
+            points=list(TRIANGLE_POINTS), stp_filename="filename.stp"
+        )
+        test_shape_1.rotation_angle = 90
+        my_reactor = paramak.Reactor([test_shape_1, test_shape_2])
 
-        self.assertRaises(ValueError, test_stp_filename_duplication)
+        with TemporaryDirectory() as tmp_dir:
+            with self.assertRaises(ValueError):
+                my_reactor.export_stp(output_folder=tmp_dir)
 
     def test_adding_shape_with_None_stp_filename_to_reactor(self):
-        """adds shapes to a Reactor object to check errors are raised correctly"""
-
-        def test_stp_filename_None():
-            """checks ValueError is raised when RotateStraightShapes with duplicate
-            stp filenames are added"""
+        """Checks ValueError is raised when shapes with None as the stp
+        filename are added to a reactor object"""
 
-            test_shape = paramak.RotateStraightShape(
-                points=[(0, 0), (0, 20), (20, 20)], stp_filename="filename.stp"
-            )
-            test_shape2 = paramak.RotateSplineShape(
-                points=[(0, 0), (0, 20), (20, 20)], stp_filename=None
-            )
-            test_shape.create_solid()
-            my_reactor = paramak.Reactor([test_shape, test_shape2])
-            my_reactor.export_stp()
+        test_shape = paramak.RotateStraightShape(
+            points=list(TRIANGLE_POINTS), stp_filename="filename.stp"
+        )
+        test_shape2 = paramak.RotateSplineShape(
+            points=list(TRIANGLE_POINTS), stp_filename=None
+        )
+        my_reactor = paramak.Reactor([test_shape, test_shape2])
 
-        self.assertRaises(ValueError, test_stp_filename_None)
+        with TemporaryDirectory() as tmp_dir:
+            with self.assertRaises(ValueError):
+                my_reactor.export_stp(output_folder=tmp_dir)
 
     def test_adding_shape_with_duplicate_stl_filename_to_reactor(self):
-        """Adds shapes to a Reactor object to checks errors are raised
-        correctly"""
-
-        def test_stl_filename_duplication():
-            """Checks ValueError is raised when shapes with the same stl
-            filenames are added to a reactor object"""
+        """Checks ValueError is raised when shapes with the same stl filenames
+        are added to a reactor object"""
 
-            test_shape_1 = paramak.RotateStraightShape(
-                points=[(0, 0), (0, 20), (20, 20)], stl_filename="filename.stl"
-            )
-            test_shape_2 = paramak.RotateSplineShape(
-                points=[(0, 0), (0, 20), (20, 20)], stl_filename="filename.stl"
-            )
-            test_shape_1.rotation_angle = 90
-            my_reactor = paramak.Reactor([test_shape_1, test_shape_2])
-            my_reactor.export_stl()
+        test_shape_1 = paramak.RotateStraightShape(
+            points=list(TRIANGLE_POINTS), stl_filename="filename.stl"
+        )
+        test_shape_2 = paramak.RotateSplineShape(
+            points=list(TRIANGLE_POINTS), stl_filename="filename.stl"
+        )
+        test_shape_1.rotation_angle = 90
+        my_reactor = paramak.Reactor([test_shape_1, test_shape_2])
 
-        self.assertRaises(ValueError, test_stl_filename_duplication)
+        with TemporaryDirectory() as tmp_dir:
+            with self.assertRaises(ValueError):
+                my_reactor.export_stl(output_folder=tmp_dir)
 
     def test_adding_shape_with_the_same_default_stl_filename_to_reactor(self):
-        """Adds shapes to a Reactor object to check errors are raised
-        correctly."""
-
-        def test_stl_filename_duplication_rotate_straight():
-            """checks ValueError is raised when RotateStraightShapes with
-            duplicate stl filenames (defaults) are added"""
-
-            test_shape = paramak.RotateStraightShape(
-                points=[(0, 0), (0, 20), (20, 20)])
-            test_shape2 = paramak.RotateStraightShape(
-                points=[(0, 0), (0, 20), (20, 20)])
-            test_shape.rotation_angle = 360
-            test_shape.create_solid()
-            my_reactor = paramak.Reactor([test_shape, test_shape2])
-            my_reactor.export_stl()
-
-        self.assertRaises(
-            ValueError,
-            test_stl_filename_duplication_rotate_straight)
-
-        def test_stl_filename_duplication_rotate_spline():
-            """Checks ValueError is raised when RotateSplineShapes with
-            duplicate stl filenames are added."""
-
-            test_shape = paramak.RotateSplineShape(
-                points=[(0, 0), (0, 20), (20, 20)], stl_filename="filename.stl"
-            )
-            test_shape2 = paramak.RotateSplineShape(
-                points=[(0, 0), (0, 20), (20, 20)], stl_filename="filename.stl"
-            )
-            test_shape.rotation_angle = 360
-            test_shape.create_solid()
-            my_reactor = paramak.Reactor([test_shape, test_shape2])
-            my_reactor.export_stl()
-
-        self.assertRaises(
-            ValueError,
-            test_stl_filename_duplication_rotate_spline)
-
-        def test_stl_filename_duplication_rotate_mixed():
-            """Checks ValueError is raised when RotateMixedShapes with
-            duplicate stl filenames are added."""
-
-            test_shape = paramak.RotateMixedShape(
-                points=[(0, 0, "straight"), (0, 20, "straight"), (20, 20, "straight")],
-                stl_filename="filename.stl",
-            )
-            test_shape2 = paramak.RotateMixedShape(
-                points=[(0, 0, "straight"), (0, 20, "straight"), (20, 20, "straight")],
-                stl_filename="filename.stl",
-            )
-            test_shape.rotation_angle = 360
-            test_shape.create_solid()
-            my_reactor = paramak.Reactor([test_shape, test_shape2])
-            my_reactor.export_stl()
-
-        self.assertRaises(
-            ValueError,
-            test_stl_filename_duplication_rotate_mixed)
-
-        def test_stl_filename_duplication_Rotate_Circle():
-            """Checks ValueError is raised when RotateCircleShapes with
-            duplicate stl filenames are added."""
-
-            test_shape = paramak.RotateCircleShape(
-                points=[(20, 20)],
-                radius=10,
-                rotation_angle=180,
-                stl_filename="filename.stl",
-            )
-            test_shape2 = paramak.RotateCircleShape(
-                points=[(20, 20)],
-                radius=10,
-                rotation_angle=180,
-                stl_filename="filename.stl",
-            )
-            test_shape.rotation_angle = 360
-            test_shape.create_solid()
-            my_reactor = paramak.Reactor([test_shape, test_shape2])
-            my_reactor.export_stl()
-
-        self.assertRaises(
-            ValueError,
-            test_stl_filename_duplication_Rotate_Circle)
-
-        def test_stl_filename_duplication_Extrude_straight():
-            """Checks ValueError is raised when ExtrudeStraightShapes with
-            duplicate stl filenames are added."""
-
-            test_shape = paramak.ExtrudeStraightShape(
-                points=[(0, 0), (0, 20), (20, 20)],
-                distance=10,
-                stl_filename="filename.stl",
-            )
-            test_shape2 = paramak.ExtrudeStraightShape(
-                points=[(0, 0), (0, 20), (20, 20)],
-                distance=10,
-                stl_filename="filename.stl",
-            )
-            test_shape.rotation_angle = 360
-            test_shape.create_solid()
-            my_reactor = paramak.Reactor([test_shape, test_shape2])
-            my_reactor.export_stl()
-
-        self.assertRaises(
-            ValueError,
-            test_stl_filename_duplication_Extrude_straight)
-
-        def test_stl_filename_duplication_Extrude_spline():
-            """Checks ValueError is raised when ExtrudeSplineShapes with
-            duplicate stl filenames are added."""
-
-            test_shape = paramak.ExtrudeSplineShape(
-                points=[(0, 0), (0, 20), (20, 20)],
-                distance=10,
-                stl_filename="filename.stl",
-            )
-            test_shape2 = paramak.ExtrudeSplineShape(
-                points=[(0, 0), (0, 20), (20, 20)],
-                distance=10,
-                stl_filename="filename.stl",
-            )
-            test_shape.rotation_angle = 360
-            test_shape.create_solid()
-            my_reactor = paramak.Reactor([test_shape, test_shape2])
-            my_reactor.export_stl()
-
-        self.assertRaises(
-            ValueError,
-            test_stl_filename_duplication_Extrude_spline)
-
-        def test_stl_filename_duplication_Extrude_mixed():
-            """checks ValueError is raised when ExtrudeMixedShapes with duplicate
-            stl filenames are added"""
-
-            test_shape = paramak.ExtrudeMixedShape(
-                points=[(0, 0, "straight"), (0, 20, "straight"), (20, 20, "straight")],
-                distance=10,
-                stl_filename="filename.stl",
-            )
-            test_shape2 = paramak.ExtrudeMixedShape(
-                points=[(0, 0, "straight"), (0, 20, "straight"), (20, 20, "straight")],
-                distance=10,
-                stl_filename="filename.stl",
-            )
-            test_shape.rotation_angle = 360
-            test_shape.create_solid()
-            my_reactor = paramak.Reactor([test_shape, test_shape2])
-            my_reactor.export_stl()
-
-        self.assertRaises(
-            ValueError,
-            test_stl_filename_duplication_Extrude_mixed)
-
-        def test_stl_filename_duplication_Extrude_Circle():
-            """checks ValueError is raised when ExtrudeCircleShapes with duplicate
-            stl filenames are added"""
-
-            test_shape = paramak.ExtrudeCircleShape(
-                points=[(20, 20)], radius=10, distance=10, stl_filename="filename.stl"
-            )
-            test_shape2 = paramak.ExtrudeCircleShape(
-                points=[(20, 20)], radius=10, distance=10, stl_filename="filename.stl"
-            )
-            test_shape.rotation_angle = 360
-            test_shape.create_solid()
-            my_reactor = paramak.Reactor([test_shape, test_shape2])
-            my_reactor.export_stl()
-
-        self.assertRaises(
-            ValueError,
-            test_stl_filename_duplication_Extrude_Circle)
-
-        def test_stl_filename_None():
-            test_shape = paramak.ExtrudeCircleShape(
-                points=[(20, 20)], radius=10, distance=10, stl_filename=None
-            )
-            my_reactor = paramak.Reactor([test_shape])
-            my_reactor.export_stl()
-
-        self.assertRaises(
-            ValueError,
-            test_stl_filename_None)
-
-    def test_reactor_creation_with_default_properties(self):
-        """creates a Reactor object and checks that it has no default properties"""
-
-        test_reactor = paramak.Reactor([])
+        """Adds pairs of shapes with the same stl filename to a Reactor object
+        and checks that a ValueError is raised for each type of shape."""
+
+        shape_factories = {
+            "RotateStraightShape": lambda: paramak.RotateStraightShape(
+                points=list(TRIANGLE_POINTS)),
+            "RotateSplineShape": lambda: paramak.RotateSplineShape(
+                points=list(TRIANGLE_POINTS), stl_filename="filename.stl"),
+            "RotateMixedShape": lambda: paramak.RotateMixedShape(
+                points=list(MIXED_TRIANGLE_POINTS),
+                stl_filename="filename.stl"),
+            "RotateCircleShape": lambda: paramak.RotateCircleShape(
+                points=list(CIRCLE_POINTS), radius=10, rotation_angle=180,
+                stl_filename="filename.stl"),
+            "ExtrudeStraightShape": lambda: paramak.ExtrudeStraightShape(
+                points=list(TRIANGLE_POINTS), distance=10,
+                stl_filename="filename.stl"),
+            "ExtrudeSplineShape": lambda: paramak.ExtrudeSplineShape(
+                points=list(TRIANGLE_POINTS), distance=10,
+                stl_filename="filename.stl"),
+            "ExtrudeMixedShape": lambda: paramak.ExtrudeMixedShape(
+                points=list(MIXED_TRIANGLE_POINTS), distance=10,
+                stl_filename="filename.stl"),
+            "ExtrudeCircleShape": lambda: paramak.ExtrudeCircleShape(
+                points=list(CIRCLE_POINTS), radius=10, distance=10,
+                stl_filename="filename.stl"),
+        }
+
+        for shape_type, make_shape in shape_factories.items():
+            with self.subTest(shape_type=shape_type):
+                my_reactor = paramak.Reactor([make_shape(), make_shape()])
+                with TemporaryDirectory() as tmp_dir:
+                    with self.assertRaises(ValueError):
+                        my_reactor.export_stl(output_folder=tmp_dir)
+
+        # checks ValueError is raised when a shape without an stl filename is
+        # added to a reactor object
+        test_shape = paramak.ExtrudeCircleShape(
+            points=list(CIRCLE_POINTS), radius=10, distance=10,
+            stl_filename=None
+        )
+        my_reactor = paramak.Reactor([test_shape])
 
-        assert test_reactor is not None
+        with TemporaryDirectory() as tmp_dir:
+            with self.assertRaises(ValueError):
+                my_reactor.export_stl(output_folder=tmp_dir)
 
     def test_adding_component_to_reactor(self):
         """creates a Reactor object and checks that shapes can be added to it"""
 
         test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)])
-        test_shape.rotation_angle = 360
-        test_shape.create_solid()
+            points=list(TRIANGLE_POINTS))
         test_reactor = paramak.Reactor([])
         assert len(test_reactor.shapes_and_components) == 0
         test_reactor = paramak.Reactor([test_shape])
         assert len(test_reactor.shapes_and_components) == 1
 
-    def test_Graveyard_exists(self):
-        """creates a Reactor object with one shape and checks that a graveyard
-        can be produced using the make_graveyard method"""
+    @pytest.mark.slow
+    def test_make_graveyard(self):
+        """Creates a Reactor object with one shape and checks that a graveyard
+        can be produced using the make_graveyard method, that its size follows
+        the graveyard_offset and that it can be made when the solid attribute
+        of the shape is None."""
 
         test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)])
-        test_shape.rotation_angle = 360
-        test_shape.create_solid()
+            points=list(TRIANGLE_POINTS))
         test_reactor = paramak.Reactor([test_shape])
-        test_reactor.make_graveyard()
 
+        test_reactor.make_graveyard()
         assert isinstance(test_reactor.graveyard, paramak.Shape)
+        assert test_reactor.graveyard_offset == 100
+        # the graveyard is a HollowCube so its size is compared using the
+        # inner length rather than the volume of the solid
+        graveyard_length_1 = test_reactor.graveyard.length
+        assert graveyard_length_1 == pytest.approx(
+            test_reactor.largest_dimension * 2 + 100 * 2)
+
+        test_reactor.make_graveyard(graveyard_offset=50)
+        assert test_reactor.graveyard.length < graveyard_length_1
+        graveyard_length_2 = test_reactor.graveyard.length
+
+        test_reactor.make_graveyard(graveyard_offset=200)
+        assert test_reactor.graveyard.length > graveyard_length_1
+        assert test_reactor.graveyard.length > graveyard_length_2
+        graveyard_length_3 = test_reactor.graveyard.length
+
+        with TemporaryDirectory() as tmp_dir:
+            filename = test_reactor.export_graveyard(
+                graveyard_offset=300,
+                filename=Path(tmp_dir) / "Graveyard.stp")
+            assert Path(filename).exists() is True
+        assert test_reactor.graveyard_offset == 300
+        assert test_reactor.graveyard.length > graveyard_length_3
 
-    def test_Graveyard_exists_solid_is_None(self):
-        """creates a Reactor object with one shape and checks that a graveyard
-        can be produced using the make_graveyard method when the solid
-        attribute of the shape is None"""
-
-        test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)])
-        test_shape.rotation_angle = 360
-        test_shape.create_solid()
-        test_reactor = paramak.Reactor([test_shape])
         test_reactor.shapes_and_components[0].solid = None
         test_reactor.make_graveyard()
-
         assert isinstance(test_reactor.graveyard, paramak.Shape)
 
-    def test_export_graveyard(self):
-        """creates a Reactor object with one shape and checks that a graveyard
-        can be exported to a specified location using the make_graveyard method"""
+    def test_graveyard_made_on_first_access(self):
+        """Checks that a graveyard is not made when the Reactor is created and
+        that it is made with the default offset when first accessed."""
 
         test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)])
-        test_shape.rotation_angle = 360
-        os.system("rm my_graveyard.stp")
-        os.system("rm Graveyard.stp")
-        test_shape.stp_filename = "test_shape.stp"
+            points=list(TRIANGLE_POINTS))
         test_reactor = paramak.Reactor([test_shape])
 
-        test_reactor.export_graveyard()
-        test_reactor.export_graveyard(filename="my_graveyard.stp")
-
-        for filepath in ["Graveyard.stp", "my_graveyard.stp"]:
-            assert Path(filepath).exists() is True
-            os.system("rm " + filepath)
-
-        assert test_reactor.graveyard is not None
-        assert test_reactor.graveyard.__class__.__name__ == "HollowCube"
+        assert test_reactor._graveyard is None
+        assert test_reactor.graveyard_offset is None
 
-    def test_export_graveyard_offset(self):
-        """checks that the graveyard can be exported with the correct default parameters
-        and that these parameters can be changed"""
-
-        test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)])
-        os.system("rm Graveyard.stp")
-        test_reactor = paramak.Reactor([test_shape])
-        test_reactor.export_graveyard()
+        assert isinstance(test_reactor.graveyard, paramak.HollowCube)
         assert test_reactor.graveyard_offset == 100
-        graveyard_volume_1 = test_reactor.graveyard.volume
 
-        test_reactor.export_graveyard(graveyard_offset=50)
-        assert test_reactor.graveyard.volume < graveyard_volume_1
-        graveyard_volume_2 = test_reactor.graveyard.volume
-
-        test_reactor.export_graveyard(graveyard_offset=200)
-        assert test_reactor.graveyard.volume > graveyard_volume_1
-        assert test_reactor.graveyard.volume > graveyard_volume_2
-
-    def test_exported_stp_files_exist(self):
-        """creates a Reactor object with one shape and checks that a stp file
-        of the reactor can be exported to a specified location using the export_stp
-        method"""
+    def test_neutronics_description(self):
+        """Creates reactor objects to check errors are raised correctly when
+        exporting the neutronics description."""
 
+        # checks ValueError is raised when the neutronics description is
+        # exported without material_tag
         test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)])
+            points=list(TRIANGLE_POINTS))
         test_shape.rotation_angle = 360
-        os.system("rm test_reactor/test_shape.stp")
-        os.system("rm test_reactor/Graveyard.stp")
-        test_shape.stp_filename = "test_shape.stp"
+        test_shape.stp_filename = "test.stp"
         test_reactor = paramak.Reactor([test_shape])
 
-        test_reactor.export_stp(output_folder="test_reactor")
-
-        for filepath in [
-            "test_reactor/test_shape.stp",
-                "test_reactor/Graveyard.stp"]:
-            assert Path(filepath).exists() is True
-            os.system("rm " + filepath)
-
-    def test_exported_stl_files_exist(self):
-        """creates a Reactor object with one shape and checks that a stl file
-        of the reactor can be exported to a specified location using the
-        export_stl method"""
+        with self.assertRaises(ValueError):
+            test_reactor.neutronics_description()
 
+        # checks ValueError is raised when the neutronics description is
+        # exported without stp_filename
         test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)])
+            points=list(TRIANGLE_POINTS))
         test_shape.rotation_angle = 360
-        os.system("rm test_reactor/test_shape.stl")
-        os.system("rm test_reactor/Graveyard.stl")
-        test_shape.stl_filename = "test_shape.stl"
+        test_shape.material_tag = "test_material"
+        test_shape.stp_filename = None
         test_reactor = paramak.Reactor([test_shape])
 
-        test_reactor.export_stl(output_folder="test_reactor")
-
-        for filepath in [
-            "test_reactor/test_shape.stl",
-                "test_reactor/Graveyard.stl"]:
-            assert Path(filepath).exists() is True
-            os.system("rm " + filepath)
-
-    def test_exported_svg_files_exist(self):
-        """Creates a Reactor object with one shape and checks that a svg file
-        of the reactor can be exported to a specified location using the
-        export_svg method."""
-
-        os.system("rm test_svg_image.svg")
+        with self.assertRaises(ValueError):
+            test_reactor.neutronics_description()
 
-        self.test_reactor.export_svg("test_svg_image.svg")
+    def test_neutronics_description_plasma_options(self):
+        """Creates Reactor objects with and without a plasma and checks that
+        the neutronics description has the correct entries, including the
+        plasma only when include_plasma is True."""
+
+        cases = [
+            ([self.test_shape], False,
+             [("test_material", "test.stp"), ("Graveyard", "Graveyard.stp")]),
+            ([self.test_shape, self.test_plasma], False,
+             [("test_material", "test.stp"), ("Graveyard", "Graveyard.stp")]),
+            ([self.test_shape, self.test_plasma], True,
+             [("test_material", "test.stp"), ("DT_plasma", "plasma.stp"),
+              ("Graveyard", "Graveyard.stp")]),
+        ]
+
+        for shapes, include_plasma, expected in cases:
+            with self.subTest(
+                    num_shapes=len(shapes), include_plasma=include_plasma):
+                test_reactor = paramak.Reactor(shapes)
+                neutronics_description = test_reactor.neutronics_description(
+                    include_plasma=include_plasma)
+
+                assert [
+                    (entry["material"], entry["stp_filename"])
+                    for entry in neutronics_description] == expected
+                assert neutronics_description[0]["tet_mesh"] == "size 60"
+                for entry in neutronics_description[1:]:
+                    assert "tet_mesh" not in entry
 
-        assert Path("test_svg_image.svg").exists() is True
-        os.system("rm test_svg_image.svg")
+    def test_export_neutronics_description(self):
+        """Creates a Reactor object and checks that the neutronics description
+        is exported to a json file with the correct material_name and
+        stp_filename, adding the .json extension when it is missing."""
+
+        test_reactor = paramak.Reactor([self.test_shape])
+
+        for filename in ["manifest_test.json", "manifest_test"]:
+            with self.subTest(filename=filename), \
+                    TemporaryDirectory() as tmp_dir:
+                returned_filename = test_reactor.export_neutronics_description(
+                    filename=str(Path(tmp_dir) / filename)
+                )
+                filepath = Path(tmp_dir) / "manifest_test.json"
+                assert returned_filename == str(filepath)
+                neutronics_description = json.loads(filepath.read_bytes())
+                # the file is always written with four space indentation
+                assert filepath.read_text() == json.dumps(
+                    neutronics_description, indent=4)
+
+                assert len(neutronics_description) == 2
+                assert neutronics_description[0]["material"] == "test_material"
+                assert neutronics_description[0]["stp_filename"] == "test.stp"
+                assert neutronics_description[0]["tet_mesh"] == "size 60"
+                assert neutronics_description[1]["material"] == "Graveyard"
+                assert neutronics_description[1]["stp_filename"] == \
+                    "Graveyard.stp"
+
+    def test_render_2d_image(self):
+        """Creates a Reactor object and checks that a png image of the reactor
+        can be rendered into an in memory buffer."""
+
+        test_reactor = paramak.Reactor([self.test_shape])
+
+        buffer = io.BytesIO()
+        test_reactor._render_2d_image(
+            buffer, xmin=0.0, xmax=900.0, ymin=-600.0, ymax=600.0)
+
+        assert buffer.tell() > 0
+        assert buffer.getvalue().startswith(b"\x89PNG")
 
-    def test_exported_svg_files_exist_no_extension(self):
-        """creates a Reactor object with one shape and checks that an svg file
-        of the reactor can be exported to a specified location using the export_svg
+    def test_export_2d_image_without_extension(self):
+        """creates a Reactor object and checks that a png file of the reactor
+        with the correct filename can be exported using the export_2d_image
         method"""
 
-        os.system("rm test_svg_image.svg")
+        test_reactor = paramak.Reactor([self.test_shape])
 
-        self.test_reactor.export_svg("test_svg_image")
+        with TemporaryDirectory() as tmp_dir:
+            returned_filename = test_reactor.export_2d_image(
+                filename=str(Path(tmp_dir) / "2d_test_image"))
 
-        assert Path("test_svg_image.svg").exists() is True
-        os.system("rm test_svg_image.svg")
+            filepath = Path(tmp_dir) / "2d_test_image.png"
+            assert returned_filename == str(filepath)
+            assert filepath.exists() is True
 
-    def test_export_svg_options(self):
-        """Exports the test reacto to an svg image and checks that a svg file
-        can be exported with the various different export options"""
+    def test_export_html(self):
+        """Creates a Reactor object and checks that a html file of the reactor
+        with the correct filename can be exported using the export_html
+        method."""
 
-        os.system("rm *.svg")
-        self.test_reactor.export_svg("r_width.svg", width=900)
-        assert Path("r_width.svg").exists() is True
-        self.test_reactor.export_svg("r_height.svg", height=900)
-        assert Path("r_height.svg").exists() is True
-        self.test_reactor.export_svg("r_marginLeft.svg", marginLeft=110)
-        assert Path("r_marginLeft.svg").exists() is True
-        self.test_reactor.export_svg("r_marginTop.svg", marginTop=110)
-        assert Path("r_marginTop.svg").exists() is True
-        self.test_reactor.export_svg("r_showAxes.svg", showAxes=True)
-        assert Path("r_showAxes.svg").exists() is True
-        self.test_reactor.export_svg(
-            "r_projectionDir.svg", projectionDir=(-1, -1, -1))
-        assert Path("r_projectionDir.svg").exists() is True
-        self.test_reactor.export_svg(
-            "r_strokeColor.svg", strokeColor=(
-                42, 42, 42))
-        assert Path("r_strokeColor.svg").exists() is True
-        self.test_reactor.export_svg(
-            "r_hiddenColor.svg", hiddenColor=(
-                42, 42, 42))
-        assert Path("r_hiddenColor.svg").exists() is True
-        self.test_reactor.export_svg("r_showHidden.svg", showHidden=False)
-        assert Path("r_showHidden.svg").exists() is True
-        self.test_reactor.export_svg("r_strokeWidth1.svg", strokeWidth=None)
-        assert Path("r_strokeWidth1.svg").exists() is True
-        self.test_reactor.export_svg("r_strokeWidth2.svg", strokeWidth=10)
-        assert Path("r_strokeWidth2.svg").exists() is True
+        test_reactor = paramak.Reactor([self.test_shape])
 
-    def test_neutronics_description(self):
-        """Creates reactor objects to check errors are raised correctly when
-        exporting the neutronics description."""
+        for filename in ["test_html.html", "test_html"]:
+            with TemporaryDirectory() as tmp_dir:
+                filepath = Path(tmp_dir) / filename
+                test_reactor.export_html(filename=str(filepath))
 
-        def test_neutronics_description_without_material_tag():
-            """Checks ValueError is raised when the neutronics description is
-            exported without material_tag."""
+                assert (Path(tmp_dir) / "test_html.html").exists() is True
 
-            test_shape = paramak.RotateStraightShape(
-                points=[(0, 0), (0, 20), (20, 20)])
-            test_shape.rotation_angle = 360
-            test_shape.stp_filename = "test.stp"
-            test_reactor = paramak.Reactor([test_shape])
-            test_reactor.neutronics_description()
+    def test_tet_meshes_error(self):
+        test_reactor = paramak.Reactor([self.test_shape])
+        assert test_reactor.tet_meshes is not None
 
-        self.assertRaises(
-            ValueError,
-            test_neutronics_description_without_material_tag)
+    def test_largest_dimention(self):
+        """Checks the largest dimension of reactors containing shapes with a
+        radius of 20 and 30."""
 
-        def test_neutronics_description_without_stp_filename():
-            """Checks ValueError is raised when the neutronics description is
-            exported without stp_filename."""
+        wider_shape = paramak.RotateStraightShape(
+            points=[(0, 0), (0, 20), (30, 20)], rotation_angle=360)
 
-            test_shape = paramak.RotateStraightShape(
-                points=[(0, 0), (0, 20), (20, 20)])
-            test_shape.rotation_angle = 360
-            test_shape.material_tag = "test_material"
-            test_shape.stp_filename = None
-            test_reactor = paramak.Reactor([test_shape])
-            test_reactor.neutronics_description()
+        for test_shape, expected in [(self.test_shape, 20), (wider_shape, 30)]:
+            with self.subTest(expected=expected):
+                test_reactor = paramak.Reactor([test_shape])
+                assert test_reactor.largest_dimension == pytest.approx(
+                    expected, rel=0.1)
 
-        self.assertRaises(
-            ValueError,
-            test_neutronics_description_without_stp_filename)
+    def test_shapes_and_components(self):
+        test_shape = paramak.RotateStraightShape(
+            points=list(TRIANGLE_POINTS))
 
-    def test_neutronics_description_without_plasma(self):
-        """Creates a Reactor object and checks that the neutronics description
-        is exported with the correct material_tag and stp_filename."""
+        with self.assertRaises(ValueError):
+            paramak.Reactor(test_shape)
 
+    def test_graveyard_error(self):
         test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)])
-        test_shape.rotation_angle = 360
-        test_shape.material_tag = "test_material"
-        test_shape.stp_filename = "test.stp"
+            points=list(TRIANGLE_POINTS))
         test_reactor = paramak.Reactor([test_shape])
-        neutronics_description = test_reactor.neutronics_description()
 
-        assert len(neutronics_description) == 2
-        assert "stp_filename" in neutronics_description[0].keys()
-        assert "material" in neutronics_description[0].keys()
-        assert neutronics_description[0]["material"] == "test_material"
-        assert neutronics_description[0]["stp_filename"] == "test.stp"
-        assert neutronics_description[1]["material"] == "Graveyard"
-        assert neutronics_description[1]["stp_filename"] == "Graveyard.stp"
+        with self.assertRaises(TypeError):
+            test_reactor.graveyard_offset = 'coucou'
 
-    def test_export_neutronics_description(self):
-        """Creates a Reactor object and checks that the neutronics description
-        is exported to a json file with the correct material_name and
-        stp_filename."""
+        with self.assertRaises(ValueError):
+            test_reactor.graveyard_offset = -2
 
-        os.system("rm manifest_test.json")
+        with self.assertRaises(TypeError):
+            test_reactor.graveyard_offset = [1.2]
+
+    def test_compound_in_shapes(self):
+        shape1 = paramak.RotateStraightShape(
+            points=list(TRIANGLE_POINTS))
+        # the compound only needs two solids so the same one is used twice
+        solid = shape1.solid.val()
+        shape3 = paramak.Shape()
+        shape3.solid = cq.Compound.makeCompound([solid, solid])
+        test_reactor = paramak.Reactor([shape3])
+        assert test_reactor.solid is not None
+
+    def test_reactor_solid_is_reused(self):
+        """Checks that the Reactor.solid compound is reused when the shapes
+        are unchanged and rebuilt when a shape changes."""
 
         test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)])
-        test_shape.rotation_angle = 360
-        test_shape.material_tag = "test_material"
-        test_shape.stp_filename = "test.stp"
-        test_shape.tet_mesh = "size 60"
+            points=list(TRIANGLE_POINTS))
         test_reactor = paramak.Reactor([test_shape])
-        returned_filename = test_reactor.export_neutronics_description(
-            filename="manifest_test.json"
-        )
-        with open("manifest_test.json") as json_file:
-            neutronics_description = json.load(json_file)
-
-        assert returned_filename == "manifest_test.json"
-        assert Path("manifest_test.json").exists() is True
-        assert len(neutronics_description) == 2
-        assert "stp_filename" in neutronics_description[0].keys()
-        assert "material" in neutronics_description[0].keys()
-        assert "tet_mesh" in neutronics_description[0].keys()
-        assert neutronics_description[0]["material"] == "test_material"
-        assert neutronics_description[0]["stp_filename"] == "test.stp"
-        assert neutronics_description[0]["tet_mesh"] == "size 60"
-        assert neutronics_description[1]["material"] == "Graveyard"
-        assert neutronics_description[1]["stp_filename"] == "Graveyard.stp"
-        os.system("rm manifest_test.json")
-
-    def test_export_neutronics_description_with_plasma(self):
-        """Creates a Reactor object and checks that the neutronics description
-        is exported to a json file with the correct entries, including the
-        optional plasma."""
 
-        os.system("rm manifest_test.json")
+        first_solid = test_reactor.solid
+        assert test_reactor.solid is first_solid
 
-        test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)],
-            rotation_angle=360,
-            material_tag="test_material",
-            stp_filename="test.stp",
-        )
-        test_shape.tet_mesh = "size 60"
-        test_plasma = paramak.Plasma(
-            major_radius=500,
-            minor_radius=100,
-            stp_filename="plasma.stp",
-            material_tag="DT_plasma",
-        )
-        test_reactor = paramak.Reactor([test_shape, test_plasma])
-        returned_filename = test_reactor.export_neutronics_description(
-            include_plasma=True
-        )
-        with open("manifest.json") as json_file:
-            neutronics_description = json.load(json_file)
-
-        assert returned_filename == "manifest.json"
-        assert Path("manifest.json").exists() is True
-        assert len(neutronics_description) == 3
-        assert "stp_filename" in neutronics_description[0].keys()
-        assert "material" in neutronics_description[0].keys()
-        assert "tet_mesh" in neutronics_description[0].keys()
-        assert "stp_filename" in neutronics_description[1].keys()
-        assert "material" in neutronics_description[1].keys()
-        assert "tet_mesh" not in neutronics_description[1].keys()
-        assert neutronics_description[0]["material"] == "test_material"
-        assert neutronics_description[0]["stp_filename"] == "test.stp"
-        assert neutronics_description[0]["tet_mesh"] == "size 60"
-        assert neutronics_description[1]["material"] == "DT_plasma"
-        assert neutronics_description[1]["stp_filename"] == "plasma.stp"
-        assert neutronics_description[2]["material"] == "Graveyard"
-        assert neutronics_description[2]["stp_filename"] == "Graveyard.stp"
-        os.system("rm manifest.json")
-
-    def test_export_neutronics_description_without_plasma(self):
-        """Creates a Reactor object and checks that the neutronics description is
-        exported to a json file with the correct entires, exluding the optional
-        plasma."""
-
-        os.system("rm manifest_test.json")
+        test_shape.rotation_angle = 180
+        assert test_reactor.solid is not first_solid
+        assert test_reactor.solid.Volume() == pytest.approx(
+            first_solid.Volume() / 2)
 
-        test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)],
-            rotation_angle=360,
-            material_tag="test_material",
-            stp_filename="test.stp",
-        )
-        test_shape.tet_mesh = "size 60"
-        test_plasma = paramak.Plasma(major_radius=500, minor_radius=100)
-        test_reactor = paramak.Reactor([test_shape, test_plasma])
-        returned_filename = test_reactor.export_neutronics_description()
-        with open("manifest.json") as json_file:
-            neutronics_description = json.load(json_file)
-
-        assert returned_filename == "manifest.json"
-        assert Path("manifest.json").exists() is True
-        assert len(neutronics_description) == 2
-        assert "stp_filename" in neutronics_description[0].keys()
-        assert "material" in neutronics_description[0].keys()
-        assert "tet_mesh" in neutronics_description[0].keys()
-        assert neutronics_description[0]["material"] == "test_material"
-        assert neutronics_description[0]["stp_filename"] == "test.stp"
-        assert neutronics_description[0]["tet_mesh"] == "size 60"
-        assert neutronics_description[1]["material"] == "Graveyard"
-        assert neutronics_description[1]["stp_filename"] == "Graveyard.stp"
-        os.system("rm manifest.json")
-
-    def test_export_neutronics_without_extension(self):
-        """checks a json file is created if filename has no extension"""
-
-        os.system("rm manifest_test.json")
-        test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)])
-        test_shape.rotation_angle = 360
-        test_shape.material_tag = "test_material"
-        test_shape.stp_filename = "test.stp"
-        test_shape.tet_mesh = "size 60"
+    def test_export_stl_angular_tolerance(self):
+        """Exports a reactor with a curved shape using two angular tolerances
+        and checks that the coarser tolerance produces a smaller stl file."""
+
+        test_shape = paramak.RotateCircleShape(
+            points=[(50, 0)], radius=10, stl_filename="circle.stl")
         test_reactor = paramak.Reactor([test_shape])
-        returned_filename = test_reactor.export_neutronics_description(
-            filename="manifest_test"
-        )
-        assert returned_filename == "manifest_test.json"
-        assert Path("manifest_test.json").exists() is True
-        os.system("rm manifest_test.json")
 
-    def test_export_2d_image(self):
-        """Creates a Reactor object and checks that a png file of the reactor
-        with the correct filename can be exported using the export_2D_image
-        method."""
+        file_sizes = []
+        for angular_tolerance in [0.1, 1.]:
+            with TemporaryDirectory() as tmp_dir:
+                # a large linear tolerance leaves the angular tolerance as
+                # the limit on the faceting
+                test_reactor.export_stl(
+                    output_folder=tmp_dir,
+                    tolerance=10,
+                    angular_tolerance=angular_tolerance)
+                file_sizes.append(
+                    (Path(tmp_dir) / "circle.stl").stat().st_size)
+
+        assert file_sizes[1] < file_sizes[0]
+
+    def test_export_stl_with_cache(self):
+        """Checks that the stl facets of a reactor shape are reused when the
+        shape and tolerance are unchanged and remade when either changes."""
 
-        os.system("rm 2D_test_image.png")
         test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)])
-        test_shape.rotation_angle = 360
+            points=list(TRIANGLE_POINTS))
         test_reactor = paramak.Reactor([test_shape])
-        returned_filename = test_reactor.export_2d_image(
-            filename="2D_test_image.png")
 
-        assert Path(returned_filename).exists() is True
-        os.system("rm 2D_test_image.png")
+        with TemporaryDirectory() as tmp_dir:
+            filename = Path(tmp_dir) / "test_shape.stl"
+
+            stl_cache = {}
+            test_reactor._export_stl_with_cache(
+                test_shape, filename, tolerance=0.01, stl_cache=stl_cache)
+            key = (test_shape.hash_value, 0.01)
+            assert list(stl_cache) == [key]
+            assert stl_cache[key] == filename.read_bytes()
+
+            # a hit writes the cached contents instead of faceting again
+            test_reactor._stl_cache = {key: b"cached stl"}
+            stl_cache = {}
+            test_reactor._export_stl_with_cache(
+                test_shape, filename, tolerance=0.01, stl_cache=stl_cache)
+            assert filename.read_bytes() == b"cached stl"
+            assert list(stl_cache) == [key]
+
+            # a different tolerance misses the cache
+            stl_cache = {}
+            test_reactor._export_stl_with_cache(
+                test_shape, filename, tolerance=0.1, stl_cache=stl_cache)
+            assert filename.read_bytes() != b"cached stl"
+            assert list(stl_cache) == [(test_shape.hash_value, 0.1)]
+
+            # a changed parameter misses the cache
+            test_shape.rotation_angle = 180
+            stl_cache = {}
+            test_reactor._export_stl_with_cache(
+                test_shape, filename, tolerance=0.01, stl_cache=stl_cache)
+            assert filename.read_bytes() != b"cached stl"
+            assert list(stl_cache) == [(test_shape.hash_value, 0.01)]
+            assert test_shape.hash_value != key[0]
 
-    def test_export_2d_image_without_extension(self):
-        """creates a Reactor object and checks that a png file of the reactor
-        with the correct filename can be exported using the export_2d_image
-        method"""
+    def test_adding_shape_with_None_stp_filename_physical_groups(self):
+        """Checks ValueError is raised when physical groups are exported for
+        a reactor containing a shape with None as the stp filename"""
 
-        os.system("rm 2d_test_image.png")
         test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)])
-        test_shape.rotation_angle = 360
-        test_reactor = paramak.Reactor([test_shape])
-        returned_filename = test_reactor.export_2d_image(
-            filename="2d_test_image")
+            points=list(TRIANGLE_POINTS), stp_filename="filename.stp"
+        )
+        test_shape2 = paramak.RotateSplineShape(
+            points=list(TRIANGLE_POINTS), stp_filename=None
+        )
+        my_reactor = paramak.Reactor([test_shape, test_shape2])
 
-        assert Path(returned_filename).exists() is True
-        os.system("rm 2d_test_image.png")
+        with TemporaryDirectory() as tmp_dir:
+            with self.assertRaises(ValueError):
+                my_reactor.export_physical_groups(output_folder=tmp_dir)
 
-    def test_export_html(self):
-        """Creates a Reactor object and checks that a html file of the reactor
-        with the correct filename can be exported using the export_html
-        method."""
 
-        os.system("rm test_html.html")
+@pytest.mark.slow
+class TestReactorExports(unittest.TestCase):
+    """Checks the files written by the Reactor export methods. The reactor
+    is exported once for the whole class as this is the slow part of these
+    tests, so they can be deselected with pytest -m "not slow"."""
+
+    @classmethod
+    def setUpClass(cls):
         test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)])
-        test_shape.rotation_angle = 360
-        test_reactor = paramak.Reactor([test_shape])
-        test_reactor.export_html(filename="test_html.html")
+            points=list(TRIANGLE_POINTS),
+            rotation_angle=360,
+            stp_filename="test_shape.stp",
+            stl_filename="test_shape.stl",
+        )
 
-        assert Path("test_html.html").exists() is True
-        os.system("rm test_html.html")
-        test_reactor.export_html(filename="test_html")
+        cls.test_reactor = paramak.Reactor([test_shape])
+
+        cls.tmp_dir = TemporaryDirectory()
+        cls.export_dir = Path(cls.tmp_dir.name)
+        cls.test_reactor.export_stp(output_folder=str(cls.export_dir))
+        # only the existence of the stl files is checked so the faceting
+        # is kept coarse
+        cls.test_reactor.export_stl(
+            output_folder=str(cls.export_dir),
+            tolerance=1.,
+            angular_tolerance=1.)
+        cls.test_reactor.export_svg(
+            str(cls.export_dir / "test_svg_image.svg"))
+        cls.test_reactor.export_svg(
+            str(cls.export_dir / "test_svg_image_no_extension"))
+        cls.test_reactor.export_graveyard(
+            filename=str(cls.export_dir / "my_graveyard.stp"))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
 
-        assert Path("test_html.html").exists() is True
-        os.system("rm test_html.html")
+    def test_export_graveyard(self):
+        """Checks that the graveyard of the test reactor has been exported to
+        the default and specified locations."""
 
-    def test_tet_meshes_error(self):
-        test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)])
-        test_shape.rotation_angle = 360
-        test_reactor = paramak.Reactor([test_shape])
-        assert test_reactor.tet_meshes is not None
+        for filename in ["Graveyard.stp", "my_graveyard.stp"]:
+            assert (self.export_dir / filename).exists() is True
 
-    def test_largest_dimention(self):
-        test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)])
-        test_shape.rotation_angle = 360
-        test_reactor = paramak.Reactor([test_shape])
-        assert pytest.approx(test_reactor.largest_dimension, rel=0.1 == 20)
-        test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (30, 20)])
-        test_shape.rotation_angle = 360
-        test_reactor = paramak.Reactor([test_shape])
-        assert pytest.approx(test_reactor.largest_dimension, rel=0.1 == 30)
+        assert self.test_reactor.graveyard is not None
+        assert isinstance(self.test_reactor.graveyard, paramak.HollowCube)
 
-    def test_shapes_and_components(self):
-        test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)])
+    def test_exported_stp_files_exist(self):
+        """Checks that the stp files of the test reactor have been exported to
+        the output folder by the export_stp method."""
 
-        def incorrect_shapes_and_components():
-            paramak.Reactor(test_shape)
-        self.assertRaises(ValueError, incorrect_shapes_and_components)
+        for filename in ["test_shape.stp", "Graveyard.stp"]:
+            assert (self.export_dir / filename).exists() is True
 
-    def test_graveyard_error(self):
-        test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)])
-        test_reactor = paramak.Reactor([test_shape])
+    def test_exported_stl_files_exist(self):
+        """Checks that the stl files of the test reactor have been exported to
+        the output folder by the export_stl method."""
 
-        def str_graveyard_offset():
-            test_reactor.graveyard_offset = 'coucou'
-        self.assertRaises(TypeError, str_graveyard_offset)
+        for filename in ["test_shape.stl", "Graveyard.stl"]:
+            assert (self.export_dir / filename).exists() is True
 
-        def negative_graveyard_offset():
-            test_reactor.graveyard_offset = -2
-        self.assertRaises(ValueError, negative_graveyard_offset)
+    def test_exported_svg_files_exist(self):
+        """Checks that a svg file of the test reactor has been exported to the
+        specified location by the export_svg method."""
 
-        def list_graveyard_offset():
-            test_reactor.graveyard_offset = [1.2]
-        self.assertRaises(TypeError, list_graveyard_offset)
+        assert (self.export_dir / "test_svg_image.svg").exists() is True
 
-    def test_compound_in_shapes(self):
-        shape1 = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)])
-        shape2 = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)])
-        shape3 = paramak.Shape()
-        shape3.solid = cq.Compound.makeCompound(
-            [a.val() for a in [shape1.solid, shape2.solid]]
-        )
-        test_reactor = paramak.Reactor([shape3])
-        assert test_reactor.solid is not None
+    def test_exported_svg_files_exist_no_extension(self):
+        """Checks that the export_svg method adds the .svg extension to a
+        filename without one."""
 
-    def test_adding_shape_with_None_stp_filename_physical_groups(self):
-        """adds shapes to a Reactor object to check errors are raised
-        correctly"""
-
-        def test_stp_filename_None():
-            """checks ValueError is raised when RotateStraightShapes with
-            None as stp filenames are added"""
-
-            test_shape = paramak.RotateStraightShape(
-                points=[(0, 0), (0, 20), (20, 20)], stp_filename="filename.stp"
-            )
-            test_shape2 = paramak.RotateSplineShape(
-                points=[(0, 0), (0, 20), (20, 20)], stp_filename=None
-            )
-            test_shape.create_solid()
-            my_reactor = paramak.Reactor([test_shape, test_shape2])
-            my_reactor.export_physical_groups()
-
-        self.assertRaises(ValueError, test_stp_filename_None)
+        assert (
+            self.export_dir / "test_svg_image_no_extension.svg"
+        ).exists() is True
+
+    def test_export_svg_options(self):
+        """Exports the test reacto to an svg image and checks that a svg file
+        can be exported with the various different export options"""
+
+        svg_options = {
+            "r_width.svg": {"width": 900},
+            "r_height.svg": {"height": 900},
+            "r_marginLeft.svg": {"marginLeft": 110},
+            "r_marginTop.svg": {"marginTop": 110},
+            "r_showAxes.svg": {"showAxes": True},
+            "r_projectionDir.svg": {"projectionDir": (-1, -1, -1)},
+            "r_strokeColor.svg": {"strokeColor": (42, 42, 42)},
+            "r_hiddenColor.svg": {"hiddenColor": (42, 42, 42)},
+            "r_showHidden.svg": {"showHidden": False},
+            "r_strokeWidth1.svg": {"strokeWidth": None},
+            "r_strokeWidth2.svg": {"strokeWidth": 10},
+        }
+
+        with TemporaryDirectory() as tmp_dir:
+            for filename, options in svg_options.items():
+                with self.subTest(options=options):
+                    filepath = Path(tmp_dir) / filename
+                    self.test_reactor.export_svg(str(filepath), **options)
+                    assert filepath.exists() is True
 
 
 if __name__ == "__main__":
@@ -1,12 +1,25 @@
 
-import os
 import unittest
+from functools import lru_cache
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
+import cadquery as cq
 import paramak
 import pytest
 
 
+@lru_cache(maxsize=8)
+def _pf_coil(center_point, height, width):
+    """Returns a PoloidalFieldCoil that is shared between the tests that only
+    read its properties, so that its solid is only built once."""
+    return paramak.PoloidalFieldCoil(
+        center_point=center_point,
+        height=height,
+        width=width
+    )
+
+
 class TestShape(unittest.TestCase):
 
     def test_shape_default_properties(self):
@@ -150,7 +163,7 @@ class TestShape(unittest.TestCase):
 
         assert test_shape.hash_value is None
         assert test_shape.solid is not None
-        assert type(test_shape.solid).__name__ == "Workplane"
+        assert isinstance(test_shape.solid, cq.Workplane)
         assert test_shape.hash_value is not None
 
     def test_solid_return(self):
@@ -202,6 +215,51 @@ class TestShape(unittest.TestCase):
         test_shape.solid
         assert test_shape.hash_value != initial_hash_value
 
+    def test_solid_not_reconstructed_by_wire(self):
+        """Checks that accessing the Shape.wire does not cause the cadquery
+        solid to be constructed again when no changes have been made to the
+        Shape."""
+
+        test_shape = paramak.RotateStraightShape(
+            points=[(0, 0), (0, 20), (20, 20)], rotation_angle=360
+        )
+        initial_solid = test_shape.solid
+        assert test_shape.wire is not None
+        assert test_shape.solid is initial_solid
+
+    def test_solid_rebuilt_after_cut_appended(self):
+        """Checks that appending to the cut list of a Shape in place, after
+        its solid has been made, causes the solid to be remade."""
+
+        test_shape = paramak.ExtrudeStraightShape(
+            points=[(0, 0), (0, 20), (20, 20), (20, 0)], distance=20,
+            cut=[]
+        )
+        cutter = paramak.ExtrudeStraightShape(
+            points=[(0, 0), (0, 10), (10, 10), (10, 0)], distance=20
+        )
+        initial_volume = test_shape.volume
+        assert initial_volume == pytest.approx(20 * 20 * 20)
+
+        test_shape.cut.append(cutter)
+        assert test_shape.volume == pytest.approx(
+            initial_volume - (10 * 10 * 20))
+
+    def test_largest_dimension_reused_until_solid_changes(self):
+        """Checks that finding the largest dimension of a Shape does not cause
+        the solid to be constructed again and that the value is updated when
+        the solid changes."""
+
+        test_shape = paramak.RotateStraightShape(
+            points=[(0, 0), (0, 20), (20, 20)], rotation_angle=360
+        )
+        initial_solid = test_shape.solid
+        assert test_shape.largest_dimension == pytest.approx(20, rel=0.01)
+        assert test_shape.solid is initial_solid
+
+        test_shape.points = [(0, 0), (0, 30), (30, 30)]
+        assert test_shape.largest_dimension == pytest.approx(30, rel=0.01)
+
     def test_material_tag_warning(self):
         """Checks that a warning is raised when a Shape has a material tag >
         28 characters."""
@@ -234,14 +292,12 @@ class TestShape(unittest.TestCase):
             points=[(0, 0), (0, 20), (20, 20), (20, 0)], rotation_angle=360
         )
 
-        os.system("rm filename.html")
-        test_shape.export_html('filename')
-        assert Path("filename.html").exists() is True
-        os.system("rm filename.html")
-        test_shape.color = (1, 0, 0, 0.5)
-        test_shape.export_html('filename')
-        assert Path("filename.html").exists() is True
-        os.system("rm filename.html")
+        # the default RGB color and then an RGBA color
+        for color in [test_shape.color, (1, 0, 0, 0.5)]:
+            test_shape.color = color
+            with TemporaryDirectory() as tmp_dir:
+                test_shape.export_html(str(Path(tmp_dir) / 'filename'))
+                assert (Path(tmp_dir) / "filename.html").exists() is True
 
     def test_export_html_view_planes(self):
         """Checks a plotly figure of the Shape is exported by the export_html
@@ -252,12 +308,12 @@ class TestShape(unittest.TestCase):
         )
 
         for view_plane in ['XZ', 'XY', 'YZ', 'YX', 'ZY', 'ZX', 'RZ', 'XYZ']:
-            os.system("rm *.html")
-            test_shape.export_html(
-                filename='filename',
-                view_plane=view_plane
-            )
-            assert Path("filename.html").exists() is True
+            with TemporaryDirectory() as tmp_dir:
+                test_shape.export_html(
+                    filename=str(Path(tmp_dir) / 'filename'),
+                    view_plane=view_plane
+                )
+                assert (Path(tmp_dir) / "filename.html").exists() is True
 
     def test_export_html_with_points_None(self):
         """Checks that an error is raised when points is None and export_html
@@ -362,11 +418,7 @@ class TestShape(unittest.TestCase):
         """Checks the volume and volumes attributes are correct types
         and that the volumes sum to equalt the volume."""
 
-        test_shape = paramak.PoloidalFieldCoil(
-            center_point=(100, 100),
-            height=50,
-            width=50
-        )
+        test_shape = _pf_coil(center_point=(100, 100), height=50, width=50)
 
         assert isinstance(test_shape.volume, float)
         assert isinstance(test_shape.volumes, list)
@@ -401,11 +453,7 @@ class TestShape(unittest.TestCase):
         """Checks the area and areas attributes are correct types
         and that the areas sum to equalt the area."""
 
-        test_shape = paramak.PoloidalFieldCoil(
-            center_point=(100, 100),
-            height=50,
-            width=50
-        )
+        test_shape = _pf_coil(center_point=(100, 100), height=50, width=50)
 
         assert isinstance(test_shape.area, float)
         assert isinstance(test_shape.areas, list)
@@ -3,6 +3,7 @@ import os
 import sys
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 from examples.example_parametric_components import (
     make_all_parametric_components, make_demo_style_blankets,
@@ -14,6 +15,14 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'examples'))
 
 class TestExampleComponents(unittest.TestCase):
 
+    def setUp(self):
+        # the examples write their files to the working directory so each
+        # test is run in its own temporary one
+        tmp_dir = TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp_dir.name)
+
     def test_make_all_parametric_components(self):
         """Runs the example and checks the output files are produced"""
         output_filenames = [
@@ -49,8 +58,6 @@ class TestExampleComponents(unittest.TestCase):
             'toroidal_field_coil_triple_arc.stp',
             'toroidal_field_coil_princeton_d.stp',
             'ITER_type_divertor.stp']
-        for output_filename in output_filenames:
-            os.system("rm " + output_filename)
         all_components = make_all_parametric_components.main()
         filenames = []
         for components in all_components:
@@ -59,7 +66,6 @@ class TestExampleComponents(unittest.TestCase):
 
         for output_filename in output_filenames:
             assert Path(output_filename).exists()
-            os.system("rm " + output_filename)
 
     def test_make_plasma(self):
         """Runs the example and checks the output files are produced"""
@@ -78,28 +84,21 @@ class TestExampleComponents(unittest.TestCase):
             "AST_plasma.png",
             "all_plasma_and_points.html",
         ]
-        for output_filename in output_filenames:
-            os.system("rm " + output_filename)
         make_plasmas.main()
         for output_filename in output_filenames:
             assert Path(output_filename).exists()
-            os.system("rm " + output_filename)
 
     def test_make_demo_style_blanket(self):
         """Runs the example and checks the output files are produced"""
         output_filename = "blanket.stp"
-        os.system("rm " + output_filename)
         make_demo_style_blankets.main()
         assert Path(output_filename).exists()
-        os.system("rm " + output_filename)
 
     def test_make_segmented_firstwall(self):
         """Runs the example and checks the output files are produced"""
         output_filename = "segmented_firstwall.stp"
-        os.system("rm " + output_filename)
         make_firstwall_for_neutron_wall_loading.main()
         assert Path(output_filename).exists()
-        os.system("rm " + output_filename)
 
     def test_make_vacuum_vessel(self):
         """Runs the example and checks the output files are produced"""
@@ -107,12 +106,9 @@ class TestExampleComponents(unittest.TestCase):
             "vacuum_vessel_with_ports.stp",
             "vacuum_vessel_with_ports.svg",
         ]
-        for output_filename in output_filenames:
-            os.system("rm " + output_filename)
         make_vacuum_vessel_with_ports.main()
         for output_filename in output_filenames:
             assert Path(output_filename).exists()
-            os.system("rm " + output_filename)
 
 
 if __name__ == "__main__":
@@ -3,7 +3,9 @@ import os
 import sys
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
+import pytest
 from examples.example_neutronics_simulations import (
     shape_with_gas_production)
 
@@ -12,6 +14,15 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'examples'))
 
 class TestExampleNeutronics(unittest.TestCase):
 
+    def setUp(self):
+        # the examples write their files to the working directory so each
+        # test is run in its own temporary one
+        tmp_dir = TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp_dir.name)
+
+    @pytest.mark.slow
     def test_make_cad_from_points(self):
         """Runs the example and checks the output files are produced"""
         output_filenames = [
@@ -29,8 +40,6 @@ class TestExampleNeutronics(unittest.TestCase):
             "n-Xt_on_3D_mesh.vtk",
             "n-Xa_on_3D_mesh.vtk",
         ]
-        os.system("rm *.png")
-        os.system("rm *.vtk")
         shape_with_gas_production.main()
         for output_filename in output_filenames:
             assert Path(output_filename).exists() is True
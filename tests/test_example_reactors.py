@@ -3,6 +3,7 @@ import os
 import sys
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 from examples.example_parametric_reactors import (
     ball_reactor, ball_reactor_single_null, htc_reactor, make_animation,
@@ -13,6 +14,14 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'examples'))
 
 class TestExampleReactors(unittest.TestCase):
 
+    def setUp(self):
+        # the examples write their files to the working directory so each
+        # test is run in its own temporary one
+        tmp_dir = TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp_dir.name)
+
     def test_make_animations(self):
         """Runs the example to check the output files are produced"""
         output_filenames = [
@@ -21,7 +30,6 @@ class TestExampleReactors(unittest.TestCase):
             "rotation_0000.svg",
             "rotation_0001.svg",
         ]
-        os.system("rm *.svg")
         make_animation.rotate_single_reactor(2)
         make_animation.make_random_reactors(2)
         for output_filename in output_filenames:
@@ -47,12 +55,9 @@ class TestExampleReactors(unittest.TestCase):
             "inner_vessel.stp",
             "Graveyard.stp",
         ]
-        for output_filename in output_filenames:
-            os.system("rm " + output_filename)
         htc_reactor.main(90)
         for output_filename in output_filenames:
             assert Path(output_filename).exists() is True
-            os.system("rm " + output_filename)
 
     def test_make_parametric_ball_rector(self):
         """Runs the example and checks the output files are produced"""
@@ -66,12 +71,9 @@ class TestExampleReactors(unittest.TestCase):
             "blanket_rear_wall.stp",
             "Graveyard.stp",
         ]
-        for output_filename in output_filenames:
-            os.system("rm " + output_filename)
         ball_reactor.make_ball_reactor(output_folder='')
         for output_filename in output_filenames:
             assert Path(output_filename).exists() is True
-            os.system("rm " + output_filename)
 
     def test_make_parametric_single_null_ball_reactor(self):
         """Runs the example and checks the output files are produced"""
@@ -87,12 +89,9 @@ class TestExampleReactors(unittest.TestCase):
             "plasma.stp",
             "tf_coil.stp"
         ]
-        for output_filename in output_filenames:
-            os.system("rm " + output_filename)
         ball_reactor_single_null.make_ball_reactor_sn(output_folder='')
         for output_filename in output_filenames:
             assert Path(output_filename).exists() is True
-            os.system("rm " + output_filename)
 
     def test_make_parametric_single_null_submersion_reactor(self):
         """Runs the example and checks the output files are produced"""
@@ -109,12 +108,9 @@ class TestExampleReactors(unittest.TestCase):
             'pf_coils.stp',
             'Graveyard.stp'
         ]
-        for output_filename in output_filenames:
-            os.system("rm " + output_filename)
         submersion_reactor_single_null.make_submersion_sn(output_folder='')
         for output_filename in output_filenames:
             assert Path(output_filename).exists() is True
-            os.system("rm " + output_filename)
 
     def test_make_htc_reactor(self):
         output_filenames = [
@@ -133,12 +129,9 @@ class TestExampleReactors(unittest.TestCase):
             'inner_vessel.stp',
             'htc_reactor.svg',
         ]
-        for output_filename in output_filenames:
-            os.system("rm " + output_filename)
         htc_reactor.main()
         for output_filename in output_filenames:
             assert Path(output_filename).exists() is True
-            os.system("rm " + output_filename)
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@ import os
 import sys
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 from examples.example_parametric_shapes import (
     make_blanket_from_parameters, make_blanket_from_points,
@@ -17,21 +18,25 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'examples'))
 
 class TestExampleShapes(unittest.TestCase):
 
+    def setUp(self):
+        # the examples write their files to the working directory so each
+        # test is run in its own temporary one
+        tmp_dir = TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp_dir.name)
+
     def test_make_blanket_from_points(self):
         """Runs the example and checks the output files are produced"""
         filename = "blanket_from_points.stp"
-        os.system("rm *.stp")
         make_blanket_from_points.main(filename=filename)
         assert Path(filename).exists() is True
-        os.system("rm *.stp")
 
     def test_make_blanket_parametrically(self):
         """Runs the example and checks the output files are produced"""
         filename = "blanket_from_parameters.stp"
-        os.system("rm *.stp")
         make_blanket_from_parameters.main(filename=filename)
         assert Path(filename).exists() is True
-        os.system("rm *.stp")
 
     def test_make_cad_from_points(self):
         """Runs the example and checks the output files are produced"""
@@ -43,7 +48,6 @@ class TestExampleShapes(unittest.TestCase):
             "rotated_spline.stp",
             "rotated_straights.stp",
         ]
-        os.system("rm *.stp")
         make_CAD_from_points.main()
         for output_filename in output_filenames:
             assert Path(output_filename).exists() is True
@@ -60,8 +64,6 @@ class TestExampleShapes(unittest.TestCase):
             "can_reactor_from_parameters/core.stp",
             "can_reactor_from_parameters/reactor.html",
         ]
-        os.system("rm *.stp")
-        os.system("rm *.html")
         make_can_reactor_from_parameters.main()
         for output_filename in output_filenames:
             assert Path(output_filename).exists() is True
@@ -78,8 +80,6 @@ class TestExampleShapes(unittest.TestCase):
             "can_reactor_from_points/core.stp",
             "can_reactor_from_points/reactor.html",
         ]
-        os.system("rm *.stp")
-        os.system("rm *.html")
         make_can_reactor_from_points.main()
         for output_filename in output_filenames:
             assert Path(output_filename).exists() is True
@@ -95,8 +95,6 @@ class TestExampleShapes(unittest.TestCase):
             "example_shape_from_stp_XZ.html",
             "example_shape_from_stp_XYZ.html",
         ]
-        os.system("rm *.stp")
-        os.system("rm *.html")
         make_html_diagram_from_stp_file.make_stp_file()
         make_html_diagram_from_stp_file.load_stp_file_and_plot()
         for output_filename in output_filenames:
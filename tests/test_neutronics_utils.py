@@ -1,42 +1,71 @@
 
+import struct
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
-import paramak
 from paramak.neutronics_utils import (add_stl_to_moab_core,
                                       define_moab_core_and_tags)
 
 
+def _write_cube_stl(filename, length=20.):
+    """Writes a binary stl file of a cube with one corner at the origin. This
+    avoids tessellating a cadquery solid in tests that only need a valid stl
+    file for pymoab to read."""
+
+    corners = [
+        (x * length, y * length, z * length)
+        for x in (0, 1) for y in (0, 1) for z in (0, 1)
+    ]
+    # two triangles for each face, wound anticlockwise when viewed from
+    # outside the cube, as indices into corners
+    triangles = [
+        (0, 1, 3), (0, 3, 2), (4, 6, 7), (4, 7, 5),
+        (0, 4, 5), (0, 5, 1), (2, 3, 7), (2, 7, 6),
+        (0, 2, 6), (0, 6, 4), (1, 5, 7), (1, 7, 3),
+    ]
+
+    with open(filename, "wb") as stl_file:
+        stl_file.write(bytes(80))
+        stl_file.write(struct.pack("<I", len(triangles)))
+        for triangle in triangles:
+            vertices = [coord for i in triangle for coord in corners[i]]
+            # the normal is left as zero so that readers calculate it
+            stl_file.write(struct.pack("<12fH", 0., 0., 0., *vertices, 0))
+
+
 class TestNeutronicsUtilityFunctions(unittest.TestCase):
 
     def test_moab_instance_creation(self):
-        """passes three points on a circle to the function and checks that the
-        radius and center of the circle is calculated correctly"""
+        """Adds an stl file to a moab core and checks that the stl and the h5m
+        file written from the core are not empty. The files are written to a
+        temporary directory so that the test does not depend on or change
+        the working directory."""
 
         moab_core, moab_tags = define_moab_core_and_tags()
 
-        test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20), (20, 0)]
-        )
+        with TemporaryDirectory() as tmp_dir:
+            stl_filename = Path(tmp_dir) / 'test_file.stl'
+            h5m_filename = Path(tmp_dir) / 'test_file.h5m'
 
-        test_shape.export_stl('test_file.stl')
+            _write_cube_stl(stl_filename)
 
-        new_moab_core = add_stl_to_moab_core(
-            moab_core=moab_core,
-            surface_id=1,
-            volume_id=1,
-            material_name='test_mat',
-            tags=moab_tags,
-            stl_filename='test_file.stl'
-        )
+            new_moab_core = add_stl_to_moab_core(
+                moab_core=moab_core,
+                surface_id=1,
+                volume_id=1,
+                material_name='test_mat',
+                tags=moab_tags,
+                stl_filename=str(stl_filename)
+            )
 
-        all_sets = new_moab_core.get_entities_by_handle(0)
+            all_sets = new_moab_core.get_entities_by_handle(0)
 
-        file_set = new_moab_core.create_meshset()
+            file_set = new_moab_core.create_meshset()
 
-        new_moab_core.add_entities(file_set, all_sets)
+            new_moab_core.add_entities(file_set, all_sets)
 
-        new_moab_core.write_file('test_file.h5m')
+            new_moab_core.write_file(str(h5m_filename))
 
-        assert Path('test_file.stl').exists()
-        assert Path('test_file.h5m').exists()
+            assert stl_filename.stat().st_size > 0
+            assert h5m_filename.stat().st_size > 0
@@ -52,8 +52,8 @@ class TestBlanketConstantThicknessArcH(unittest.TestCase):
         checks that the face areas are expected."""
 
         assert len(self.test_shape.areas) == 4
-        assert len(set([round(i) for i in self.test_shape.areas])) == 3
+        assert len({round(i) for i in self.test_shape.areas}) == 3
 
         self.test_shape.rotation_angle = 180
         assert len(self.test_shape.areas) == 6
-        assert len(set([round(i) for i in self.test_shape.areas])) == 4
+        assert len({round(i) for i in self.test_shape.areas}) == 4
@@ -1,22 +1,25 @@
 
-import os
 import unittest
 import warnings
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 import paramak
 
 
 class TestBlanketFP(unittest.TestCase):
 
-    def setUp(self):
-        self.plasma = paramak.Plasma(
+    @classmethod
+    def setUpClass(cls):
+        # the plasma is only read by the blankets so it is shared by the tests
+        cls.plasma = paramak.Plasma(
             major_radius=450,
             minor_radius=150,
             triangularity=0.55,
             elongation=2
         )
 
+    def setUp(self):
         self.test_shape = paramak.BlanketFP(
             thickness=150,
             start_angle=-90,
@@ -56,28 +59,26 @@ class TestBlanketFP(unittest.TestCase):
         self.test_shape.offset_from_plasma = 30
 
         assert len(self.test_shape.areas) == 4
-        assert len(set([round(i) for i in self.test_shape.areas])) == 4
+        assert len({round(i) for i in self.test_shape.areas}) == 4
 
         self.test_shape.rotation_angle = 180
         assert len(self.test_shape.areas) == 6
-        assert len(set([round(i) for i in self.test_shape.areas])) == 5
+        assert len({round(i) for i in self.test_shape.areas}) == 5
 
     def test_creation_noplasma(self):
         """Checks that a cadquery solid can be created using the BlanketFP
-        parametric component when no plasma is passed."""
-
-        assert self.test_shape.solid is not None
-        assert self.test_shape.volume > 1000
+        parametric component when no plasma is passed and the thickness is a
+        float, a tuple of thicknesses or a thickness function."""
 
-    def test_creation_variable_thickness_from_tuple(self):
-        """Checks that a cadquery solid can be created using the BlanketFP
-        parametric component when a tuple of thicknesses is passed as an
-        argument."""
+        def thickness(theta):
+            return 10 + 0.1 * theta
 
-        self.test_shape.thickness = (100, 200)
+        for test_thickness in [150, (100, 200), thickness]:
+            with self.subTest(thickness=test_thickness):
+                self.test_shape.thickness = test_thickness
 
-        assert self.test_shape.solid is not None
-        assert self.test_shape.volume > 1000
+                assert self.test_shape.solid is not None
+                assert self.test_shape.volume > 1000
 
     def test_creation_variable_thickness_from_2_lists(self):
         """Checks that a cadquery solid can be created using the BlanketFP
@@ -88,19 +89,6 @@ class TestBlanketFP(unittest.TestCase):
 
         assert self.test_shape.solid is not None
 
-    def test_creation_variable_thickness_function(self):
-        """Checks that a cadquery solid can be created using the BlanketFP
-        parametric component when a thickness function is passed as an
-        argument."""
-
-        def thickness(theta):
-            return 10 + 0.1 * theta
-
-        self.test_shape.thickness = thickness
-
-        assert self.test_shape.solid is not None
-        assert self.test_shape.volume > 1000
-
     def test_creation_variable_offset_from_tuple(self):
         """Checks that a cadquery solid can be created using the BlanketFP
         parametric component when a tuple of offsets is passed as an
@@ -152,24 +140,24 @@ class TestBlanketFP(unittest.TestCase):
         checks that physical groups can be exported using the
         export_physical_groups method"""
 
-        outfile = "tests/blanket.json"
+        with TemporaryDirectory() as tmp_dir:
+            outfile = Path(tmp_dir) / "blanket.json"
 
-        # 180 coverage, full rotation
-        test_shape = paramak.BlanketFP(100, stop_angle=180, start_angle=0,)
-        test_shape.export_physical_groups(outfile)
+            # 180 coverage, full rotation
+            test_shape = paramak.BlanketFP(100, stop_angle=180, start_angle=0,)
+            test_shape.export_physical_groups(outfile)
 
-        # full coverage, 180 rotation
-        test_shape = paramak.BlanketFP(
-            100, stop_angle=0, start_angle=360,
-            rotation_angle=180)
-        test_shape.export_physical_groups(outfile)
+            # full coverage, 180 rotation
+            test_shape = paramak.BlanketFP(
+                100, stop_angle=0, start_angle=360,
+                rotation_angle=180)
+            test_shape.export_physical_groups(outfile)
 
-        # 180 coverage, 180 rotation
-        test_shape = paramak.BlanketFP(
-            100, stop_angle=180, start_angle=0,
-            rotation_angle=180)
-        test_shape.export_physical_groups(outfile)
-        os.system("rm " + outfile)
+            # 180 coverage, 180 rotation
+            test_shape = paramak.BlanketFP(
+                100, stop_angle=180, start_angle=0,
+                rotation_angle=180)
+            test_shape.export_physical_groups(outfile)
 
     def test_full_cov_stp_export(self):
         """Creates a blanket using the BlanketFP parametric component with full
@@ -180,9 +168,10 @@ class TestBlanketFP(unittest.TestCase):
         self.test_shape.start_angle = 0
         self.test_shape.stop_angle = 360
 
-        self.test_shape.export_stp("test_blanket_full_cov.stp")
-        assert Path("test_blanket_full_cov.stp").exists()
-        os.system("rm test_blanket_full_cov.stp")
+        with TemporaryDirectory() as tmp_dir:
+            filename = Path(tmp_dir) / "test_blanket_full_cov.stp"
+            self.test_shape.export_stp(filename)
+            assert filename.is_file()
 
     def test_full_cov_full_rotation(self):
         """Creates a blanket using the BlanketFP parametric component with full
@@ -193,9 +182,10 @@ class TestBlanketFP(unittest.TestCase):
         self.test_shape.start_angle = 0
         self.test_shape.stop_angle = 360
 
-        self.test_shape.export_stp("test_blanket_full_cov_full_rot.stp")
-        assert Path("test_blanket_full_cov_full_rot.stp").exists()
-        os.system("rm test_blanket_full_cov_full_rot.stp")
+        with TemporaryDirectory() as tmp_dir:
+            filename = Path(tmp_dir) / "test_blanket_full_cov_full_rot.stp"
+            self.test_shape.export_stp(filename)
+            assert filename.is_file()
 
     def test_overlapping(self):
         """Creates an overlapping geometry and checks that a warning is raised.
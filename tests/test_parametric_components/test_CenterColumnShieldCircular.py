@@ -43,8 +43,8 @@ class TestCenterColumnShieldCircular(unittest.TestCase):
         number of faces"""
 
         assert len(self.test_shape.areas) == 4
-        assert len(set([round(i) for i in self.test_shape.areas])) == 3
+        assert len({round(i) for i in self.test_shape.areas}) == 3
 
         self.test_shape.rotation_angle = 180
         assert len(self.test_shape.areas) == 6
-        assert len(set([round(i) for i in self.test_shape.areas])) == 4
+        assert len({round(i) for i in self.test_shape.areas}) == 4
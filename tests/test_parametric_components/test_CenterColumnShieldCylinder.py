@@ -1,8 +1,8 @@
 
 import math
-import os
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 import paramak
 import pytest
@@ -60,24 +60,26 @@ class TestCenterColumnShieldCylinder(unittest.TestCase):
         """Creates a CenterColumnShieldCylinder shape and checks that the
         areas of the faces of the solid created are correct"""
 
-        assert len(self.test_shape.areas) == 4
-        assert self.test_shape.area == pytest.approx((((math.pi * (200**2)) - (math.pi * (
-            100**2))) * 2) + (math.pi * (2 * 200) * 600) + (math.pi * (2 * 100) * 600))
-        assert self.test_shape.areas.count(pytest.approx(
-            (math.pi * (200**2)) - (math.pi * (100**2)))) == 2
-        assert self.test_shape.areas.count(
-            pytest.approx(math.pi * (2 * 200) * 600)) == 1
-        assert self.test_shape.areas.count(
-            pytest.approx(math.pi * (2 * 100) * 600)) == 1
+        end_area = (math.pi * (200**2)) - (math.pi * (100**2))
+        outer_area = math.pi * (2 * 200) * 600
+        inner_area = math.pi * (2 * 100) * 600
+
+        areas = self.test_shape.areas
+        assert len(areas) == 4
+        assert self.test_shape.area == pytest.approx(
+            end_area * 2 + outer_area + inner_area)
+        assert areas.count(pytest.approx(end_area)) == 2
+        assert areas.count(pytest.approx(outer_area)) == 1
+        assert areas.count(pytest.approx(inner_area)) == 1
 
     def test_export_stp_CenterColumnShieldCylinder(self):
         """Creates a CenterColumnShieldCylinder shape and checks that a stp
         file of the shape can be exported using the export_stp method."""
 
-        os.system("rm center_column_shield.stp")
-        self.test_shape.export_stp("center_column_shield.stp")
-        assert Path("center_column_shield.stp").exists()
-        os.system("rm center_column_shield.stp")
+        with TemporaryDirectory() as tmp_dir:
+            filename = Path(tmp_dir) / "center_column_shield.stp"
+            self.test_shape.export_stp(filename)
+            assert filename.is_file()
 
     def test_parametric_component_hash_value(self):
         """Creates a parametric component and checks that a cadquery solid with
@@ -72,8 +72,8 @@ class TestCenterColumnShieldFlatTopHyperbola(unittest.TestCase):
         that a solid is created with the correct number of faces."""
 
         assert len(self.test_shape.areas) == 6
-        assert len(set([round(i) for i in self.test_shape.areas])) == 4
+        assert len({round(i) for i in self.test_shape.areas}) == 4
 
         self.test_shape.rotation_angle = 180
         assert len(self.test_shape.areas) == 8
-        assert len(set([round(i) for i in self.test_shape.areas])) == 5
+        assert len({round(i) for i in self.test_shape.areas}) == 5
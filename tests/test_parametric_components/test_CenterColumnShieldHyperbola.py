@@ -67,8 +67,8 @@ class TestCenterColumnShieldHyperbola(unittest.TestCase):
         faces is created"""
 
         assert len(self.test_shape.areas) == 4
-        assert len(set([round(i) for i in self.test_shape.areas])) == 3
+        assert len({round(i) for i in self.test_shape.areas}) == 3
 
         self.test_shape.rotation_angle = 180
         assert len(self.test_shape.areas) == 6
-        assert len(set([round(i) for i in self.test_shape.areas])) == 4
+        assert len({round(i) for i in self.test_shape.areas}) == 4
@@ -8,6 +8,19 @@ import pytest
 
 class TestCoolantChannelRingStraight(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # the face and volume tests only read this shape so its solid is
+        # built once and shared between them
+        cls.xy_shape = paramak.CoolantChannelRingStraight(
+            height=100,
+            channel_radius=10,
+            ring_radius=70,
+            number_of_coolant_channels=8,
+            workplane="XY",
+            rotation_axis="Z"
+        )
+
     def setUp(self):
         self.test_shape = paramak.CoolantChannelRingStraight(
             height=100,
@@ -36,24 +49,18 @@ class TestCoolantChannelRingStraight(unittest.TestCase):
         """Creates a CoolantChannelRingStraight shape and checks that the areas of its faces
         are correct."""
 
-        self.test_shape.workplane = "XY"
-        self.test_shape.rotation_axis = "Z"
-
-        assert self.test_shape.area == pytest.approx(
+        assert self.xy_shape.area == pytest.approx(
             (((math.pi * (10**2)) * 2) + (math.pi * (10 * 2) * 100)) * 8)
-        assert len(self.test_shape.areas) == 24
-        assert self.test_shape.areas.count(
+        assert len(self.xy_shape.areas) == 24
+        assert self.xy_shape.areas.count(
             pytest.approx(math.pi * (10**2))) == 16
-        assert self.test_shape.areas.count(
+        assert self.xy_shape.areas.count(
             pytest.approx(math.pi * (10 * 2) * 100)) == 8
 
     def test_volume(self):
         """Creates CoolantChannelRingStraight shapes and checks that the volumes are correct."""
 
-        self.test_shape.workplane = "XY"
-        self.test_shape.rotation_axis = "Z"
-
-        assert self.test_shape.volume == pytest.approx(
+        assert self.xy_shape.volume == pytest.approx(
             math.pi * (10 ** 2) * 100 * 8)
 
     def test_start_angle(self):
@@ -7,25 +7,35 @@ import paramak
 import pytest
 
 
+# five fixed (height, radius, rotation_angle, azimuth_placement_angle)
+# samples so that a failing case can be reproduced
+_rng = random.Random(0)
+SAMPLES = [
+    (_rng.uniform(1., 2000.), _rng.uniform(1., 1000),
+     _rng.uniform(1., 360.), _rng.uniform(1., 360.))
+    for _ in range(5)
+]
+
+
 class TestCuttingWedge(unittest.TestCase):
     """Creates a random sized cutting wedge and changes the volume"""
 
     def test_volume_of_for_5_random_dimentions(self):
-        for test_number in range(5):
-            height = random.uniform(1., 2000.)
-            radius = random.uniform(1., 1000)
-            rotation_angle = random.uniform(1., 360.)
-            azimuth_placement_angle = random.uniform(1., 360.)
-
-            test_shape = paramak.CuttingWedge(
-                height=height,
-                radius=radius,
-                rotation_angle=rotation_angle,
-                azimuth_placement_angle=azimuth_placement_angle
-            )
-            angle_fraction = 360 / rotation_angle
-            correct_volume = (math.pi * radius ** 2 * height) / angle_fraction
-            assert test_shape.volume == pytest.approx(correct_volume)
+        for height, radius, rotation_angle, azimuth_placement_angle in SAMPLES:
+            with self.subTest(
+                    height=height,
+                    radius=radius,
+                    rotation_angle=rotation_angle):
+                test_shape = paramak.CuttingWedge(
+                    height=height,
+                    radius=radius,
+                    rotation_angle=rotation_angle,
+                    azimuth_placement_angle=azimuth_placement_angle
+                )
+                angle_fraction = 360 / rotation_angle
+                correct_volume = (
+                    math.pi * radius ** 2 * height) / angle_fraction
+                assert test_shape.volume == pytest.approx(correct_volume)
 
     def test_surface_reflectivity_in_neutronics_description(self):
         test_shape = paramak.CuttingWedge(
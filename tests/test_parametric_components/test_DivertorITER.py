@@ -1,25 +1,34 @@
 
 import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
 
 import paramak
 
 
 class TestDivertorITER(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # the shape is only read by the tests that use it, so the solid is
+        # built once and shared
+        cls.test_shape = paramak.ITERtypeDivertor()
+        cls.test_shape.solid
+
     def test_creation(self):
         """Creates an ITER-type divertor using the ITERtypeDivertor parametric
         component and checks that a cadquery solid is created"""
 
-        test_shape = paramak.ITERtypeDivertor()
-        assert test_shape.solid is not None
+        assert self.test_shape.solid is not None
 
     def test_stp_export(self):
         """Creates an ITER-type divertor using the ITERtypeDivertor parametric
         component and checks that a stp file of the shape can be exported using
         the export_stp method"""
 
-        test_shape = paramak.ITERtypeDivertor()
-        test_shape.export_stp("tests/ITER_div")
+        with TemporaryDirectory() as tmp_dir:
+            self.test_shape.export_stp(Path(tmp_dir) / "ITER_div")
+            assert (Path(tmp_dir) / "ITER_div.stp").is_file()
 
     def test_faces(self):
         """Creates an ITER-type divertor using the ITERtypeDivertor parametric
@@ -1,11 +1,26 @@
 
-import os
 import unittest
 import pytest
+import numpy as np
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 import paramak
 
+# (A, triangularity, elongation, minor radius, major radius, configuration)
+# for each of the PlasmaBoundaries x point test cases
+PLASMABOUNDARIES_X_POINT_CASES = [
+    (A, triangularity, elongation, minor_radius, major_radius, config)
+    for A, triangularity, elongation, minor_radius, major_radius in zip(
+        [0, 0.05, 0.05],
+        [-0.7, 0, 0.5],
+        [1, 1.5, 2],
+        [100, 200, 300],
+        [300, 400, 600],
+    )
+    for config in ["non-null", "single-null", "double-null"]
+]
+
 
 class TestPlasma(unittest.TestCase):
     def test_plasma_attributes(self):
@@ -16,36 +31,22 @@ class TestPlasma(unittest.TestCase):
 
         assert isinstance(test_plasma.elongation, float)
 
-        def test_plasma_elongation_min_setting():
-            """checks ValueError is raised when an elongation < 0 is specified"""
-
+        # checks ValueError is raised when an elongation < 0 is specified
+        with self.assertRaises(ValueError):
             test_plasma.elongation = -1
 
-        self.assertRaises(ValueError, test_plasma_elongation_min_setting)
-
-        def test_plasma_elongation_max_setting():
-            """checks ValueError is raised when an elongation > 4 is specified"""
-
+        # checks ValueError is raised when an elongation > 4 is specified
+        with self.assertRaises(ValueError):
             test_plasma.elongation = 400
 
-        self.assertRaises(ValueError, test_plasma_elongation_max_setting)
-
-        def minor_radius_out_of_range():
-            """checks ValueError is raised when an minor_radius < 1 is
-            specified"""
-
+        # checks ValueError is raised when an minor_radius < 1 is specified
+        with self.assertRaises(ValueError):
             test_plasma.minor_radius = 0.5
 
-        self.assertRaises(ValueError, minor_radius_out_of_range)
-
-        def major_radius_out_of_range():
-            """checks ValueError is raised when an manor_radius < 1 is
-            specified"""
-
+        # checks ValueError is raised when an major_radius < 1 is specified
+        with self.assertRaises(ValueError):
             test_plasma.major_radius = 0.5
 
-        self.assertRaises(ValueError, major_radius_out_of_range)
-
     def test_plasma_points_of_interest(self):
         test_plasma = paramak.Plasma(vertical_displacement=2)
         assert test_plasma.high_point == (
@@ -74,54 +75,48 @@ class TestPlasma(unittest.TestCase):
         Plasma parametric component and checks the location of the x point for
         each."""
 
-        for (
-            triangularity,
-            elongation,
-            minor_radius,
-            major_radius,
-            vertical_displacement,
-        ) in zip(
-            [-0.7, 0, 0.5],  # triangularity
-            [1, 1.5, 2],  # elongation
-            [100, 200, 300],  # minor radius
-            [300, 400, 600],  # major radius
-            [0, -10, 5],
-        ):  # displacement
+        # the x points are computed from the plasma attributes when accessed
+        # so a single plasma is reused for every configuration
+        test_plasma = paramak.Plasma()
+
+        triangularities = np.array([-0.7, 0, 0.5])
+        elongations = np.array([1, 1.5, 2])
+        minor_radii = np.array([100, 200, 300])
+        major_radii = np.array([300, 400, 600])
+        vertical_displacements = np.array([0, -10, 5])
+
+        # Expected x point coordinates for all the plasmas
+        shift = test_plasma.x_point_shift
+        expected_x_values = 1 - (1 + shift) * triangularities * minor_radii
+        expected_lower_z_values = \
+            -(1 + shift) * elongations * minor_radii + vertical_displacements
+        expected_upper_z_values = \
+            (1 + shift) * elongations * minor_radii + vertical_displacements
+
+        for i in range(len(triangularities)):
 
             for config in ["non-null", "single-null", "double-null"]:
 
                 # Run
-                test_plasma = paramak.Plasma(
-                    configuration=config,
-                    triangularity=triangularity,
-                    elongation=elongation,
-                    minor_radius=minor_radius,
-                    major_radius=major_radius,
-                    vertical_displacement=vertical_displacement,
-                )
+                test_plasma.configuration = config
+                test_plasma.triangularity = triangularities[i]
+                test_plasma.elongation = elongations[i]
+                test_plasma.minor_radius = minor_radii[i]
+                test_plasma.major_radius = major_radii[i]
+                test_plasma.vertical_displacement = vertical_displacements[i]
 
                 # Expected
                 expected_lower_x_point, expected_upper_x_point = None, None
                 if config == "single-null" or config == "double-null":
-                    expected_lower_x_point = (1 -
-                                              (1 +
-                                               test_plasma.x_point_shift) *
-                                              triangularity *
-                                              minor_radius, -
-                                              (1 +
-                                               test_plasma.x_point_shift) *
-                                              elongation *
-                                              minor_radius +
-                                              vertical_displacement, )
+                    expected_lower_x_point = (
+                        expected_x_values[i],
+                        expected_lower_z_values[i],
+                    )
 
                     if config == "double-null":
                         expected_upper_x_point = (
-                            expected_lower_x_point[0],
-                            (1 +
-                             test_plasma.x_point_shift) *
-                            elongation *
-                            minor_radius +
-                            vertical_displacement,
+                            expected_x_values[i],
+                            expected_upper_z_values[i],
                         )
 
                 # Check
@@ -136,38 +131,31 @@ class TestPlasma(unittest.TestCase):
         PlasmaBoundaries parametric component and checks the location of the x
         point for each."""
 
-        for A, triangularity, elongation, minor_radius, major_radius in zip(
-            [0, 0.05, 0.05],  # A
-            [-0.7, 0, 0.5],  # triangularity
-            [1, 1.5, 2],  # elongation
-            [100, 200, 300],  # minor radius
-            [300, 400, 600],
-        ):  # major radius
+        # the x points are computed from the plasma attributes when accessed
+        # so a single plasma is reused for every configuration
+        test_plasma = paramak.PlasmaBoundaries()
+        shift = test_plasma.x_point_shift
 
-            for config in ["non-null", "single-null", "double-null"]:
+        for (A, triangularity, elongation, minor_radius, major_radius,
+             config) in PLASMABOUNDARIES_X_POINT_CASES:
+
+            with self.subTest(A=A, configuration=config):
 
                 # Run
-                test_plasma = paramak.PlasmaBoundaries(
-                    configuration=config,
-                    A=A,
-                    triangularity=triangularity,
-                    elongation=elongation,
-                    minor_radius=minor_radius,
-                    major_radius=major_radius,
-                )
+                test_plasma.configuration = config
+                test_plasma.A = A
+                test_plasma.triangularity = triangularity
+                test_plasma.elongation = elongation
+                test_plasma.minor_radius = minor_radius
+                test_plasma.major_radius = major_radius
 
                 # Expected
                 expected_lower_x_point, expected_upper_x_point = None, None
                 if config == "single-null" or config == "double-null":
-                    expected_lower_x_point = (1 -
-                                              (1 +
-                                               test_plasma.x_point_shift) *
-                                              triangularity *
-                                              minor_radius, -
-                                              (1 +
-                                               test_plasma.x_point_shift) *
-                                              elongation *
-                                              minor_radius, )
+                    expected_lower_x_point = (
+                        1 - (1 + shift) * triangularity * minor_radius,
+                        -(1 + shift) * elongation * minor_radius,
+                    )
 
                     if config == "double-null":
                         expected_upper_x_point = (
@@ -196,12 +184,10 @@ class TestPlasma(unittest.TestCase):
 
         test_plasma = paramak.Plasma()
 
-        os.system("rm plasma.stp")
+        with TemporaryDirectory() as tmp_dir:
+            test_plasma.export_stp(Path(tmp_dir) / "plasma.stp")
 
-        test_plasma.export_stp("plasma.stp")
-
-        assert Path("plasma.stp").exists()
-        os.system("rm plasma.stp")
+            assert (Path(tmp_dir) / "plasma.stp").is_file()
 
     def test_export_plasma_from_points_export(self):
         """Creates a plasma using the PlasmaFromPoints parametric component
@@ -215,14 +201,12 @@ class TestPlasma(unittest.TestCase):
             rotation_angle=180,
         )
 
-        os.system("rm plasma.stp")
-
-        test_plasma.export_stp("plasma.stp")
-        assert test_plasma.high_point[0] > test_plasma.inner_equatorial_x_point
-        assert test_plasma.high_point[0] < test_plasma.outer_equatorial_x_point
-        assert test_plasma.outer_equatorial_x_point > test_plasma.inner_equatorial_x_point
-        assert Path("plasma.stp").exists()
-        os.system("rm plasma.stp")
+        with TemporaryDirectory() as tmp_dir:
+            test_plasma.export_stp(Path(tmp_dir) / "plasma.stp")
+            assert test_plasma.high_point[0] > test_plasma.inner_equatorial_x_point
+            assert test_plasma.high_point[0] < test_plasma.outer_equatorial_x_point
+            assert test_plasma.outer_equatorial_x_point > test_plasma.inner_equatorial_x_point
+            assert (Path(tmp_dir) / "plasma.stp").is_file()
 
     def test_plasma_relative_volume(self):
         """Creates plasmas using the Plasma parametric component and checks that
@@ -51,7 +51,7 @@ class TestPoloidalFieldCoil(unittest.TestCase):
         and checks that the areas are correct"""
 
         assert len(self.test_shape.areas) == 4
-        assert len(set([round(i) for i in self.test_shape.areas])) == 3
+        assert len({round(i) for i in self.test_shape.areas}) == 3
         assert self.test_shape.areas.count(
             pytest.approx(60 * math.pi * 2 * 1000)) == 2
         assert self.test_shape.areas.count(
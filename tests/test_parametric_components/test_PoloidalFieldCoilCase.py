@@ -55,7 +55,7 @@ class TestPoloidalFieldCoilCase(unittest.TestCase):
         component and checks that the areas of its faces are correct."""
 
         assert len(self.test_shape.areas) == 8
-        assert len(set([round(i) for i in self.test_shape.areas])) == 6
+        assert len({round(i) for i in self.test_shape.areas}) == 6
         assert self.test_shape.areas.count(
             pytest.approx(50 * math.pi * 2 * 1000)) == 2
         assert self.test_shape.areas.count(
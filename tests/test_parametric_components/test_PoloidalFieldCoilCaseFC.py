@@ -8,11 +8,15 @@ import pytest
 
 class TestPoloidalFieldCoilCaseFC(unittest.TestCase):
 
-    def setUp(self):
-        self.pf_coil = paramak.PoloidalFieldCoil(
+    @classmethod
+    def setUpClass(cls):
+        # the case only copies the dimensions of the coil so the coil is
+        # shared by the tests
+        cls.pf_coil = paramak.PoloidalFieldCoil(
             height=50, width=60, center_point=(1000, 500)
         )
 
+    def setUp(self):
         self.test_shape = paramak.PoloidalFieldCoilCaseFC(
             pf_coil=self.pf_coil, casing_thickness=5
         )
@@ -44,7 +48,7 @@ class TestPoloidalFieldCoilCaseFC(unittest.TestCase):
         component and checks that the areas of its faces are correct"""
 
         assert len(self.test_shape.areas) == 8
-        assert len(set([round(i) for i in self.test_shape.areas])) == 6
+        assert len({round(i) for i in self.test_shape.areas}) == 6
         assert self.test_shape.areas.count(
             pytest.approx(60 * math.pi * 2 * 1000)) == 2
         assert self.test_shape.areas.count(
@@ -80,7 +80,7 @@ class TestPoloidalFieldCoilCaseSetFC(unittest.TestCase):
         that the areas are correct"""
 
         assert len(self.test_shape.areas) == 32
-        assert len(set([round(i) for i in self.test_shape.areas])) == 16
+        assert len({round(i) for i in self.test_shape.areas}) == 16
         assert self.test_shape.areas.count(
             pytest.approx(10 * math.pi * 2 * 100)) == 6
         assert self.test_shape.areas.count(
@@ -1,4 +1,5 @@
 
+import math
 import unittest
 
 import paramak
@@ -96,3 +97,20 @@ class TestPoloidalSegments(unittest.TestCase):
         )
 
         assert test_shape.solid is not None
+
+    def test_points_with_vertical_segment_edge(self):
+        """Checks that no nan points are made when a segment edge is vertical
+        and lies beyond the zero line"""
+
+        # at this distance from the origin the point rotated by 90 degrees
+        # has exactly the same x value as the center point
+        test_shape = paramak.PoloidalSegments(
+            shape_to_segment=None,
+            center_point=(-1e6, 0),
+            max_distance_from_center=1000,
+            number_of_segments=4,
+        )
+
+        assert (0, 1000) in test_shape.points
+        for point in test_shape.points:
+            assert not any(math.isnan(value) for value in point)
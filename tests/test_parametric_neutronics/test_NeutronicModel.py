@@ -2,6 +2,7 @@
 import os
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 import neutronics_material_maker as nmm
 import openmc
@@ -27,11 +28,16 @@ class TestShape(unittest.TestCase):
         self.source.space = openmc.stats.Point((0, 0, 0))
         self.source.angle = openmc.stats.Isotropic()
 
+        # the simulations write their files to the working directory so
+        # each test is run in its own temporary one
+        tmp_dir = TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp_dir.name)
+
     def simulation_with_previous_h5m_file(self):
         """This performs a simulation using previously created h5m file"""
 
-        os.system('rm *.h5m')
-
         my_model = paramak.NeutronicsModel(
             geometry=self.my_shape,
             source=self.source,
@@ -119,9 +125,6 @@ class TestShape(unittest.TestCase):
         """Performs a neutronics simulation and checks the cell tally output
         file is created and named correctly"""
 
-        os.system('rm custom_name.json')
-        os.system('rm results.json')
-
         test_mat = openmc.Material()
         test_mat.add_element('Fe', 1.0)
         test_mat.set_density(units='g/cm3', density=4.2)
@@ -151,9 +154,10 @@ class TestShape(unittest.TestCase):
         assert Path('results.json').exists() is True
 
     def test_missing_dagmc_not_watertight_file(self):
+        """Calls _make_watertight without a dagmc_not_watertight.h5m file
+        which should raise an error"""
 
-        def missing_dagmc_not_watertight_file():
-            """Sets faceting_tolerance as a string which should raise an error"""
+        with self.assertRaises(ValueError):
             test_model = paramak.NeutronicsModel(
                 geometry=self.my_shape,
                 source=self.source,
@@ -162,15 +166,10 @@ class TestShape(unittest.TestCase):
 
             test_model._make_watertight()
 
-        self.assertRaises(
-            ValueError,
-            missing_dagmc_not_watertight_file
-        )
-
     def test_incorrect_faceting_tolerance(self):
+        """Sets faceting_tolerance as a string which should raise an error"""
 
-        def incorrect_faceting_tolerance():
-            """Sets faceting_tolerance as a string which should raise an error"""
+        with self.assertRaises(TypeError):
             paramak.NeutronicsModel(
                 geometry=self.my_shape,
                 source=self.source,
@@ -178,15 +177,10 @@ class TestShape(unittest.TestCase):
                 faceting_tolerance='coucou'
             )
 
-        self.assertRaises(
-            TypeError,
-            incorrect_faceting_tolerance
-        )
-
     def test_incorrect_faceting_tolerance_too_small(self):
+        """Set faceting_tolerance as a negative int which should raise an error"""
 
-        def incorrect_faceting_tolerance_too_small():
-            """Set faceting_tolerance as a negative int which should raise an error"""
+        with self.assertRaises(ValueError):
             paramak.NeutronicsModel(
                 geometry=self.my_shape,
                 source=self.source,
@@ -194,15 +188,10 @@ class TestShape(unittest.TestCase):
                 faceting_tolerance=-3
             )
 
-        self.assertRaises(
-            ValueError,
-            incorrect_faceting_tolerance_too_small
-        )
-
     def test_incorrect_merge_tolerance(self):
+        """Set merge_tolerance as a string which should raise an error"""
 
-        def incorrect_merge_tolerance():
-            """Set merge_tolerance as a string which should raise an error"""
+        with self.assertRaises(TypeError):
             paramak.NeutronicsModel(
                 geometry=self.my_shape,
                 source=self.source,
@@ -210,15 +199,10 @@ class TestShape(unittest.TestCase):
                 merge_tolerance='coucou'
             )
 
-        self.assertRaises(
-            TypeError,
-            incorrect_merge_tolerance
-        )
-
     def test_incorrect_merge_tolerance_too_small(self):
+        """Set merge_tolerance as a negative number which should raise an error"""
 
-        def incorrect_merge_tolerance_too_small():
-            """Set merge_tolerance as a negative number which should raise an error"""
+        with self.assertRaises(ValueError):
             paramak.NeutronicsModel(
                 geometry=self.my_shape,
                 source=self.source,
@@ -226,15 +210,10 @@ class TestShape(unittest.TestCase):
                 merge_tolerance=-3
             )
 
-        self.assertRaises(
-            ValueError,
-            incorrect_merge_tolerance_too_small
-        )
-
     def test_incorrect_cell_tallies(self):
+        """Set a cell tally that is not accepted which should raise an error"""
 
-        def incorrect_cell_tallies():
-            """Set a cell tally that is not accepted which should raise an error"""
+        with self.assertRaises(ValueError):
             paramak.NeutronicsModel(
                 geometry=self.my_shape,
                 source=self.source,
@@ -242,15 +221,10 @@ class TestShape(unittest.TestCase):
                 cell_tallies=['coucou'],
             )
 
-        self.assertRaises(
-            ValueError,
-            incorrect_cell_tallies
-        )
-
     def test_incorrect_cell_tally_type(self):
+        """Set a cell tally that is the wrong type which should raise an error"""
 
-        def incorrect_cell_tally_type():
-            """Set a cell tally that is the wrong type which should raise an error"""
+        with self.assertRaises(TypeError):
             paramak.NeutronicsModel(
                 geometry=self.my_shape,
                 source=self.source,
@@ -258,15 +232,10 @@ class TestShape(unittest.TestCase):
                 cell_tallies=1,
             )
 
-        self.assertRaises(
-            TypeError,
-            incorrect_cell_tally_type
-        )
-
     def test_incorrect_mesh_tally_2d(self):
+        """Set a mesh_tally_2d that is not accepted which should raise an error"""
 
-        def incorrect_mesh_tally_2d():
-            """Set a mesh_tally_2d that is not accepted which should raise an error"""
+        with self.assertRaises(ValueError):
             paramak.NeutronicsModel(
                 geometry=self.my_shape,
                 source=self.source,
@@ -274,15 +243,10 @@ class TestShape(unittest.TestCase):
                 mesh_tally_2d=['coucou'],
             )
 
-        self.assertRaises(
-            ValueError,
-            incorrect_mesh_tally_2d
-        )
-
     def test_incorrect_mesh_tally_2d_type(self):
+        """Set a mesh_tally_2d that is the wrong type which should raise an error"""
 
-        def incorrect_mesh_tally_2d_type():
-            """Set a mesh_tally_2d that is the wrong type which should raise an error"""
+        with self.assertRaises(TypeError):
             paramak.NeutronicsModel(
                 geometry=self.my_shape,
                 source=self.source,
@@ -290,15 +254,10 @@ class TestShape(unittest.TestCase):
                 mesh_tally_2d=1,
             )
 
-        self.assertRaises(
-            TypeError,
-            incorrect_mesh_tally_2d_type
-        )
-
     def test_incorrect_mesh_tally_3d(self):
+        """Set a mesh_tally_3d that is not accepted which should raise an error"""
 
-        def incorrect_mesh_tally_3d():
-            """Set a mesh_tally_3d that is not accepted which should raise an error"""
+        with self.assertRaises(ValueError):
             paramak.NeutronicsModel(
                 geometry=self.my_shape,
                 source=self.source,
@@ -306,15 +265,10 @@ class TestShape(unittest.TestCase):
                 mesh_tally_3d=['coucou'],
             )
 
-        self.assertRaises(
-            ValueError,
-            incorrect_mesh_tally_3d
-        )
-
     def test_incorrect_mesh_tally_3d_type(self):
+        """Set a mesh_tally_3d that is the wrong type which should raise an error"""
 
-        def incorrect_mesh_tally_3d_type():
-            """Set a mesh_tally_3d that is the wrong type which should raise an error"""
+        with self.assertRaises(TypeError):
             paramak.NeutronicsModel(
                 geometry=self.my_shape,
                 source=self.source,
@@ -322,30 +276,20 @@ class TestShape(unittest.TestCase):
                 mesh_tally_3d=1,
             )
 
-        self.assertRaises(
-            TypeError,
-            incorrect_mesh_tally_3d_type
-        )
-
     def test_incorrect_materials(self):
+        """Set a material as a string which should raise an error"""
 
-        def incorrect_materials():
-            """Set a material as a string which should raise an error"""
+        with self.assertRaises(TypeError):
             paramak.NeutronicsModel(
                 geometry=self.my_shape,
                 source=self.source,
                 materials='coucou',
             )
 
-        self.assertRaises(
-            TypeError,
-            incorrect_materials
-        )
-
     def test_incorrect_materials_type(self):
+        """Sets a material as an int which should raise an error"""
 
-        def incorrect_materials_type():
-            """Sets a material as an int which should raise an error"""
+        with self.assertRaises(TypeError):
             test_model = paramak.NeutronicsModel(
                 geometry=self.my_shape,
                 source=self.source,
@@ -354,15 +298,10 @@ class TestShape(unittest.TestCase):
 
             test_model.create_materials()
 
-        self.assertRaises(
-            TypeError,
-            incorrect_materials_type
-        )
-
     def test_incorrect_simulation_batches_to_small(self):
+        """Sets simulation batch below 2 which should raise an error"""
 
-        def incorrect_simulation_batches_to_small():
-            """Sets simulation batch below 2 which should raise an error"""
+        with self.assertRaises(ValueError):
             paramak.NeutronicsModel(
                 geometry=self.my_shape,
                 source=self.source,
@@ -370,15 +309,10 @@ class TestShape(unittest.TestCase):
                 simulation_batches=1
             )
 
-        self.assertRaises(
-            ValueError,
-            incorrect_simulation_batches_to_small
-        )
-
     def test_incorrect_simulation_batches_wrong_type(self):
+        """Sets simulation_batches as a string which should raise an error"""
 
-        def incorrect_simulation_batches_wrong_type():
-            """Sets simulation_batches as a string which should raise an error"""
+        with self.assertRaises(TypeError):
             paramak.NeutronicsModel(
                 geometry=self.my_shape,
                 source=self.source,
@@ -386,15 +320,10 @@ class TestShape(unittest.TestCase):
                 simulation_batches='one'
             )
 
-        self.assertRaises(
-            TypeError,
-            incorrect_simulation_batches_wrong_type
-        )
-
     def test_incorrect_simulation_particles_per_batch_wrong_type(self):
+        """Sets simulation_particles_per_batch below 2 which should raise an error"""
 
-        def incorrect_simulation_particles_per_batch_wrong_type():
-            """Sets simulation_particles_per_batch below 2 which should raise an error"""
+        with self.assertRaises(TypeError):
             paramak.NeutronicsModel(
                 geometry=self.my_shape,
                 source=self.source,
@@ -402,15 +331,9 @@ class TestShape(unittest.TestCase):
                 simulation_particles_per_batch='one'
             )
 
-        self.assertRaises(
-            TypeError,
-            incorrect_simulation_particles_per_batch_wrong_type
-        )
-
     def test_neutronics_component_cell_simulation_heating(self):
         """Makes a neutronics model and simulates with a cell tally"""
 
-        os.system('rm *.h5')
         mat = openmc.Material()
         mat.add_element('Li', 1)
         mat.set_density('g/cm3', 2.1)
@@ -455,9 +378,6 @@ class TestShape(unittest.TestCase):
     def test_neutronics_component_2d_mesh_simulation(self):
         """Makes a neutronics model and simulates with a 2D mesh tally"""
 
-        os.system('rm *_on_2D_mesh_*.png')
-        os.system('rm *.h5')
-
         # converts the geometry into a neutronics geometry
         my_model = paramak.NeutronicsModel(
             geometry=self.my_shape,
@@ -483,8 +403,6 @@ class TestShape(unittest.TestCase):
         """Makes a neutronics model and simulates with a 3D mesh tally and
         checks that the vtk file is produced"""
 
-        os.system('rm *.h5')
-
         # converts the geometry into a neutronics geometry
         my_model = paramak.NeutronicsModel(
             geometry=self.my_shape,
@@ -511,8 +429,6 @@ class TestShape(unittest.TestCase):
         and checks that the vtk and png files are produced. This checks the
         mesh ID values don't overlap"""
 
-        os.system('rm *.h5')
-
         # converts the geometry into a neutronics geometry
         my_model = paramak.NeutronicsModel(
             geometry=self.my_shape,
@@ -532,8 +448,6 @@ class TestShape(unittest.TestCase):
         and checks that the vtk and png files are produced. This checks the
         mesh ID values don't overlap"""
 
-        os.system('rm *.h5')
-
         # converts the geometry into a neutronics geometry
         my_model = paramak.NeutronicsModel(
             geometry=self.my_shape,
@@ -562,9 +476,11 @@ class TestNeutronicsBallReactor(unittest.TestCase):
     """Tests the NeutronicsModel with a BallReactor as the geometry input
     including neutronics simulations"""
 
-    def setUp(self):
-        # makes the 3d geometry
-        self.my_reactor = paramak.BallReactor(
+    @classmethod
+    def setUpClass(cls):
+        # the reactor, material and source are only read by the tests so they
+        # are made once and shared, which lets the reactor reuse its solids
+        cls.my_reactor = paramak.BallReactor(
             inner_bore_radial_thickness=1,
             inboard_tf_leg_radial_thickness=30,
             center_column_shield_radial_thickness=60,
@@ -582,20 +498,28 @@ class TestNeutronicsBallReactor(unittest.TestCase):
 
         # makes a homogenised material for the blanket from lithium lead and
         # eurofer
-        self.blanket_material = nmm.MultiMaterial(
+        cls.blanket_material = nmm.MultiMaterial(
             fracs=[0.8, 0.2],
             materials=[
                 nmm.Material('SiC'),
                 nmm.Material('eurofer')
             ])
 
-        self.source = openmc.Source()
+        cls.source = openmc.Source()
         # sets the location of the source to x=0 y=0 z=0
-        self.source.space = openmc.stats.Point((0, 0, 0))
+        cls.source.space = openmc.stats.Point((0, 0, 0))
         # sets the direction to isotropic
-        self.source.angle = openmc.stats.Isotropic()
+        cls.source.angle = openmc.stats.Isotropic()
         # sets the energy distribution to 100% 14MeV neutrons
-        self.source.energy = openmc.stats.Discrete([14e6], [1])
+        cls.source.energy = openmc.stats.Discrete([14e6], [1])
+
+    def setUp(self):
+        # the simulations write their files to the working directory so
+        # each test is run in its own temporary one
+        tmp_dir = TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp_dir.name)
 
     def test_neutronics_model_attributes(self):
         """Makes a BallReactor neutronics model and simulates the TBR"""
@@ -603,7 +527,7 @@ class TestNeutronicsBallReactor(unittest.TestCase):
         # makes the neutronics material
         neutronics_model = paramak.NeutronicsModel(
             geometry=self.my_reactor,
-            source=openmc.Source(),
+            source=self.source,
             materials={
                 'inboard_tf_coils_mat': 'copper',
                 'center_column_shield_mat': 'WC',
@@ -618,6 +542,8 @@ class TestNeutronicsBallReactor(unittest.TestCase):
 
         assert neutronics_model.geometry == self.my_reactor
 
+        assert neutronics_model.source is self.source
+
         assert neutronics_model.materials == {
             'inboard_tf_coils_mat': 'copper',
             'center_column_shield_mat': 'WC',
@@ -669,8 +595,6 @@ class TestNeutronicsBallReactor(unittest.TestCase):
         """Makes a reactor from two shapes, then mades a neutronics model
         and tests the TBR simulation value"""
 
-        os.system('rm *_on_2D_mesh_*.png')
-
         test_shape = paramak.RotateStraightShape(
             points=[(0, 0), (0, 20), (20, 20)],
             material_tag='mat1',
@@ -698,43 +622,36 @@ class TestNeutronicsBallReactor(unittest.TestCase):
         # starts the neutronics simulation using trelis
         neutronics_model.simulate(verbose=False, method='pymoab')
 
-        assert Path("n-Xt_on_2D_mesh_xz.png").exists() is True
-        assert Path("n-Xt_on_2D_mesh_xy.png").exists() is True
-        assert Path("n-Xt_on_2D_mesh_yz.png").exists() is True
-        assert Path("heating_on_2D_mesh_xz.png").exists() is True
-        assert Path("heating_on_2D_mesh_xy.png").exists() is True
-        assert Path("heating_on_2D_mesh_yz.png").exists() is True
-        assert Path("flux_on_2D_mesh_xz.png").exists() is True
-        assert Path("flux_on_2D_mesh_xy.png").exists() is True
-        assert Path("flux_on_2D_mesh_yz.png").exists() is True
+        expected_files = {
+            f"{tally}_on_2D_mesh_{plane}.png"
+            for tally in ["n-Xt", "heating", "flux"]
+            for plane in ["xz", "xy", "yz"]}
+        assert expected_files.issubset(
+            path.name for path in Path('.').iterdir())
 
     def test_incorrect_settings(self):
         """Creates NeutronicsModel objects and checks errors are
         raised correctly when arguments are incorrect."""
 
-        def test_incorrect_method():
-            """Makes a BallReactor neutronics model and simulates the TBR"""
-
-            # makes the neutronics material
-            neutronics_model = paramak.NeutronicsModel(
-                geometry=self.my_reactor,
-                source=self.source,
-                materials={
-                    'inboard_tf_coils_mat': 'copper',
-                    'center_column_shield_mat': 'WC',
-                    'divertor_mat': 'eurofer',
-                    'firstwall_mat': 'eurofer',
-                    'blanket_mat': 'FLiNaK',  # used as O18 is not in nndc nuc data
-                    'blanket_rear_wall_mat': 'eurofer'},
-                cell_tallies=['TBR', 'flux', 'heating'],
-                simulation_batches=42,
-                simulation_particles_per_batch=84,
-            )
+        # makes a BallReactor neutronics model with an incorrect method
+        neutronics_model = paramak.NeutronicsModel(
+            geometry=self.my_reactor,
+            source=self.source,
+            materials={
+                'inboard_tf_coils_mat': 'copper',
+                'center_column_shield_mat': 'WC',
+                'divertor_mat': 'eurofer',
+                'firstwall_mat': 'eurofer',
+                'blanket_mat': 'FLiNaK',  # used as O18 is not in nndc nuc data
+                'blanket_rear_wall_mat': 'eurofer'},
+            cell_tallies=['TBR', 'flux', 'heating'],
+            simulation_batches=42,
+            simulation_particles_per_batch=84,
+        )
 
+        with self.assertRaises(ValueError):
             neutronics_model.create_neutronics_geometry(method='incorrect')
 
-        self.assertRaises(ValueError, test_incorrect_method)
-
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,21 +1,15 @@
 
-import os
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 import paramak
+import pytest
 
 
 class TestReactorNeutronics(unittest.TestCase):
 
-    def test_export_h5m(self):
-        """Creates a Reactor object consisting of two shapes and checks a h5m
-        file of the reactor can be exported using the export_h5m method."""
-
-        os.system('rm small_dagmc.h5m')
-        os.system('rm small_dagmc_without_graveyard.h5m')
-        os.system('rm small_dagmc_with_graveyard.h5m')
-        os.system('rm large_dagmc.h5m')
+    def make_test_reactor(self):
         test_shape = paramak.RotateStraightShape(
             points=[(0, 0), (0, 20), (20, 20)],
             material_tag='mat1')
@@ -23,54 +17,61 @@ class TestReactorNeutronics(unittest.TestCase):
             points=[(0, 0), (0, 20), (20, 20)],
             material_tag='mat2')
         test_shape.rotation_angle = 360
-        test_reactor = paramak.Reactor([test_shape, test_shape2])
-        test_reactor.export_h5m(filename='small_dagmc.h5m', tolerance=0.01)
-        test_reactor.export_h5m(
-            filename='small_dagmc_without_graveyard.h5m',
-            tolerance=0.01,
-            skip_graveyard=True)
-        test_reactor.export_h5m(
-            filename='small_dagmc_with_graveyard.h5m',
-            tolerance=0.01,
-            skip_graveyard=False)
-        test_reactor.export_h5m(filename='large_dagmc.h5m', tolerance=0.001)
-
-        assert Path("small_dagmc.h5m").exists() is True
-        assert Path("small_dagmc_with_graveyard.h5m").exists() is True
-        assert Path("large_dagmc.h5m").exists() is True
-        assert Path("large_dagmc.h5m").stat().st_size > Path(
-            "small_dagmc.h5m").stat().st_size
-        assert Path("small_dagmc_without_graveyard.h5m").stat(
-        ).st_size < Path("small_dagmc.h5m").stat().st_size
+        return paramak.Reactor([test_shape, test_shape2])
+
+    def test_export_h5m_fast(self):
+        """Creates a Reactor object consisting of two shapes and checks a h5m
+        file of the reactor can be exported using the export_h5m method."""
+
+        with TemporaryDirectory() as tmp_dir:
+            small = Path(tmp_dir) / 'small_dagmc.h5m'
+            without_graveyard = (
+                Path(tmp_dir) / 'small_dagmc_without_graveyard.h5m')
+
+            test_reactor = self.make_test_reactor()
+            test_reactor.export_h5m(filename=str(small), tolerance=0.01)
+            test_reactor.export_h5m(
+                filename=str(without_graveyard),
+                tolerance=0.01,
+                skip_graveyard=True)
+
+            assert small.exists() is True
+            assert without_graveyard.exists() is True
+            assert without_graveyard.stat().st_size < small.stat().st_size
+
+            # the stl cache only keeps the facets of the latest export
+            assert len(test_reactor._stl_cache) == 2
+
+    @pytest.mark.slow
+    def test_export_h5m_refinement(self):
+        """Checks that a finer tolerance produces a larger h5m file. The fine
+        tessellation dominates the run time so this is marked as slow."""
+
+        with TemporaryDirectory() as tmp_dir:
+            small = Path(tmp_dir) / 'small_dagmc.h5m'
+            large = Path(tmp_dir) / 'large_dagmc.h5m'
+
+            test_reactor = self.make_test_reactor()
+            test_reactor.export_h5m(filename=str(small), tolerance=0.01)
+            test_reactor.export_h5m(filename=str(large), tolerance=0.001)
+
+            assert large.exists() is True
+            assert large.stat().st_size > small.stat().st_size
 
     def test_export_h5m_without_extension(self):
         """Tests that the code appends .h5m to the end of the filename"""
 
-        os.system('rm out.h5m')
-        test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)],
-            material_tag='mat1')
-        test_shape2 = paramak.RotateSplineShape(
-            points=[(0, 0), (0, 20), (20, 20)],
-            material_tag='mat2')
-        test_shape.rotation_angle = 360
-        test_reactor = paramak.Reactor([test_shape, test_shape2])
-        test_reactor.export_h5m(filename='out', tolerance=0.01)
-        assert Path("out.h5m").exists() is True
-        os.system('rm out.h5m')
+        test_reactor = self.make_test_reactor()
+        with TemporaryDirectory() as tmp_dir:
+            test_reactor.export_h5m(
+                filename=str(Path(tmp_dir) / 'out'), tolerance=0.01)
+            assert (Path(tmp_dir) / 'out.h5m').exists() is True
 
     def test_offset_from_graveyard_sets_attribute(self):
         """Creates a graveyard for a reactor and sets the graveyard_offset.
         Checks that the Reactor.graveyard_offset property is set"""
 
-        test_shape = paramak.RotateStraightShape(
-            points=[(0, 0), (0, 20), (20, 20)],
-            material_tag='mat1')
-        test_shape2 = paramak.RotateSplineShape(
-            points=[(0, 0), (0, 20), (20, 20)],
-            material_tag='mat2')
-        test_shape.rotation_angle = 360
-        test_reactor = paramak.Reactor([test_shape, test_shape2])
+        test_reactor = self.make_test_reactor()
         test_reactor.make_graveyard(graveyard_offset=101)
         assert test_reactor.graveyard_offset == 101
 
@@ -1,70 +1,80 @@
 
-import os
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
-import openmc
 import paramak
 import pytest
 
 
+def make_test_shape():
+    return paramak.ExtrudeMixedShape(
+        points=[
+            (50, 0, "straight"),
+            (50, 50, "spline"),
+            (60, 70, "spline"),
+            (70, 50, "circle"),
+            (60, 25, "circle"),
+            (70, 0, "straight")],
+        distance=50
+    )
+
+
 class TestObjectNeutronicsArguments(unittest.TestCase):
     """Tests Shape object arguments that involve neutronics usage"""
 
+    @classmethod
+    def setUpClass(cls):
+        # the h5m export with the default arguments is made once and shared
+        # by the tests that compare other exports against it
+        cls.tmp_dir = TemporaryDirectory()
+        cls.default_h5m = Path(cls.tmp_dir.name) / 'test_shape.h5m'
+        make_test_shape().export_h5m(filename=str(cls.default_h5m))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+
     def setUp(self):
-        self.test_shape = paramak.ExtrudeMixedShape(
-            points=[
-                (50, 0, "straight"),
-                (50, 50, "spline"),
-                (60, 70, "spline"),
-                (70, 50, "circle"),
-                (60, 25, "circle"),
-                (70, 0, "straight")],
-            distance=50
-        )
+        self.test_shape = make_test_shape()
+
+        tmp_dir = TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_path = Path(tmp_dir.name)
 
     def test_export_h5m_creates_file(self):
         """Tests the Shape.export_h5m method results in an outputfile."""
-        os.system('rm test_shape.h5m')
-        self.test_shape.export_h5m(filename='test_shape.h5m')
-        assert Path("test_shape.h5m").exists() is True
+        filename = self.tmp_path / 'test_shape.h5m'
+        returned_filename = self.test_shape.export_h5m(filename=str(filename))
+        assert returned_filename == str(filename)
+        assert filename.exists() is True
 
     def test_export_h5m_creates_file_even_without_extention(self):
         """Tests the Shape.export_h5m method results in an outputfile even
         when the filename does not include the .h5m"""
-        os.system('rm test_shape.h5m')
-        self.test_shape.export_h5m(filename='test_shape')
-        assert Path("test_shape.h5m").exists() is True
+        self.test_shape.export_h5m(filename=str(self.tmp_path / 'test_shape'))
+        assert (self.tmp_path / 'test_shape.h5m').exists() is True
 
     def test_offset_from_graveyard_sets_attribute(self):
-        os.system('rm test_shape.h5m')
         self.test_shape.export_h5m(
-            filename='test_shape.h5m',
+            filename=str(self.tmp_path / 'test_shape.h5m'),
             graveyard_offset=101)
         assert self.test_shape.graveyard_offset == 101
 
     def test_tolerance_increases_filesize(self):
-        os.system('rm test_shape.h5m')
-        self.test_shape.export_h5m(
-            filename='test_shape_0001.h5m',
-            tolerance=0.001)
-        self.test_shape.export_h5m(
-            filename='test_shape_001.h5m',
-            tolerance=0.01)
-        assert Path('test_shape_0001.h5m').stat().st_size > Path(
-            'test_shape_001.h5m').stat().st_size
+        # the shared default export uses a tolerance of 0.001
+        filename = self.tmp_path / 'test_shape_001.h5m'
+        self.test_shape.export_h5m(filename=str(filename), tolerance=0.01)
+        assert self.default_h5m.stat().st_size > filename.stat().st_size
 
     def test_skipping_graveyard_decreases_filesize(self):
-        os.system('rm test_shape.h5m')
-        self.test_shape.export_h5m(filename='skiped.h5m', skip_graveyard=True)
+        # the shared default export includes the graveyard
+        filename = self.tmp_path / 'skiped.h5m'
         self.test_shape.export_h5m(
-            filename='not_skipped.h5m',
-            skip_graveyard=False)
-        assert Path('not_skipped.h5m').stat().st_size > Path(
-            'skiped.h5m').stat().st_size
+            filename=str(filename), skip_graveyard=True)
+        assert self.default_h5m.stat().st_size > filename.stat().st_size
 
     def test_graveyard_offset_increases_voulme(self):
-        os.system('rm test_shape.h5m')
         self.test_shape.make_graveyard(graveyard_offset=100)
         small_offset = self.test_shape.graveyard.volume
         self.test_shape.make_graveyard(graveyard_offset=1000)
@@ -78,6 +88,7 @@ class TestSimulationResultsVsCsg(unittest.TestCase):
 
     def simulate_cylinder_cask_csg(
             self,
+            openmc,
             material,
             source,
             height,
@@ -85,7 +96,8 @@ class TestSimulationResultsVsCsg(unittest.TestCase):
             thickness,
             batches,
             particles):
-        """Makes a CSG cask geometry runs a simulation and returns the result"""
+        """Makes a CSG cask geometry runs a simulation and returns the result.
+        The openmc module is passed in by the test that imports it."""
 
         mats = openmc.Materials([material])
 
@@ -222,6 +234,10 @@ class TestSimulationResultsVsCsg(unittest.TestCase):
     def test_cylinder_cask(self):
         """Runs the same source and material with CAD and CSG geoemtry"""
 
+        # openmc is only imported by the simulation tests so that the h5m
+        # export tests above can be collected and run without it
+        openmc = pytest.importorskip("openmc")
+
         height = 100
         outer_radius = 50
         thickness = 10
@@ -240,7 +256,8 @@ class TestSimulationResultsVsCsg(unittest.TestCase):
         source.energy = openmc.stats.Discrete([14e6], [1.0])
 
         csg_result = self.simulate_cylinder_cask_csg(
-            test_material, source, height, outer_radius, thickness, batches, particles)
+            openmc, test_material, source, height, outer_radius, thickness,
+            batches, particles)
 
         cad_result = self.simulate_cylinder_cask_cad(
             test_material, source, height, outer_radius, thickness, batches, particles)
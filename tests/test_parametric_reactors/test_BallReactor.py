@@ -1,9 +1,9 @@
 
-import os
 import time
 import unittest
 import warnings
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 import paramak
 
@@ -50,10 +50,10 @@ class TestBallReactor(unittest.TestCase):
         """Creates a BallReactor and checks that an svg image of the reactor can be
         exported using the export_svg method."""
 
-        os.system("rm test_ballreactor_image.svg")
-        self.test_reactor.export_svg("filename.svg")
-        assert Path("filename.svg").exists() is True
-        os.system("rm filename.svg")
+        with TemporaryDirectory() as tmp_dir:
+            filename = Path(tmp_dir) / "filename.svg"
+            self.test_reactor.export_svg(str(filename))
+            assert filename.exists() is True
 
     def test_with_pf_coils(self):
         """Checks that a BallReactor with optional pf coils can be created and that
@@ -230,18 +230,19 @@ class TestBallReactor(unittest.TestCase):
         """Exports and stp file with mode = solid and wire and checks
         that the outputs folders exist."""
 
-        os.system("rm -rf reactor_solids")
-        os.system("rm -rf reactor_wires")
+        with TemporaryDirectory() as tmp_dir:
+            solids_folder = Path(tmp_dir) / "reactor_solids"
+            wires_folder = Path(tmp_dir) / "reactor_wires"
 
-        self.test_reactor.export_stp(
-            output_folder='reactor_solids',
-            mode='solid'
-        )
+            self.test_reactor.export_stp(
+                output_folder=str(solids_folder),
+                mode='solid'
+            )
 
-        self.test_reactor.export_stp(
-            output_folder='reactor_wires',
-            mode='wire'
-        )
+            self.test_reactor.export_stp(
+                output_folder=str(wires_folder),
+                mode='wire'
+            )
 
-        assert Path("reactor_wires").exists() is True
-        assert Path("reactor_solids").exists() is True
+            assert wires_folder.exists() is True
+            assert solids_folder.exists() is True
@@ -1,8 +1,8 @@
 
-import os
 import unittest
 import warnings
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 import paramak
 import pytest
@@ -45,10 +45,10 @@ class TestCenterColumnStudyReactor(unittest.TestCase):
         """Creates a ball reactor using the CenterColumnStudyReactor parametric_reactor and checks
         an svg image of the reactor can be exported."""
 
-        os.system("rm test_image.svg")
-        self.test_reactor.export_svg("test_image.svg")
-        assert Path("test_image.svg").exists() is True
-        os.system("rm test_image.svg")
+        with TemporaryDirectory() as tmp_dir:
+            filename = Path(tmp_dir) / "test_image.svg"
+            self.test_reactor.export_svg(str(filename))
+            assert filename.exists() is True
 
     def test_rotation_angle_impacts_volume(self):
         """Creates a CenterColumnStudyReactor reactor with a rotation angle of
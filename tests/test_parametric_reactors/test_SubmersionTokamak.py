@@ -1,161 +1,73 @@
 
-import os
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 import paramak
 import pytest
 
 
+# the keyword arguments shared by all the SubmersionTokamaks in these tests
+BASE_KWARGS = {
+    "inner_bore_radial_thickness": 10,
+    "inboard_tf_leg_radial_thickness": 30,
+    "center_column_shield_radial_thickness": 60,
+    "divertor_radial_thickness": 50,
+    "inner_plasma_gap_radial_thickness": 30,
+    "plasma_radial_thickness": 300,
+    "outer_plasma_gap_radial_thickness": 30,
+    "firstwall_radial_thickness": 30,
+    "blanket_rear_wall_radial_thickness": 30,
+    "number_of_tf_coils": 16,
+    "support_radial_thickness": 20,
+    "inboard_blanket_radial_thickness": 20,
+    "outboard_blanket_radial_thickness": 20,
+    "elongation": 2.3,
+    "triangularity": 0.45,
+    "rotation_angle": 359,
+}
+
+TF_COIL_KWARGS = {
+    "outboard_tf_coil_radial_thickness": 50,
+    "tf_coil_to_rear_blanket_radial_gap": 50,
+    "outboard_tf_coil_poloidal_thickness": 70,
+    "number_of_tf_coils": 4,
+}
+
+PF_COIL_KWARGS = {
+    "pf_coil_vertical_thicknesses": [50, 50, 50, 50, 50],
+    "pf_coil_radial_thicknesses": [40, 40, 40, 40, 40],
+    "pf_coil_to_tf_coil_radial_gap": 50,
+    "pf_coil_case_thickness": 10,
+}
+
+STP_FILENAMES = [
+    "inboard_tf_coils.stp",
+    "center_column_shield.stp",
+    "plasma.stp",
+    "divertor.stp",
+    "outboard_firstwall.stp",
+    "supports.stp",
+    "blanket.stp",
+    "outboard_rear_blanket_wall.stp",
+    "Graveyard.stp",
+]
+
+
 class TestSubmersionTokamak(unittest.TestCase):
 
     def setUp(self):
-        self.test_reactor = paramak.SubmersionTokamak(
-            inner_bore_radial_thickness=10,
-            inboard_tf_leg_radial_thickness=30,
-            center_column_shield_radial_thickness=60,
-            divertor_radial_thickness=50,
-            inner_plasma_gap_radial_thickness=30,
-            plasma_radial_thickness=300,
-            outer_plasma_gap_radial_thickness=30,
-            firstwall_radial_thickness=30,
-            blanket_rear_wall_radial_thickness=30,
-            number_of_tf_coils=16,
-            support_radial_thickness=20,
-            inboard_blanket_radial_thickness=20,
-            outboard_blanket_radial_thickness=20,
-            elongation=2.3,
-            triangularity=0.45,
-            rotation_angle=359,
-        )
+        self.test_reactor = paramak.SubmersionTokamak(**BASE_KWARGS)
 
     def test_svg_creation(self):
         """Creates a SubmersionTokamak and checks that an svg file of the reactor
         can be exported using the export_svg method."""
 
-        os.system("rm test_image.svg")
-        self.test_reactor.export_svg("test_image.svg")
-
-        assert Path("test_image.svg").exists() is True
-        os.system("rm test_image.svg")
-
-    def test_minimal_creation(self):
-        """Creates a SubmersionTokamak and checks that the correct number of
-        components are created."""
-
-        assert len(self.test_reactor.shapes_and_components) == 8
-
-    def test_with_tf_coils_creation(self):
-        """Creates a SubmersionTokamak with tf coils and checks that the correct
-        number of components are created."""
-
-        self.test_reactor.outboard_tf_coil_radial_thickness = 50
-        self.test_reactor.tf_coil_to_rear_blanket_radial_gap = 50
-        self.test_reactor.outboard_tf_coil_poloidal_thickness = 70
-        self.test_reactor.number_of_tf_coils = 4
-
-        assert len(self.test_reactor.shapes_and_components) == 9
-
-    def test_with_tf_and_pf_coils_creation(self):
-        """Creates a SubmersionTokamak with tf and pf coils and checks that the
-        correct number of components are created."""
-
-        self.test_reactor.outboard_tf_coil_radial_thickness = 50
-        self.test_reactor.tf_coil_to_rear_blanket_radial_gap = 50
-        self.test_reactor.outboard_tf_coil_poloidal_thickness = 70
-        self.test_reactor.pf_coil_vertical_thicknesses = [50, 50, 50, 50, 50]
-        self.test_reactor.pf_coil_radial_thicknesses = [40, 40, 40, 40, 40]
-        self.test_reactor.pf_coil_to_tf_coil_radial_gap = 50
-        self.test_reactor.pf_coil_case_thickness = 10
-        self.test_reactor.number_of_tf_coils = 4
-
-        assert len(self.test_reactor.shapes_and_components) == 11
-
-    def test_minimal_stp_creation(self):
-        """Creates a SubmersionTokamak and checks that stp files of all components
-        can be exported using the export_stp method."""
-
-        os.system("rm -r minimal_SubmersionTokamak")
-        self.test_reactor.export_stp("minimal_SubmersionTokamak")
-
-        output_filenames = [
-            "minimal_SubmersionTokamak/inboard_tf_coils.stp",
-            "minimal_SubmersionTokamak/center_column_shield.stp",
-            "minimal_SubmersionTokamak/plasma.stp",
-            "minimal_SubmersionTokamak/divertor.stp",
-            "minimal_SubmersionTokamak/outboard_firstwall.stp",
-            "minimal_SubmersionTokamak/supports.stp",
-            "minimal_SubmersionTokamak/blanket.stp",
-            "minimal_SubmersionTokamak/outboard_rear_blanket_wall.stp",
-            "minimal_SubmersionTokamak/Graveyard.stp",
-        ]
-
-        for output_filename in output_filenames:
-            assert Path(output_filename).exists() is True
-        os.system("rm -r minimal_SubmersionTokamak")
-
-    def test_with_pf_coils_stp_creation(self):
-        """Creates a SubmersionTokamak with pf coils and checks that stp files
-        of all components can be exported using the export_stp method."""
-
-        os.system("rm -r pf_SubmersionTokamak")
-
-        self.test_reactor.outboard_tf_coil_radial_thickness = 50
-        self.test_reactor.tf_coil_to_rear_blanket_radial_gap = 50
-        self.test_reactor.outboard_tf_coil_poloidal_thickness = 70
-        self.test_reactor.number_of_tf_coils = 4
-
-        self.test_reactor.export_stp("pf_SubmersionTokamak")
-
-        output_filenames = [
-            "pf_SubmersionTokamak/inboard_tf_coils.stp",
-            "pf_SubmersionTokamak/center_column_shield.stp",
-            "pf_SubmersionTokamak/plasma.stp",
-            "pf_SubmersionTokamak/divertor.stp",
-            "pf_SubmersionTokamak/outboard_firstwall.stp",
-            "pf_SubmersionTokamak/supports.stp",
-            "pf_SubmersionTokamak/blanket.stp",
-            "pf_SubmersionTokamak/outboard_rear_blanket_wall.stp",
-            "pf_SubmersionTokamak/Graveyard.stp",
-        ]
-
-        for output_filename in output_filenames:
-            assert Path(output_filename).exists() is True
-        os.system("rm -r pf_SubmersionTokamak")
-
-    def test_with_tf_and_pf_coils_stp_creation(self):
-        """Creates a SubmersionTokamak with tf and pf coils and checks that
-        stp files of all components can be exported using the export_stp method."""
+        with TemporaryDirectory() as tmp_dir:
+            filename = Path(tmp_dir) / "test_image.svg"
+            self.test_reactor.export_svg(str(filename))
 
-        os.system("rm -r tf_pf_SubmersionTokamak")
-
-        self.test_reactor.outboard_tf_coil_radial_thickness = 50
-        self.test_reactor.tf_coil_to_rear_blanket_radial_gap = 50
-        self.test_reactor.outboard_tf_coil_poloidal_thickness = 70
-        self.test_reactor.pf_coil_vertical_thicknesses = [50, 50, 50, 50, 50]
-        self.test_reactor.pf_coil_radial_thicknesses = [40, 40, 40, 40, 40]
-        self.test_reactor.pf_coil_to_tf_coil_radial_gap = 50
-        self.test_reactor.pf_coil_case_thickness = 10
-        self.test_reactor.number_of_tf_coils = 4
-
-        self.test_reactor.export_stp("tf_pf_SubmersionTokamak")
-
-        output_filenames = [
-            "tf_pf_SubmersionTokamak/inboard_tf_coils.stp",
-            "tf_pf_SubmersionTokamak/center_column_shield.stp",
-            "tf_pf_SubmersionTokamak/plasma.stp",
-            "tf_pf_SubmersionTokamak/divertor.stp",
-            "tf_pf_SubmersionTokamak/outboard_firstwall.stp",
-            "tf_pf_SubmersionTokamak/supports.stp",
-            "tf_pf_SubmersionTokamak/blanket.stp",
-            "tf_pf_SubmersionTokamak/outboard_rear_blanket_wall.stp",
-            "tf_pf_SubmersionTokamak/Graveyard.stp",
-            "tf_pf_SubmersionTokamak/pf_coil_cases.stp"
-        ]
-
-        for output_filename in output_filenames:
-            assert Path(output_filename).exists() is True
-        os.system("rm -r tf_pf_SubmersionTokamak")
+            assert filename.exists() is True
 
     def test_rotation_angle_warning(self):
         """Creates a SubmersionTokamak with rotation_angle = 360 and checks that the
@@ -271,3 +183,46 @@ class TestSubmersionTokamak(unittest.TestCase):
         self.test_reactor.divertor_position = "upper"
         self.test_reactor.support_position = "upper"
         assert self.test_reactor.solid is not None
+
+
+class TestSubmersionTokamakVariants(unittest.TestCase):
+    """Builds each combination of optional coils once and shares the
+    reactors between the component count and stp export tests."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.minimal_reactor = paramak.SubmersionTokamak(**BASE_KWARGS)
+        cls.tf_reactor = paramak.SubmersionTokamak(
+            **{**BASE_KWARGS, **TF_COIL_KWARGS})
+        cls.tf_pf_reactor = paramak.SubmersionTokamak(
+            **{**BASE_KWARGS, **TF_COIL_KWARGS, **PF_COIL_KWARGS})
+
+    def test_minimal_creation(self):
+        """Creates a SubmersionTokamak and checks that the correct number of
+        components are created."""
+
+        assert len(self.minimal_reactor.shapes_and_components) == 8
+
+    def test_with_tf_coils_creation(self):
+        """Creates a SubmersionTokamak with tf coils and checks that the correct
+        number of components are created."""
+
+        assert len(self.tf_reactor.shapes_and_components) == 9
+
+    def test_with_tf_and_pf_coils_creation(self):
+        """Creates a SubmersionTokamak with tf and pf coils and checks that the
+        correct number of components are created."""
+
+        assert len(self.tf_pf_reactor.shapes_and_components) == 11
+
+    def test_with_tf_and_pf_coils_stp_creation(self):
+        """Creates a SubmersionTokamak with tf and pf coils and checks that
+        stp files of all components can be exported using the export_stp
+        method. This is the only variant that is exported as its components
+        include those of the other variants."""
+
+        with TemporaryDirectory() as tmp_dir:
+            self.tf_pf_reactor.export_stp(tmp_dir)
+
+            for output_filename in STP_FILENAMES + ["pf_coil_cases.stp"]:
+                assert (Path(tmp_dir) / output_filename).exists() is True
@@ -1,7 +1,7 @@
 import math
-import os
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 import pytest
 from paramak import ExtrudeCircleShape
@@ -98,22 +98,21 @@ class TestExtrudeCircleShape(unittest.TestCase):
         """Exports and stp file with mode = solid and wire and checks
         that the outputs exist and relative file sizes are correct."""
 
-        os.system("rm test_solid.stp test_solid2.stp test_wire.stp")
+        with TemporaryDirectory() as tmp_dir:
+            test_solid = Path(tmp_dir) / "test_solid.stp"
+            test_solid2 = Path(tmp_dir) / "test_solid2.stp"
+            test_wire = Path(tmp_dir) / "test_wire.stp"
 
-        self.test_shape.export_stp('test_solid.stp', mode='solid')
-        self.test_shape.export_stp('test_solid2.stp')
-        self.test_shape.export_stp('test_wire.stp', mode='wire')
+            self.test_shape.export_stp(str(test_solid), mode='solid')
+            self.test_shape.export_stp(str(test_solid2))
+            self.test_shape.export_stp(str(test_wire), mode='wire')
 
-        assert Path("test_solid.stp").exists() is True
-        assert Path("test_solid2.stp").exists() is True
-        assert Path("test_wire.stp").exists() is True
+            assert test_solid.exists() is True
+            assert test_solid2.exists() is True
+            assert test_wire.exists() is True
 
-        assert Path("test_solid.stp").stat().st_size == \
-            Path("test_solid2.stp").stat().st_size
-        assert Path("test_wire.stp").stat().st_size < \
-            Path("test_solid2.stp").stat().st_size
-
-        os.system("rm test_solid.stp test_solid2.stp test_wire.stp")
+            assert test_solid.stat().st_size == test_solid2.stat().st_size
+            assert test_wire.stat().st_size < test_solid2.stat().st_size
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 
-import os
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 import pytest
 from paramak import ExtrudeMixedShape
@@ -44,7 +44,7 @@ class TestExtrudeMixedShape(unittest.TestCase):
 
         self.test_shape.extrude_both = False
         assert len(self.test_shape.areas) == 6
-        assert len(set([round(i) for i in self.test_shape.areas])) == 5
+        assert len({round(i) for i in self.test_shape.areas}) == 5
 
     def test_cut_volume(self):
         """Creates an ExtrudeMixedShape with another ExtrudeMixedShape cut out and
@@ -89,27 +89,22 @@ class TestExtrudeMixedShape(unittest.TestCase):
         """Creates an ExtrudeMixedShape and checks that a stp file of the shape
         can be exported with the correct suffix using the export_stp method."""
 
-        os.system("rm filename.stp filename.step")
-        self.test_shape.export_stp("filename.stp")
-        self.test_shape.export_stp("filename.step")
-        assert Path("filename.stp").exists() is True
-        assert Path("filename.step").exists() is True
-        os.system("rm filename.stp filename.step")
-        self.test_shape.export_stp("filename")
-        assert Path("filename.stp").exists() is True
-        os.system("rm filename.stp")
+        for filename, expected in [
+                ("filename.stp", "filename.stp"),
+                ("filename.step", "filename.step"),
+                ("filename", "filename.stp")]:
+            with TemporaryDirectory() as tmp_dir:
+                self.test_shape.export_stp(str(Path(tmp_dir) / filename))
+                assert (Path(tmp_dir) / expected).exists() is True
 
     def test_export_stl(self):
         """Creates a ExtrudeMixedShape and checks that a stl file of the shape
         can be exported with the correct suffix using the export_stl method."""
 
-        os.system("rm filename.stl")
-        self.test_shape.export_stl("filename.stl")
-        assert Path("filename.stl").exists() is True
-        os.system("rm filename.stl")
-        self.test_shape.export_stl("filename")
-        assert Path("filename.stl").exists() is True
-        os.system("rm filename.stl")
+        for filename in ["filename.stl", "filename"]:
+            with TemporaryDirectory() as tmp_dir:
+                self.test_shape.export_stl(str(Path(tmp_dir) / filename))
+                assert (Path(tmp_dir) / "filename.stl").exists() is True
 
     def test_rotation_angle(self):
         """Creates an ExtrudeMixedShape with a rotation_angle < 360 and checks that
@@ -134,22 +129,21 @@ class TestExtrudeMixedShape(unittest.TestCase):
         """Exports and stp file with mode = solid and wire and checks
         that the outputs exist and relative file sizes are correct."""
 
-        os.system("rm test_solid.stp test_solid2.stp test_wire.stp")
+        with TemporaryDirectory() as tmp_dir:
+            test_solid = Path(tmp_dir) / "test_solid.stp"
+            test_solid2 = Path(tmp_dir) / "test_solid2.stp"
+            test_wire = Path(tmp_dir) / "test_wire.stp"
 
-        self.test_shape.export_stp('test_solid.stp', mode='solid')
-        self.test_shape.export_stp('test_solid2.stp')
-        self.test_shape.export_stp('test_wire.stp', mode='wire')
+            self.test_shape.export_stp(str(test_solid), mode='solid')
+            self.test_shape.export_stp(str(test_solid2))
+            self.test_shape.export_stp(str(test_wire), mode='wire')
 
-        assert Path("test_solid.stp").exists() is True
-        assert Path("test_solid2.stp").exists() is True
-        assert Path("test_wire.stp").exists() is True
+            assert test_solid.exists() is True
+            assert test_solid2.exists() is True
+            assert test_wire.exists() is True
 
-        assert Path("test_solid.stp").stat().st_size == \
-            Path("test_solid2.stp").stat().st_size
-        assert Path("test_wire.stp").stat().st_size < \
-            Path("test_solid2.stp").stat().st_size
-
-        os.system("rm test_solid.stp test_solid2.stp test_wire.stp")
+            assert test_solid.stat().st_size == test_solid2.stat().st_size
+            assert test_wire.stat().st_size < test_solid2.stat().st_size
 
 
 if __name__ == "__main__":
@@ -1,46 +1,53 @@
 
-import os
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 import pytest
 from paramak import ExtrudeSplineShape
 
 
+POINTS = [(50, 0), (50, 20), (70, 80), (90, 50), (70, 0), (90, -50),
+          (70, -80), (50, -20)]
+
+
 class TestExtrudeSplineShape(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # shared by the tests that do not change the shape so that its solid
+        # is only built once, tests that change the shape use self.test_shape
+        cls.shared_shape = ExtrudeSplineShape(points=POINTS, distance=30)
+
     def setUp(self):
-        self.test_shape = ExtrudeSplineShape(
-            points=[(50, 0), (50, 20), (70, 80), (90, 50), (70, 0), (90, -50),
-                    (70, -80), (50, -20)], distance=30
-        )
+        self.test_shape = ExtrudeSplineShape(points=POINTS, distance=30)
 
     def test_default_parameters(self):
         """Checks that the default parameters of an ExtrudeSplineShape are correct."""
 
-        assert self.test_shape.rotation_angle == 360
-        assert self.test_shape.stp_filename == "ExtrudeSplineShape.stp"
-        assert self.test_shape.stl_filename == "ExtrudeSplineShape.stl"
-        assert self.test_shape.extrude_both
+        assert self.shared_shape.rotation_angle == 360
+        assert self.shared_shape.stp_filename == "ExtrudeSplineShape.stp"
+        assert self.shared_shape.stl_filename == "ExtrudeSplineShape.stl"
+        assert self.shared_shape.extrude_both
 
     def test_absolute_shape_volume(self):
         """Creates an ExtrudeSplineShape and checks that the volume is correct."""
 
-        assert self.test_shape.solid is not None
-        assert self.test_shape.volume > 20 * 20 * 30
+        assert self.shared_shape.solid is not None
+        assert self.shared_shape.volume > 20 * 20 * 30
 
     def test_shape_face_areas(self):
         """Creates an ExtrudeSplineShape and checks that the face areas are expected."""
 
         self.test_shape.extrude_both = False
         assert len(self.test_shape.areas) == 3
-        assert len(set([round(i) for i in self.test_shape.areas])) == 2
+        assert len({round(i) for i in self.test_shape.areas}) == 2
 
     def test_relative_shape_volume(self):
         """Creates two ExtrudeSplineShapes and checks that their relative volumes
         are correct."""
 
-        test_volume = self.test_shape.volume
+        test_volume = self.shared_shape.volume
         self.test_shape.azimuth_placement_angle = [0, 180]
 
         assert self.test_shape.volume == pytest.approx(
@@ -81,7 +88,7 @@ class TestExtrudeSplineShape(unittest.TestCase):
         """Creates an ExtrudeSplineShape with extrude_both = True and False and checks
         that the volumes are correct."""
 
-        test_volume_extrude_both = self.test_shape.volume
+        test_volume_extrude_both = self.shared_shape.volume
         self.test_shape.extrude_both = False
         assert self.test_shape.volume == pytest.approx(
             test_volume_extrude_both)
@@ -90,22 +97,21 @@ class TestExtrudeSplineShape(unittest.TestCase):
         """Exports and stp file with mode = solid and wire and checks
         that the outputs exist and relative file sizes are correct."""
 
-        os.system("rm test_solid.stp test_solid2.stp test_wire.stp")
-
-        self.test_shape.export_stp('test_solid.stp', mode='solid')
-        self.test_shape.export_stp('test_solid2.stp')
-        self.test_shape.export_stp('test_wire.stp', mode='wire')
+        with TemporaryDirectory() as tmp_dir:
+            test_solid = Path(tmp_dir) / "test_solid.stp"
+            test_solid2 = Path(tmp_dir) / "test_solid2.stp"
+            test_wire = Path(tmp_dir) / "test_wire.stp"
 
-        assert Path("test_solid.stp").exists() is True
-        assert Path("test_solid2.stp").exists() is True
-        assert Path("test_wire.stp").exists() is True
+            self.shared_shape.export_stp(str(test_solid), mode='solid')
+            self.shared_shape.export_stp(str(test_solid2))
+            self.shared_shape.export_stp(str(test_wire), mode='wire')
 
-        assert Path("test_solid.stp").stat().st_size == \
-            Path("test_solid2.stp").stat().st_size
-        assert Path("test_wire.stp").stat().st_size < \
-            Path("test_solid2.stp").stat().st_size
+            assert test_solid.exists() is True
+            assert test_solid2.exists() is True
+            assert test_wire.exists() is True
 
-        os.system("rm test_solid.stp test_solid2.stp test_wire.stp")
+            assert test_solid.stat().st_size == test_solid2.stat().st_size
+            assert test_wire.stat().st_size < test_solid2.stat().st_size
 
     def test_incorrect_points_input(self):
         """Checks that an error is raised when the points are input with the
@@ -1,7 +1,7 @@
 
-import os
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 import pytest
 from paramak import ExtrudeStraightShape
@@ -104,22 +104,21 @@ class TestExtrudeStraightShape(unittest.TestCase):
         """Exports and stp file with mode = solid and wire and checks
         that the outputs exist and relative file sizes are correct."""
 
-        os.system("rm test_solid.stp test_solid2.stp test_wire.stp")
+        with TemporaryDirectory() as tmp_dir:
+            test_solid = Path(tmp_dir) / "test_solid.stp"
+            test_solid2 = Path(tmp_dir) / "test_solid2.stp"
+            test_wire = Path(tmp_dir) / "test_wire.stp"
 
-        self.test_shape.export_stp('test_solid.stp', mode='solid')
-        self.test_shape.export_stp('test_solid2.stp')
-        self.test_shape.export_stp('test_wire.stp', mode='wire')
+            self.test_shape.export_stp(str(test_solid), mode='solid')
+            self.test_shape.export_stp(str(test_solid2))
+            self.test_shape.export_stp(str(test_wire), mode='wire')
 
-        assert Path("test_solid.stp").exists() is True
-        assert Path("test_solid2.stp").exists() is True
-        assert Path("test_wire.stp").exists() is True
+            assert test_solid.exists() is True
+            assert test_solid2.exists() is True
+            assert test_wire.exists() is True
 
-        assert Path("test_solid.stp").stat().st_size == \
-            Path("test_solid2.stp").stat().st_size
-        assert Path("test_wire.stp").stat().st_size < \
-            Path("test_solid2.stp").stat().st_size
-
-        os.system("rm test_solid.stp test_solid2.stp test_wire.stp")
+            assert test_solid.stat().st_size == test_solid2.stat().st_size
+            assert test_wire.stat().st_size < test_solid2.stat().st_size
 
     def test_incorrect_points_input(self):
         """Checks that an error is raised when the points are input with the
@@ -142,13 +141,14 @@ class TestExtrudeStraightShape(unittest.TestCase):
         """Checks that all the workplanes produce an html file when using the
         export_html method and that the axis have the correct labels"""
 
-        os.system("rm *.html")
-        for workplane in ["XY", "YZ", "XZ", "YX", "ZY", "ZX"]:
-            self.test_shape.workplane = workplane
-            fig = self.test_shape.export_html(workplane + ".html")
-            assert Path(workplane + ".html").exists() is True
-            assert fig.layout.xaxis.title['text'] == workplane[0]
-            assert fig.layout.yaxis.title['text'] == workplane[1]
+        with TemporaryDirectory() as tmp_dir:
+            for workplane in ["XY", "YZ", "XZ", "YX", "ZY", "ZX"]:
+                self.test_shape.workplane = workplane
+                filename = Path(tmp_dir) / (workplane + ".html")
+                fig = self.test_shape.export_html(str(filename))
+                assert filename.exists() is True
+                assert fig.layout.xaxis.title['text'] == workplane[0]
+                assert fig.layout.yaxis.title['text'] == workplane[1]
 
 
 if __name__ == "__main__":
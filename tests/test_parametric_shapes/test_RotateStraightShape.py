@@ -1,32 +1,43 @@
 
-import math
 import os
+import math
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
+import numpy as np
 import pytest
 from paramak import RotateStraightShape
 
 
 class TestRotateStraightShape(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # shared by the tests that do not change the shape so that its solid
+        # is only built once, tests that change the shape use self.test_shape
+        cls.shared_shape = RotateStraightShape(
+            points=[(0, 0), (0, 20), (20, 20), (20, 0)]
+        )
+
     def setUp(self):
         self.test_shape = RotateStraightShape(
             points=[(0, 0), (0, 20), (20, 20), (20, 0)]
         )
 
-    def test_largest_dimension(self):
-        """Checks that the largest_dimension is correct."""
-
-        assert self.test_shape.largest_dimension == 20
-
     def test_default_parameters(self):
         """Checks that the default parameters of a RotateStraightShape are correct."""
 
-        assert self.test_shape.rotation_angle == 360
-        assert self.test_shape.stp_filename == "RotateStraightShape.stp"
-        assert self.test_shape.stl_filename == "RotateStraightShape.stl"
-        assert self.test_shape.azimuth_placement_angle == 0
+        expected_values = {
+            "rotation_angle": 360,
+            "stp_filename": "RotateStraightShape.stp",
+            "stl_filename": "RotateStraightShape.stl",
+            "azimuth_placement_angle": 0,
+            "largest_dimension": 20,
+        }
+        for attribute, expected in expected_values.items():
+            with self.subTest(attribute=attribute):
+                assert getattr(self.shared_shape, attribute) == expected
 
     def test_rotation_angle_getting_setting(self):
         """Checks that the rotation_angle of a RotateStraightShape can be changed."""
@@ -38,8 +49,9 @@ class TestRotateStraightShape(unittest.TestCase):
     def test_absolute_shape_volume(self):
         """Creates a RotateStraightShape and checks that its volume is correct."""
 
-        assert self.test_shape.solid is not None
-        assert self.test_shape.volume == pytest.approx(math.pi * (20**2) * 20)
+        assert self.shared_shape.solid is not None
+        assert self.shared_shape.volume == pytest.approx(
+            math.pi * (20**2) * 20)
 
     def test_relative_shape_volume(self):
         """Creates two RotateStraightShapes and checks that their relative volumes
@@ -74,140 +86,150 @@ class TestRotateStraightShape(unittest.TestCase):
         """Creates RotateStraightShapes and checks that the areas of each face
         are correct."""
 
-        assert self.test_shape.area == pytest.approx(
-            (math.pi * (20**2) * 2) + (math.pi * (20 * 2) * 20))
-        assert len(self.test_shape.areas) == 3
-        assert self.test_shape.areas.count(
-            pytest.approx(math.pi * (20**2))) == 2
-        assert self.test_shape.areas.count(
-            pytest.approx(math.pi * (20 * 2) * 20)) == 1
+        expected_areas = [
+            math.pi * (20**2),
+            math.pi * (20**2),
+            math.pi * (20 * 2) * 20]
+        assert self.test_shape.area == pytest.approx(sum(expected_areas))
+        np.testing.assert_allclose(
+            sorted(self.test_shape.areas), sorted(expected_areas), rtol=1e-6)
 
         self.test_shape.rotation_angle = 180
-        assert self.test_shape.area == pytest.approx(
-            ((math.pi * (20**2) / 2) * 2) + (20 * 40) + (math.pi * (20 * 2) * 20 / 2))
-        assert len(self.test_shape.areas) == 4
-        assert self.test_shape.areas.count(
-            pytest.approx(math.pi * (20**2) / 2)) == 2
-        assert self.test_shape.areas.count(pytest.approx(20 * 40)) == 1
-        assert self.test_shape.areas.count(
-            pytest.approx((math.pi * (20 * 2) * 20) / 2)) == 1
+        expected_areas = [
+            math.pi * (20**2) / 2,
+            math.pi * (20**2) / 2,
+            20 * 40,
+            math.pi * (20 * 2) * 20 / 2]
+        assert self.test_shape.area == pytest.approx(sum(expected_areas))
+        np.testing.assert_allclose(
+            sorted(self.test_shape.areas), sorted(expected_areas), rtol=1e-6)
 
         test_shape = RotateStraightShape(
             points=[(50, 0), (50, 50), (70, 50), (70, 0)],
         )
 
-        assert test_shape.area == pytest.approx(
-            (((math.pi * (70**2)) - (math.pi * (50**2))) * 2) + (math.pi * (50 * 2) * 50) + (math.pi * (70 * 2) * 50))
-        assert len(test_shape.areas) == 4
-        assert test_shape.areas.count(pytest.approx(
-            (math.pi * (70**2)) - (math.pi * (50**2)))) == 2
-        assert test_shape.areas.count(
-            pytest.approx(math.pi * (50 * 2) * 50)) == 1
-        assert test_shape.areas.count(
-            pytest.approx(math.pi * (70 * 2) * 50)) == 1
+        expected_areas = [
+            (math.pi * (70**2)) - (math.pi * (50**2)),
+            (math.pi * (70**2)) - (math.pi * (50**2)),
+            math.pi * (50 * 2) * 50,
+            math.pi * (70 * 2) * 50]
+        assert test_shape.area == pytest.approx(sum(expected_areas))
+        np.testing.assert_allclose(
+            sorted(test_shape.areas), sorted(expected_areas), rtol=1e-6)
 
         test_shape.rotation_angle = 180
-        assert test_shape.area == pytest.approx((20 * 50 * 2) + ((((math.pi * (70**2)) / 2) - (
-            (math.pi * (50**2)) / 2)) * 2) + ((math.pi * (50 * 2) * 50) / 2) + ((math.pi * (70 * 2) * 50) / 2))
-        assert len(test_shape.areas) == 6
-        assert test_shape.areas.count(pytest.approx(20 * 50)) == 2
-        assert test_shape.areas.count(pytest.approx(
-            ((math.pi * (70**2)) / 2) - ((math.pi * (50**2)) / 2))) == 2
-        assert test_shape.areas.count(
-            pytest.approx(math.pi * (50 * 2) * 50 / 2)) == 1
-        assert test_shape.areas.count(
-            pytest.approx(math.pi * (70 * 2) * 50 / 2)) == 1
+        expected_areas = [
+            20 * 50,
+            20 * 50,
+            ((math.pi * (70**2)) / 2) - ((math.pi * (50**2)) / 2),
+            ((math.pi * (70**2)) / 2) - ((math.pi * (50**2)) / 2),
+            math.pi * (50 * 2) * 50 / 2,
+            math.pi * (70 * 2) * 50 / 2]
+        assert test_shape.area == pytest.approx(sum(expected_areas))
+        np.testing.assert_allclose(
+            sorted(test_shape.areas), sorted(expected_areas), rtol=1e-6)
 
     def test_export_stp_extension(self):
         """Creates a RotateStraightShape and checks that a stp file of the
         shape can be exported with the correct suffix using the export_stp
         method."""
 
-        os.system("rm filename.stp filename.step")
-        self.test_shape.export_stp("filename.stp")
-        self.test_shape.export_stp("filename.step")
-        assert Path("filename.stp").exists() is True
-        assert Path("filename.step").exists() is True
-        os.system("rm filename.stp filename.step")
-        self.test_shape.export_stp("filename")
-        assert Path("filename.stp").exists() is True
-        os.system("rm filename.stp")
-        self.test_shape.export_stp()
-        assert Path("RotateStraightShape.stp").exists() is True
-        os.system("rm RotateStraightShape.stp")
+        with TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            self.shared_shape.export_stp(str(tmp_path / "filename.stp"))
+            self.shared_shape.export_stp(str(tmp_path / "filename.step"))
+            assert (tmp_path / "filename.stp").exists() is True
+            assert (tmp_path / "filename.step").exists() is True
+
+        with TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            self.shared_shape.export_stp(str(tmp_path / "filename"))
+            assert (tmp_path / "filename.stp").exists() is True
+
+        # the default filename is written to the working directory
+        cwd = os.getcwd()
+        with TemporaryDirectory() as tmp_dir:
+            os.chdir(tmp_dir)
+            try:
+                self.shared_shape.export_stp()
+                assert Path("RotateStraightShape.stp").exists() is True
+            finally:
+                os.chdir(cwd)
 
     def test_export_stp_extension_in_cm(self):
         """Creates a RotateStraightShape and checks that a stp file of the
         shape can be exported with the correct suffix using the export_stp
         method."""
 
-        os.system("rm filename.stp filename.step")
-        self.test_shape.export_stp("filename.stp", units='cm')
-        self.test_shape.export_stp("filename.step", units='cm')
-        assert Path("filename.stp").exists() is True
-        assert Path("filename.step").exists() is True
-        os.system("rm filename.stp filename.step")
-        self.test_shape.export_stp("filename", units='cm')
-        assert Path("filename.stp").exists() is True
-        os.system("rm filename.stp")
-        self.test_shape.export_stp(units='cm')
-        assert Path("RotateStraightShape.stp").exists() is True
-        os.system("rm RotateStraightShape.stp")
+        with TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            self.shared_shape.export_stp(
+                str(tmp_path / "filename.stp"), units='cm')
+            self.shared_shape.export_stp(
+                str(tmp_path / "filename.step"), units='cm')
+            assert (tmp_path / "filename.stp").exists() is True
+            assert (tmp_path / "filename.step").exists() is True
+
+        with TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            self.shared_shape.export_stp(
+                str(tmp_path / "filename"), units='cm')
+            assert (tmp_path / "filename.stp").exists() is True
+
+        # the default filename is written to the working directory
+        cwd = os.getcwd()
+        with TemporaryDirectory() as tmp_dir:
+            os.chdir(tmp_dir)
+            try:
+                self.shared_shape.export_stp(units='cm')
+                assert Path("RotateStraightShape.stp").exists() is True
+            finally:
+                os.chdir(cwd)
 
     def test_export_stl(self):
         """Creates a RotateStraightShape and checks that a stl file of the
         shape can be exported with the correct suffix using the export_stl
         method."""
 
-        os.system("rm filename.stl")
-        self.test_shape.export_stl("filename.stl")
-        assert Path("filename.stl").exists() is True
-        os.system("rm filename.stl")
-        self.test_shape.export_stl("filename")
-        assert Path("filename.stl").exists() is True
-        os.system("rm filename.stl")
+        for filename in ["filename.stl", "filename"]:
+            with TemporaryDirectory() as tmp_dir:
+                self.shared_shape.export_stl(str(Path(tmp_dir) / filename))
+                assert (Path(tmp_dir) / "filename.stl").exists() is True
 
     def test_export_svg(self):
         """Creates a RotateStraightShape and checks that a svg file of the
         shape can be exported with the correct suffix using the export_svg
         method."""
 
-        os.system("rm filename.svg")
-        self.test_shape.export_svg("filename.svg")
-        assert Path("filename.svg").exists() is True
-        os.system("rm filename.svg")
-        self.test_shape.export_svg("filename")
-        assert Path("filename.svg").exists() is True
-        os.system("rm filename.svg")
+        for filename in ["filename.svg", "filename"]:
+            with TemporaryDirectory() as tmp_dir:
+                self.shared_shape.export_svg(str(Path(tmp_dir) / filename))
+                assert (Path(tmp_dir) / "filename.svg").exists() is True
 
     def test_export_svg_options(self):
         """Creates a RotateStraightShape and checks that a svg file of the
         shape can be exported with the various different export options"""
 
-        os.system("rm *.svg")
-        self.test_shape.export_svg("width.svg", width=900)
-        assert Path("width.svg").exists() is True
-        self.test_shape.export_svg("height.svg", height=900)
-        assert Path("height.svg").exists() is True
-        self.test_shape.export_svg("marginLeft.svg", marginLeft=110)
-        assert Path("marginLeft.svg").exists() is True
-        self.test_shape.export_svg("marginTop.svg", marginTop=110)
-        assert Path("marginTop.svg").exists() is True
-        self.test_shape.export_svg("showAxes.svg", showAxes=True)
-        assert Path("showAxes.svg").exists() is True
-        self.test_shape.export_svg(
-            "projectionDir.svg", projectionDir=(-1, -1, -1))
-        assert Path("projectionDir.svg").exists() is True
-        self.test_shape.export_svg("strokeColor.svg", strokeColor=(42, 42, 42))
-        assert Path("strokeColor.svg").exists() is True
-        self.test_shape.export_svg("hiddenColor.svg", hiddenColor=(42, 42, 42))
-        assert Path("hiddenColor.svg").exists() is True
-        self.test_shape.export_svg("showHidden.svg", showHidden=False)
-        assert Path("showHidden.svg").exists() is True
-        self.test_shape.export_svg("strokeWidth1.svg", strokeWidth=None)
-        assert Path("strokeWidth1.svg").exists() is True
-        self.test_shape.export_svg("strokeWidth2.svg", strokeWidth=10)
-        assert Path("strokeWidth2.svg").exists() is True
+        svg_options = {
+            "width": {"width": 900},
+            "height": {"height": 900},
+            "marginLeft": {"marginLeft": 110},
+            "marginTop": {"marginTop": 110},
+            "showAxes": {"showAxes": True},
+            "projectionDir": {"projectionDir": (-1, -1, -1)},
+            "strokeColor": {"strokeColor": (42, 42, 42)},
+            "hiddenColor": {"hiddenColor": (42, 42, 42)},
+            "showHidden": {"showHidden": False},
+            "strokeWidth1": {"strokeWidth": None},
+            "strokeWidth2": {"strokeWidth": 10},
+        }
+
+        with TemporaryDirectory() as tmp_dir:
+            for name, kwargs in svg_options.items():
+                with self.subTest(name=name):
+                    filepath = Path(tmp_dir) / (name + ".svg")
+                    self.shared_shape.export_svg(str(filepath), **kwargs)
+                    assert filepath.exists() is True
 
     def test_cut_volume(self):
         """Creates a RotateStraightShape with another RotateStraightShape
@@ -215,7 +237,7 @@ class TestRotateStraightShape(unittest.TestCase):
 
         shape_with_cut = RotateStraightShape(
             points=[(0, -5), (0, 25), (25, 25), (25, -5)],
-            cut=self.test_shape
+            cut=self.shared_shape
         )
 
         assert shape_with_cut.volume == pytest.approx(
@@ -273,22 +295,21 @@ class TestRotateStraightShape(unittest.TestCase):
         """Exports and stp file with mode = solid and wire and checks
         that the outputs exist and relative file sizes are correct."""
 
-        os.system("rm test_solid.stp test_solid2.stp test_wire.stp")
-
-        self.test_shape.export_stp('test_solid.stp', mode='solid')
-        self.test_shape.export_stp('test_solid2.stp')
-        self.test_shape.export_stp('test_wire.stp', mode='wire')
+        with TemporaryDirectory() as tmp_dir:
+            test_solid = Path(tmp_dir) / "test_solid.stp"
+            test_solid2 = Path(tmp_dir) / "test_solid2.stp"
+            test_wire = Path(tmp_dir) / "test_wire.stp"
 
-        assert Path("test_solid.stp").exists() is True
-        assert Path("test_solid2.stp").exists() is True
-        assert Path("test_wire.stp").exists() is True
+            self.shared_shape.export_stp(str(test_solid), mode='solid')
+            self.shared_shape.export_stp(str(test_solid2))
+            self.shared_shape.export_stp(str(test_wire), mode='wire')
 
-        assert Path("test_solid.stp").stat().st_size == \
-            Path("test_solid2.stp").stat().st_size
-        assert Path("test_wire.stp").stat().st_size < \
-            Path("test_solid2.stp").stat().st_size
+            assert test_solid.exists() is True
+            assert test_solid2.exists() is True
+            assert test_wire.exists() is True
 
-        os.system("rm test_solid.stp test_solid2.stp test_wire.stp")
+            assert test_solid.stat().st_size == test_solid2.stat().st_size
+            assert test_wire.stat().st_size < test_solid2.stat().st_size
 
     def test_export_stp_with_incorrect_args(self):
         """Checks errors are raised when incorrect arguments are used
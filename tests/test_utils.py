@@ -1,13 +1,26 @@
 
+import math
 import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from cadquery.cq import Workplane
 
 import numpy as np
 import paramak
 from paramak.utils import (EdgeLengthSelector, FaceAreaSelector,
+                           add_thickness, coefficients_of_line_from_points,
                            find_center_point_of_circle, plotly_trace,
-                           extract_points_from_edges, facet_wire)
+                           extract_points_from_edges, facet_wire, _replace)
 import plotly.graph_objects as go
+import pytest
+
+
+def _make_box(x_min, y_min, x_max, y_max, **kwargs):
+    """Makes a box shaped ExtrudeStraightShape with a depth of 20"""
+    return paramak.ExtrudeStraightShape(
+        points=[(x_min, y_min), (x_min, y_max), (x_max, y_max),
+                (x_max, y_min)],
+        distance=20, **kwargs)
 
 
 class TestUtilityFunctions(unittest.TestCase):
@@ -50,6 +63,37 @@ class TestUtilityFunctions(unittest.TestCase):
             assert isinstance(point[1], float)
             assert isinstance(point[2], float)
 
+    def test_extract_points_from_edges_as_array(self):
+        """Extracts points from edges as a numpy array and checks it matches
+        the list of tuples returned by default"""
+
+        test_shape = paramak.ExtrudeStraightShape(
+            points=[(1, 1), (3, 1), (4, 2)],
+            distance=6,
+            workplane='YZ')
+
+        edges = facet_wire(wire=test_shape.wire)
+
+        points = extract_points_from_edges(edges=edges, view_plane='RZ')
+        points_array = extract_points_from_edges(
+            edges=edges, view_plane='RZ', as_array=True)
+
+        assert isinstance(points_array, np.ndarray)
+        assert points_array.shape == (6, 2)
+        assert points_array.tolist() == [list(point) for point in points]
+
+    def test_trace_creation_from_array(self):
+        """Creates plotly traces from numpy arrays and checks the types
+        returned"""
+
+        trace = plotly_trace(points=np.array([(0, 20), (20, 0), (0, -20)]))
+        assert isinstance(trace, go.Scatter)
+        assert len(trace.text) == 3
+
+        trace = plotly_trace(
+            points=np.array([(0, 20, 0), (20, 0, 10), (0, -20, -10)]))
+        assert isinstance(trace, go.Scatter3d)
+
     def test_trace_creation(self):
         """Creates a plotly trace and checks the type returned"""
         trace = plotly_trace(
@@ -78,6 +122,65 @@ class TestUtilityFunctions(unittest.TestCase):
 
         assert isinstance(trace, go.Scatter3d)
 
+    def test_trace_creation_with_connection_types(self):
+        """Creates a trace from points that carry a connection type, as
+        Shape.points does, and checks the coordinates stay numbers"""
+        trace = plotly_trace(
+            points=[
+                (0, 20, "straight"),
+                (20.5, 0, "spline"),
+            ]
+        )
+
+        assert isinstance(trace, go.Scatter3d)
+        assert list(trace.x) == [0, 20.5]
+        assert list(trace.y) == [20, 0]
+
+    def test_trace_creation_with_empty_and_mixed_points(self):
+        """Creates traces from an empty list of points and from a mixture of
+        2 and 3 entry points and checks the traces returned"""
+        trace = plotly_trace(points=[])
+        assert isinstance(trace, go.Scatter3d)
+        assert len(trace.x) == 0
+
+        trace = plotly_trace(points=[(0, 20), (20, 0, 5), (0, -20)])
+        assert isinstance(trace, go.Scatter)
+        assert list(trace.x) == [0, 20, 0]
+        assert list(trace.y) == [20, 0, -20]
+        assert len(trace.text) == 3
+        assert "z= 5" in trace.text[1]
+
+    def test_cut_with_several_shapes_volume(self):
+        """Cuts a shape with a list of shapes and checks the volume matches
+        cutting with each shape in turn."""
+
+        cutter_1 = _make_box(0, 0, 10, 10)
+        cutter_2 = _make_box(20, 20, 30, 30)
+        test_shape = _make_box(0, 0, 40, 40, cut=[cutter_1, cutter_2])
+
+        sequential_solid = _make_box(0, 0, 40, 40).solid.cut(
+            cutter_1.solid).cut(cutter_2.solid)
+
+        assert test_shape.volume == pytest.approx(
+            (40 * 40 * 20) - 2 * (10 * 10 * 20))
+        assert test_shape.volume == pytest.approx(
+            sequential_solid.val().Volume())
+
+    def test_union_with_several_shapes_volume(self):
+        """Unions a shape with a list of overlapping shapes and checks the
+        volume matches joining each shape in turn."""
+
+        joiner_1 = _make_box(10, 0, 30, 10)
+        joiner_2 = _make_box(10, 10, 30, 20)
+        test_shape = _make_box(0, 0, 20, 20, union=[joiner_1, joiner_2])
+
+        sequential_solid = _make_box(0, 0, 20, 20).solid.union(
+            joiner_1.solid).union(joiner_2.solid)
+
+        assert test_shape.volume == pytest.approx(30 * 20 * 20)
+        assert test_shape.volume == pytest.approx(
+            sequential_solid.val().Volume())
+
     def test_find_center_point_of_circle(self):
         """passes three points on a circle to the function and checks that the
         radius and center of the circle is calculated correctly"""
@@ -127,3 +230,63 @@ class TestUtilityFunctions(unittest.TestCase):
         assert find_center_point_of_circle(
             point_1, point_2, point_3) == (
             None, np.inf)
+
+    def test_add_thickness(self):
+        """Offsets a line and a closed loop and checks the outer points
+        against values worked out by hand"""
+
+        # a 3-4-5 triangle so the unit normals are multiples of (3, 4) / 5
+        x_outer, y_outer = add_thickness([0, 4, 0], [0, 3, 6], 5)
+        assert x_outer == pytest.approx([-3, 7])
+        assert y_outer == pytest.approx([4, 7])
+
+        # the normal points the other way when x decreases along the line
+        x_outer, y_outer = add_thickness([0, 4, 8], [0, 3, 6], 5)
+        assert x_outer == pytest.approx([-3, 1])
+        assert y_outer == pytest.approx([4, 7])
+        x_outer, y_outer = add_thickness([8, 4, 0], [6, 3, 0], 5)
+        assert x_outer == pytest.approx([11, 7])
+        assert y_outer == pytest.approx([2, -1])
+
+        # a closed rectangular loop with infinite gradients on the vertical
+        # sides, where the last point keeps the flipped normal of the point
+        # before it
+        x_outer, y_outer = add_thickness(
+            [0, 3, 3, 0, 0], [0, 0, 4, 4, 0], 2,
+            dy_dx=[0, float("inf"), 0, float("-inf"), 0])
+        assert x_outer == pytest.approx([0, 1, 3, 2, 0])
+        assert y_outer == pytest.approx([2, 0, 2, 4, -2])
+
+    def test_coefficients_of_line_from_points(self):
+        """Checks the slope and intercept of sloped, horizontal and vertical
+        lines"""
+
+        assert coefficients_of_line_from_points((1, 5), (3, 9)) == (2, 3)
+        assert coefficients_of_line_from_points((3, 9), (1, 5)) == (2, 3)
+        assert coefficients_of_line_from_points((-2, 4), (6, 4)) == (0, 4)
+
+        # a vertical line has no finite slope or intercept
+        m, c = coefficients_of_line_from_points((2, 0), (2, 7))
+        assert m == float("inf")
+        assert math.isnan(c)
+
+    def test_replace_across_chunk_boundaries(self):
+        """Replaces a pattern in a file read a few bytes at a time so that
+        matches straddle the chunk boundaries, and checks the result is the
+        same as replacing the whole string at once"""
+
+        contents = (
+            "SI_UNIT(.MILLI.,.METRE.)SI_UNIT(.MILLI.,.METRE.) "
+            "#1=SI_UNIT(.MILLI.,.METRE.);\n#2=LENGTH;\n"
+            "SI_UNIT(.MILLI.,.METRE.)")
+        pattern = "SI_UNIT(.MILLI.,.METRE.)"
+        subst = "SI_UNIT(.CENTI.,.METRE.)"
+
+        for chunk_size in [1, 2, 3, 5, 7, len(pattern), 1000]:
+            with self.subTest(chunk_size=chunk_size):
+                with TemporaryDirectory() as tmp_dir:
+                    filename = Path(tmp_dir) / "test.stp"
+                    filename.write_text(contents)
+                    _replace(filename, pattern, subst, chunk_size=chunk_size)
+                    assert filename.read_text() == contents.replace(
+                        pattern, subst)